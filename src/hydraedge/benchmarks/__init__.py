@@ -0,0 +1 @@
+"""HydraEdge micro-benchmark suites (see ``hydra-bench-kernel``)."""
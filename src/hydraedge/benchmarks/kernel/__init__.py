@@ -0,0 +1,15 @@
+"""
+Kernel micro-benchmarks.
+
+``cases``  – one factory per timed operation
+``runner`` – timing loop, JSON results and baseline comparison
+
+Run via the console script.  Timings are machine specific, so no baseline
+is shipped: record one on the target machine, then compare against it::
+
+    hydra-bench-kernel --save-baseline kernel_baseline.json
+    hydra-bench-kernel --out bench.json --baseline kernel_baseline.json
+"""
+from .runner import compare, run_suite
+
+__all__ = ["compare", "run_suite"]
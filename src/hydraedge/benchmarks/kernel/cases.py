@@ -0,0 +1,117 @@
+"""
+Benchmark cases for ``hydraedge.kernel``.
+
+Each case is a factory ``make(dim, batch, rng, cache_dir) -> callable``:
+all inputs are built up front, so the returned zero-argument callable
+times only the operation itself.  For ops with a scalar entry point
+(bind, unbind, gamma_gate, slot_sum, checks.forward) batch size 1 times
+that entry point and larger batches the vectorised one; the remaining
+ops run the same batched call on a one-row batch.
+
+``slot_sum`` and ``checks.forward`` time the public functions of
+``hydraedge.kernel.checks`` at the encoder's dimension ``checks.D``.
+Those are bound to the module-level role matrix and kernel, so every
+other dimension falls back to an equivalent ``HybridKernel`` of that size.
+"""
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Callable
+
+import numpy as np
+
+from hydraedge.kernel import bind_ops, bundles, jl, parallel
+
+Case = Callable[[int, int, np.random.Generator, Path], Callable[[], object]]
+
+_JL_DIM = 512
+_N_ROLES = 11
+
+
+def _hv(rng: np.random.Generator, *shape: int) -> np.ndarray:
+    return rng.choice(np.array([-1, 1], dtype=np.int8), size=shape)
+
+
+def _bind(dim, batch, rng, cache_dir):
+    role, F = _hv(rng, dim), _hv(rng, batch, dim)
+    if batch == 1:
+        return lambda: bind_ops.bind(role, F[0])
+    return lambda: bind_ops.bind_many(role, F)
+
+
+def _bind_plan(dim, batch, rng, cache_dir):
+    plan, F = bind_ops.BindPlan(_hv(rng, dim)), _hv(rng, batch, dim)
+    out = np.empty_like(F)
+    return lambda: plan.bind(F, out=out)
+
+
+def _parallel_bind_plan(dim, batch, rng, cache_dir):
+    plan, F = bind_ops.BindPlan(_hv(rng, dim)), _hv(rng, batch, dim)
+    out = np.empty_like(F)
+    return lambda: parallel.plan_bind(plan, F, out=out)
+
+
+def _unbind(dim, batch, rng, cache_dir):
+    role, B = _hv(rng, dim), _hv(rng, batch, dim)
+    if batch == 1:
+        return lambda: bind_ops.unbind(B[0], role)
+    return lambda: bind_ops.unbind_many(B, role)
+
+
+def _majority_vote(dim, batch, rng, cache_dir):
+    vecs = list(_hv(rng, max(batch, 2), dim))
+    return lambda: bundles.majority_vote(vecs)
+
+
+def _gamma_gate(dim, batch, rng, cache_dir):
+    B, F = _hv(rng, batch, dim), _hv(rng, batch, dim)
+    if batch == 1:
+        return lambda: bundles.gamma_gate(bound=B[0], filler=F[0], gamma=0.3)
+    gammas = rng.random(batch)
+    return lambda: bundles.gamma_gate_many(B, F, gammas)
+
+
+def _jl_project(dim, batch, rng, cache_dir):
+    E = _hv(rng, batch, dim)
+    jl.project(E[:1], dim=min(_JL_DIM, dim), cache_dir=cache_dir)   # build + cache once
+    return lambda: jl.project(E, dim=min(_JL_DIM, dim), cache_dir=cache_dir)
+
+
+def _kernel(dim, rng):
+    from hydraedge.kernel.checks import HybridKernel
+    k = HybridKernel(dim, role_matrix=_hv(rng, _N_ROLES, dim))
+    k.U_S[:] = rng.normal(size=k.U_S.shape)
+    return k
+
+
+def _slot_sum(dim, batch, rng, cache_dir):
+    from hydraedge.kernel import checks
+    E = _hv(rng, batch, dim)
+    if dim == checks.D:
+        if batch == 1:
+            return lambda: checks.slot_sum(E[0])
+        return lambda: checks.slot_sum_many(E)
+    k = _kernel(dim, rng)
+    return lambda: k.slot_sums(E)
+
+
+def _checks_forward(dim, batch, rng, cache_dir):
+    from hydraedge.kernel import checks
+    src, E = _hv(rng, dim), _hv(rng, batch, dim)
+    k = checks if dim == checks.D else _kernel(dim, rng)
+    if batch == 1:
+        return lambda: k.forward(src, E[0])
+    return lambda: k.forward_many(src, E)
+
+
+CASES: dict[str, Case] = {
+    "bind": _bind,
+    "bind_plan": _bind_plan,
+    "parallel.bind_plan": _parallel_bind_plan,
+    "unbind": _unbind,
+    "majority_vote": _majority_vote,
+    "gamma_gate": _gamma_gate,
+    "jl.project": _jl_project,
+    "slot_sum": _slot_sum,
+    "checks.forward": _checks_forward,
+}
@@ -0,0 +1,109 @@
+"""
+Timing loop, JSON output and baseline regression check for the kernel
+benchmarks.
+
+Result file layout::
+
+    {"meta":    {"python": …, "numpy": …, "platform": …, "created": …},
+     "results": [{"op": "bind", "dim": 4096, "batch": 64,
+                  "repeat": 5, "min_s": …, "median_s": …}, …]}
+"""
+from __future__ import annotations
+
+import json
+import platform
+import statistics
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Iterable, Mapping
+
+import numpy as np
+
+from .cases import CASES
+
+DIMS = (1024, 4096, 16384, 65536)
+BATCHES = (1, 64, 1024)
+DEFAULT_THRESHOLD = 0.10          # +10 % median time ⇒ regression
+
+
+def _time(fn, repeat: int) -> list[float]:
+    fn()                                              # warm-up
+    samples = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - t0)
+    return samples
+
+
+def run_suite(ops: Iterable[str] | None = None, dims: Iterable[int] = DIMS,
+              batches: Iterable[int] = BATCHES, repeat: int = 5,
+              seed: int = 0) -> dict:
+    """Time every (op, dim, batch) combination and return the result dict."""
+    ops = list(ops or CASES)
+    unknown = set(ops) - set(CASES)
+    if unknown:
+        raise ValueError(f"unknown benchmark ops: {sorted(unknown)}")
+
+    results = []
+    with tempfile.TemporaryDirectory(prefix="hydra-bench-") as cache_dir:
+        for op in ops:
+            for dim in dims:
+                for batch in batches:
+                    rng = np.random.default_rng(seed)
+                    fn = CASES[op](dim, batch, rng, Path(cache_dir))
+                    samples = _time(fn, repeat)
+                    results.append({
+                        "op": op, "dim": dim, "batch": batch, "repeat": repeat,
+                        "min_s": min(samples),
+                        "median_s": statistics.median(samples),
+                    })
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        },
+        "results": results,
+    }
+
+
+def _key(r: Mapping) -> tuple:
+    return r["op"], r["dim"], r["batch"]
+
+
+def compare(current: dict, baseline: dict, threshold: float = DEFAULT_THRESHOLD,
+            per_op: Mapping[str, float] | None = None) -> list[dict]:
+    """
+    Entries whose median time grew by more than the allowed fraction.
+
+    *per_op* overrides *threshold* for individual ops (e.g. noisy ones).
+    Combinations missing from either side are ignored.
+    """
+    per_op = per_op or {}
+    base = {_key(r): r for r in baseline["results"]}
+    regressions = []
+    for r in current["results"]:
+        b = base.get(_key(r))
+        if b is None or b["median_s"] <= 0:
+            continue
+        ratio = r["median_s"] / b["median_s"]
+        limit = per_op.get(r["op"], threshold)
+        if ratio > 1.0 + limit:
+            regressions.append({"op": r["op"], "dim": r["dim"], "batch": r["batch"],
+                                "baseline_s": b["median_s"], "current_s": r["median_s"],
+                                "ratio": ratio, "threshold": limit})
+    return regressions
+
+
+def load(path: str | Path) -> dict:
+    return json.loads(Path(path).read_text("utf-8"))
+
+
+def save(result: dict, path: str | Path) -> None:
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(result, indent=2), "utf-8")
@@ -14,6 +14,11 @@ Public API
 encoder.chv_math
 encoder.chv_encoder
 encoder.ep0_pre_check
+encoder.ep1_alias_norm … encoder.ep10_faiss_sink   (stages E1 – E10)
+encoder.pipeline
+encoder.role_registry
+encoder.role_vectors
+encoder.w2hv_backend
 # + any future encoder.* modules listed in ``_LAZY_EXPORTS``
 
 Example
@@ -31,6 +36,20 @@ __all__ = [
     "chv_math",
     "chv_encoder",
     "ep0_pre_check",
+    "ep1_alias_norm",
+    "ep2_w2hv_embed",
+    "ep3_role_lookup",
+    "ep4_dir_tag",
+    "ep5_gamma_gate",
+    "ep6_bundle",
+    "ep7_delimiter",
+    "ep8_sign_post",
+    "ep9_qc_digest",
+    "ep10_faiss_sink",
+    "pipeline",
+    "role_registry",
+    "role_vectors",
+    "w2hv_backend",
 ]
 
 _LAZY_EXPORTS: Final[set[str]] = set(__all__)
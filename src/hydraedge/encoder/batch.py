@@ -0,0 +1,142 @@
+# ── hydraedge.encoder.batch ────────────────────────────────────────────────
+"""
+Columnar batch passed between the encoder stages E1 – E10.
+
+A batch holds *N* payloads flattened into *P* (role, filler) pairs – one
+per node × role – stored as parallel NumPy columns, plus the payloads'
+edges as a second set of columns.  Pairs are ordered by record, so every
+record owns one contiguous run ``record_start[i] : record_start[i + 1]``.
+
+Each stage fills in or rewrites a few columns with one vectorised call
+per batch:
+
+  E1 alias_norm  key          → normalised filler keys
+  E2 w2hv_embed  filler_id    → index into ``fillers`` (U, D)
+  E3 role_lookup role_id      → index into the role registry
+  E4 dir_tag     direction    → −1 / 0 / +1 per pair, ``plan_id``
+  E5 gamma_gate  bound        → (P, D) bound (and γ-gated) vectors
+  E6 bundle      counts       → (N, D) per-record vote sums
+  E7 delimiter   counts       += one delimiter per event group
+  E8 sign_post   vectors      → (N, D) int8 CHVs
+  E9 qc_digest   digests, qc, cached rows filled in, ``unique`` / ``alias_of``
+  E10 faiss_sink (hands ``vectors`` / ``ids`` to an index)
+
+Records whose payload digest is already in the E9 cache are marked
+``cached`` and contribute no pairs; their CHV is copied from the cache.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Sequence
+
+import numpy as np
+from numpy.typing import NDArray
+
+__all__ = ["PairBatch", "from_payloads"]
+
+_CHV_NTYPE = "chv"
+
+
+@dataclass
+class PairBatch:
+    """Column store for one batch of payloads (see module docstring)."""
+
+    n_records: int
+    ids: NDArray[np.int64]                      # (N,) record ids
+    record: NDArray[np.int64]                   # (P,) owning record per pair
+    node: NDArray[np.str_]                      # (P,) node id
+    role: NDArray[np.str_]                      # (P,) role string
+    key: NDArray[np.str_]                       # (P,) filler key
+    eid: NDArray[np.str_]                       # (P,) first event id ("" if none)
+    edge_record: NDArray[np.int64]              # (E,)
+    edge_source: NDArray[np.str_]               # (E,)
+    edge_target: NDArray[np.str_]               # (E,)
+    edge_kind: NDArray[np.str_]                 # (E,)
+
+    # filled in by the stages
+    filler_id: NDArray[np.int64] | None = None
+    fillers: NDArray[np.int8] | None = None
+    role_id: NDArray[np.int64] | None = None
+    direction: NDArray[np.int8] | None = None
+    plan_id: NDArray[np.int64] | None = None
+    bound: NDArray[np.int8] | None = None
+    counts: NDArray[np.int32] | None = None
+    vectors: NDArray[np.int8] | None = None
+    digests: list[str] = field(default_factory=list)
+    qc: dict[str, NDArray] = field(default_factory=dict)
+
+    # E9 payload cache / vector dedup – one entry per record
+    cached: NDArray[np.bool_] | None = None       # (N,) CHV comes from the cache
+    cache_rows: NDArray[np.int64] | None = None   # (N,) cache row, −1 on a miss
+    payload_digests: list[str] = field(default_factory=list)
+    unique: NDArray[np.bool_] | None = None       # (N,) first record with its CHV
+    alias_of: NDArray[np.int64] | None = None     # (N,) id of that first record
+
+    _PAIR_COLUMNS = ("record", "node", "role", "key", "eid",
+                     "filler_id", "role_id", "direction", "plan_id", "bound")
+
+    def __len__(self) -> int:
+        return len(self.record)
+
+    @property
+    def record_start(self) -> NDArray[np.int64]:
+        """(N + 1,) offsets of each record's pair run."""
+        return np.searchsorted(self.record, np.arange(self.n_records + 1))
+
+    def keep(self, mask: NDArray[np.bool_]) -> "PairBatch":
+        """Drop the pairs where *mask* is False (all pair columns at once)."""
+        for name in self._PAIR_COLUMNS:
+            col = getattr(self, name)
+            if col is not None:
+                setattr(self, name, col[mask])
+        return self
+
+
+def from_payloads(payloads: Sequence[dict], ids: Sequence[int] | None = None,
+                  skip: NDArray[np.bool_] | None = None) -> PairBatch:
+    """
+    Flatten payloads (already validated by E0) into a :class:`PairBatch`.
+
+    This is the only step that walks the JSON node by node; every later
+    stage works on the resulting columns.  Records flagged in *skip*
+    (cache hits) keep their slot but contribute no pairs or edges.
+    """
+    skip = np.zeros(len(payloads), dtype=bool) if skip is None else np.asarray(skip, dtype=bool)
+    rec, node, role, key, eid = [], [], [], [], []
+    e_rec, e_src, e_tgt, e_kind = [], [], [], []
+    for i, payload in enumerate(payloads):
+        if skip[i]:
+            continue
+        for n in payload.get("nodes", []):
+            if n.get("ntype") == _CHV_NTYPE:
+                continue
+            k = n.get("alias_key") or n["filler"]
+            first_eid = (n.get("eid_set") or [""])[0]
+            for r in n.get("roles", []):
+                rec.append(i)
+                node.append(n["id"])
+                role.append(r)
+                key.append(k)
+                eid.append(first_eid)
+        for e in payload.get("edges", []):
+            e_rec.append(i)
+            e_src.append(e["source"])
+            e_tgt.append(e["target"])
+            e_kind.append(e["kind"])
+
+    n_records = len(payloads)
+    return PairBatch(
+        n_records=n_records,
+        ids=(np.arange(n_records, dtype=np.int64) if ids is None
+             else np.asarray(ids, dtype=np.int64)),
+        record=np.asarray(rec, dtype=np.int64),
+        node=np.asarray(node, dtype=np.str_),
+        role=np.asarray(role, dtype=np.str_),
+        key=np.asarray(key, dtype=np.str_),
+        eid=np.asarray(eid, dtype=np.str_),
+        edge_record=np.asarray(e_rec, dtype=np.int64),
+        edge_source=np.asarray(e_src, dtype=np.str_),
+        edge_target=np.asarray(e_tgt, dtype=np.str_),
+        edge_kind=np.asarray(e_kind, dtype=np.str_),
+        cached=skip,
+    )
@@ -0,0 +1,220 @@
+# ── hydraedge.encoder.chv_encoder ──────────────────────────────────────────
+"""
+CHV encoder – schema-v2.4 payload → one composite ±1 hyper-vector.
+
+Every (role, filler) pair of the payload is bound with the role's
+compiled :class:`~hydraedge.kernel.bind_ops.BindPlan` and the bound
+vectors are bundled by majority vote.  ``encode_many`` does the same
+for a whole corpus slice at once: pairs of all records are flattened,
+bound with one plan call per role and bundled with segment sums.
+
+Module constants
+----------------
+D        : CHV dimensionality
+ROLES    : role registry (ordered)
+role_vec : role → (D,) int8 role vector
+PLANS    : role → BindPlan, compiled once at import
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Callable, Iterable, NamedTuple, Sequence
+
+import numpy as np
+from numpy.typing import NDArray
+
+from hydraedge.encoder.ep1_alias_norm import normalize_key
+from hydraedge.encoder.ep5_gamma_gate import bind_pairs
+from hydraedge.encoder.role_vectors import ROLE_LIST, ROLE_VECS
+from hydraedge.kernel.bind_ops import compile_plans
+from hydraedge.kernel.bundles import majority_vote
+from hydraedge.kernel.hv_store import HVStore
+
+__all__ = ["D", "ROLES", "role_vec", "PLANS", "filler_vec", "ChvEncoder", "RecordUpdate"]
+
+ROLES: list[str] = list(ROLE_LIST)
+role_vec: dict[str, NDArray[np.int8]] = dict(ROLE_VECS)
+D: int = next(iter(role_vec.values())).size
+PLANS = compile_plans(role_vec)
+_ROLE_RANK = {r: i for i, r in enumerate(ROLES)}
+_PLAN_LIST = [PLANS[r] for r in ROLES]
+
+_CHV_NTYPE = "chv"
+
+
+def filler_vec(key: str, dim: int = D) -> NDArray[np.int8]:
+    """Deterministic ±1 vector for a filler, seeded by a digest of *key*."""
+    seed = int.from_bytes(hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest(), "little")
+    rng = np.random.default_rng(seed)
+    return rng.choice(np.array([-1, 1], dtype=np.int8), size=dim)
+
+
+def payload_pairs(payload: dict) -> list[tuple[str, str]]:
+    """(role, normalised filler-key) pairs for every non-CHV node with a known role."""
+    pairs: list[tuple[str, str]] = []
+    for node in payload.get("nodes", []):
+        if node.get("ntype") == _CHV_NTYPE:
+            continue
+        key = normalize_key(node.get("alias_key") or node["filler"])
+        pairs.extend((r, key) for r in node.get("roles", []) if r in PLANS)
+    return pairs
+
+
+class RecordUpdate(NamedTuple):
+    """Outcome of :meth:`ChvEncoder.update`."""
+
+    record_id: str
+    vector: NDArray[np.int8]        # re-signed CHV
+    changed: bool                   # False → the indexed vector is still valid
+    n_flipped: int                  # dimensions whose sign changed
+
+
+_ACC_DTYPE = np.int16
+
+
+class ChvEncoder:
+    """
+    Encode payloads into CHVs.
+
+    Parameters
+    ----------
+    embed        : filler-key → (D,) int8 ±1 vector (defaults to :func:`filler_vec`)
+    accumulators : HVStore (or path stem) keeping each record's pre-sign
+                   vote sums for :meth:`update`; None disables it
+    """
+
+    def __init__(self, embed: Callable[[str], NDArray[np.int8]] | None = None, *,
+                 accumulators: HVStore | str | Path | None = None):
+        self.dim = D
+        self.embed = embed or filler_vec
+        if accumulators is not None and not isinstance(accumulators, HVStore):
+            accumulators = HVStore(accumulators, dim=D, dtype=_ACC_DTYPE)
+        self.accumulators = accumulators
+
+    def encode_pairs(self, pairs: Iterable[tuple[str, str]]) -> NDArray[np.int8]:
+        """Bind + bundle (role, filler-key) pairs into one (D,) int8 CHV."""
+        pairs = sorted(pairs, key=lambda p: _ROLE_RANK[p[0]])
+        if not pairs:
+            raise ValueError("payload has no (role, filler) pairs to encode")
+
+        fillers = np.stack([self.embed(key) for _, key in pairs])
+        bound = np.empty_like(fillers)
+        start = 0
+        while start < len(pairs):                 # one plan call per role run
+            role = pairs[start][0]
+            stop = start
+            while stop < len(pairs) and pairs[stop][0] == role:
+                stop += 1
+            PLANS[role].bind(fillers[start:stop], out=bound[start:stop])
+            start = stop
+        return majority_vote(bound)
+
+    def encode_json(self, payload: dict | str) -> NDArray[np.int8]:
+        """Encode one payload (dict or JSON string)."""
+        if isinstance(payload, str):
+            payload = json.loads(payload)
+        return self.encode_pairs(payload_pairs(payload))
+
+    def encode_many(self, records: Sequence[dict | str], out: NDArray | None = None,
+                    *, ids: Sequence | None = None, chunk: int = 1024) -> NDArray:
+        """
+        Encode many payloads into the rows of *out*.
+
+        *out* is any (N, D) buffer – e.g. a float32 ``open_memmap`` – and
+        receives ±1 values directly (allocated as int8 when omitted).
+        Records are processed *chunk* at a time: (role, filler) pairs are
+        flattened into arrays, each distinct filler is embedded once, every
+        role plan binds its rows in one call and each record is bundled
+        with ``np.add.reduceat`` over its run of bound rows.
+
+        With an accumulator store the vote sums are saved under *ids*
+        (default: the record positions) for later :meth:`update` calls.
+        """
+        if ids is not None and len(ids) != len(records):
+            raise ValueError("ids length mismatch")
+        if out is None:
+            out = np.empty((len(records), self.dim), dtype=np.int8)
+        if out.shape != (len(records), self.dim):
+            raise ValueError(f"out has shape {out.shape}, expected {(len(records), self.dim)}")
+
+        for lo in range(0, len(records), chunk):
+            part = records[lo:lo + chunk]
+            role_ids, keys, sizes = [], [], []
+            for rec in part:
+                pairs = payload_pairs(json.loads(rec) if isinstance(rec, str) else rec)
+                role_ids += [_ROLE_RANK[r] for r, _ in pairs]
+                keys += [k for _, k in pairs]
+                sizes.append(len(pairs))
+            sizes = np.asarray(sizes, dtype=np.int64)
+            if (sizes == 0).any():
+                bad = lo + int(np.flatnonzero(sizes == 0)[0])
+                raise ValueError(f"record {bad} has no (role, filler) pairs to encode")
+
+            uniq, filler_id = np.unique(np.asarray(keys, dtype=np.str_), return_inverse=True)
+            fillers = np.stack([self.embed(k) for k in uniq.tolist()])
+            bound = bind_pairs(np.asarray(role_ids, dtype=np.int64),
+                               filler_id.reshape(-1).astype(np.int64), fillers, _PLAN_LIST)
+
+            starts = np.concatenate(([0], np.cumsum(sizes)[:-1]))
+            counts = np.add.reduceat(bound, starts, axis=0, dtype=np.int32)
+            if self.accumulators is not None:
+                keys = [str(i) for i in (range(lo, lo + len(part)) if ids is None
+                                         else ids[lo:lo + len(part)])]
+                self._store_counts(keys, counts)
+            dst = out[lo:lo + len(part)]
+            np.multiply(counts >= 0, 2, out=dst, casting="unsafe")   # ties → +1
+            dst -= 1
+        return out
+
+    # ── incremental updates ──────────────────────────────────────────────
+    def _store_counts(self, keys: list[str], counts: NDArray[np.int32]) -> None:
+        limit = np.iinfo(_ACC_DTYPE).max
+        if len(counts) and np.abs(counts).max() > limit:
+            raise OverflowError(f"vote sums exceed {limit}; record has too many pairs")
+        self.accumulators.put_many(keys, counts.astype(_ACC_DTYPE), overwrite=True)
+
+    def _node_counts(self, nodes: Iterable[dict]) -> NDArray[np.int32]:
+        """Summed bound vectors of the (role, filler) pairs of *nodes*."""
+        pairs = payload_pairs({"nodes": list(nodes)})
+        if not pairs:
+            return np.zeros(self.dim, dtype=np.int32)
+        uniq, filler_id = np.unique(np.asarray([k for _, k in pairs], dtype=np.str_),
+                                    return_inverse=True)
+        fillers = np.stack([self.embed(k) for k in uniq.tolist()])
+        bound = bind_pairs(np.asarray([_ROLE_RANK[r] for r, _ in pairs], dtype=np.int64),
+                           filler_id.reshape(-1).astype(np.int64), fillers, _PLAN_LIST)
+        return bound.sum(axis=0, dtype=np.int32)
+
+    def update(self, record_id, added_nodes: Iterable[dict] = (),
+               removed_nodes: Iterable[dict] = ()) -> RecordUpdate:
+        """
+        Apply a node-level edit to an encoded record.
+
+        *removed_nodes* must be the nodes as they were encoded (an alias
+        correction or role relabel is "remove old node, add fixed node").
+        The stored sums are adjusted and the CHV re-signed; ``changed``
+        tells whether the indexed vector has to be replaced.
+        """
+        if self.accumulators is None:
+            raise RuntimeError("ChvEncoder.update() needs an accumulator store")
+        key = str(record_id)
+        old = self.accumulators.get(key).astype(np.int32)        # KeyError if unknown
+        new = old + self._node_counts(added_nodes) - self._node_counts(removed_nodes)
+        self._store_counts([key], new[None, :])
+
+        flipped = int(np.count_nonzero((old >= 0) != (new >= 0)))
+        vector = np.where(new >= 0, 1, -1).astype(np.int8)
+        return RecordUpdate(key, vector, flipped > 0, flipped)
+
+    def update_many(self, edits: Iterable[tuple]) -> tuple[list[str], NDArray[np.int8]]:
+        """
+        Apply ``(record_id, added_nodes, removed_nodes)`` edits and return
+        the ids whose CHV changed with their new vectors – exactly the
+        rows to re-add to the index.
+        """
+        changed = [u for u in (self.update(*e) for e in edits) if u.changed]
+        vecs = (np.stack([u.vector for u in changed]) if changed
+                else np.empty((0, self.dim), dtype=np.int8))
+        return [u.record_id for u in changed], vecs
@@ -12,17 +12,34 @@
 """Stage E0 – payload pre‑check for encoder chain.
 
 Validates extractor JSON (schema v2.4) **before** any costly encoding work.
-Raises :class:`PayloadValidationError` on the first violation so CI fails fast.
+:func:`validate` raises :class:`PayloadValidationError` on the first violation
+so CI fails fast; :func:`validate_many` checks a whole corpus and returns a
+:class:`ValidationReport` with per‑error‑type counters instead.
+
+Each payload is checked in a single pass over its nodes, edges and hulls
+(:func:`check`).  Role TSVs are cached per path and re‑read only when the
+file's mtime or size changes.
 """
 from __future__ import annotations
 
 import json
+import os
+from collections import Counter
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from itertools import islice
 from pathlib import Path
-from typing import Iterable
+from typing import Collection, Iterable, Iterator
 
 __all__ = [
     "PayloadValidationError",
+    "ERROR_TYPES",
+    "ValidationReport",
+    "load_roles",
+    "check",
     "validate",
+    "validate_many",
+    "validate_jsonl",
     "ep0_process",
 ]
 
@@ -33,67 +50,254 @@ _CHV_NTYPE = "chv"
 _SPO_NTYPE = "spo"
 _SENTENCE_STUB = "SentenceStub"
 
+# error types reported by check(), in the order they are tested
+ERROR_TYPES = (
+    "bad_json",
+    "not_object",
+    "version",
+    "missing_nodes_or_edges",
+    "chv_count",
+    "no_spo",
+    "duplicate_alias",
+    "unknown_role",
+    "unknown_edge_kind",
+    "no_binder",
+    "hull_members",
+    "missing_id",
+    "malformed",
+)
+
 # ------------------------------------------------------------------------------
 class PayloadValidationError(RuntimeError):
     """Raised when the extractor payload fails E0 validation."""
 
 
+@dataclass
+class ValidationReport:
+    """Corpus‑level E0 result; a payload counts once per error type it has."""
+
+    n_payloads: int = 0
+    n_valid: int = 0
+    errors: Counter = field(default_factory=Counter)
+    examples: dict[str, str] = field(default_factory=dict)   # first message per type
+
+    @property
+    def ok(self) -> bool:
+        return self.n_valid == self.n_payloads
+
+    def add(self, problems: list[tuple[str, str]]) -> None:
+        self.n_payloads += 1
+        if not problems:
+            self.n_valid += 1
+        for kind, msg in problems:
+            self.errors[kind] += 1
+            self.examples.setdefault(kind, msg)
+
+    def merge(self, other: "ValidationReport") -> "ValidationReport":
+        self.n_payloads += other.n_payloads
+        self.n_valid += other.n_valid
+        self.errors.update(other.errors)
+        for kind, msg in other.examples.items():
+            self.examples.setdefault(kind, msg)
+        return self
+
+
 # ------------------------------------------------------------------------------
-# Public helpers
+# Role registry
 # ------------------------------------------------------------------------------
+_ROLE_CACHE: dict[str, tuple[int, int, frozenset[str]]] = {}
 
-def validate(payload: dict, role_registry: Iterable[str]) -> None:  # noqa: C901
-    """Validate *payload* in‑place, raising :class:`PayloadValidationError` if bad."""
 
-    def bail(msg: str) -> None:
-        raise PayloadValidationError(msg)
+def load_roles(path: str | Path) -> frozenset[str]:
+    """First column of the role TSV at *path*, cached until the file changes."""
+    key = str(Path(path).expanduser().resolve())
+    st = os.stat(key)
+    cached = _ROLE_CACHE.get(key)
+    if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+        return cached[2]
+    text = Path(key).read_text(encoding="utf-8")
+    roles = frozenset(line.split("\t", 1)[0] for line in text.splitlines() if line)
+    _ROLE_CACHE[key] = (st.st_mtime_ns, st.st_size, roles)
+    return roles
+
+
+def _role_set(role_registry: Iterable[str] | str | Path) -> Collection[str]:
+    if isinstance(role_registry, (str, Path)):
+        return load_roles(role_registry)
+    if isinstance(role_registry, (set, frozenset)):
+        return role_registry
+    return frozenset(role_registry)
+
+
+# ------------------------------------------------------------------------------
+# Public helpers
+# ------------------------------------------------------------------------------
+
+def check(payload: dict, role_registry: Collection[str]) -> list[tuple[str, str]]:  # noqa: C901
+    """
+    Every problem with *payload* as ``(error type, message)`` pairs, found
+    in one pass over nodes, edges and hulls.  *role_registry* should have
+    a fast ``in`` (a set or ``role_registry.CompiledRegistry``).
+    """
+    problems: list[tuple[str, str]] = []
 
     # A. basic shape -----------------------------------------------------------
+    if not isinstance(payload, dict):
+        return [("not_object", f"payload must be a JSON object, got {type(payload).__name__}")]
     if payload.get("version") != _SCHEMA_VERSION:
-        bail(f"expected version={_SCHEMA_VERSION}, got {payload.get('version')}")
+        problems.append(("version", f"expected version={_SCHEMA_VERSION}, got {payload.get('version')}"))
 
     nodes: list[dict] = payload.get("nodes", [])
     edges: list[dict] = payload.get("edges", [])
-    if not nodes or not edges:
-        bail("payload missing nodes or edges array")
+    if not nodes or not edges or not isinstance(nodes, list) or not isinstance(edges, list):
+        problems.append(("missing_nodes_or_edges", "payload missing nodes or edges array"))
+        return problems
+    if not all(isinstance(x, dict) for x in nodes) or not all(isinstance(x, dict) for x in edges):
+        problems.append(("not_object", "every node and edge must be a JSON object"))
+        return problems
 
     # B. node‑level checks ------------------------------------------------------
-    chv_nodes = [n for n in nodes if n.get("ntype") == _CHV_NTYPE]
-    if len(chv_nodes) != 1:
-        bail("must contain exactly one chv node per sentence")
-
-    spo_nodes = [n for n in nodes if n.get("ntype") == _SPO_NTYPE]
-    if not spo_nodes:
-        bail("no SPO nodes present – extractor should have injected SentenceStub")
-
-    # alias uniqueness ----------------------------------------------------------
-    alias_keys = [n["alias_key"] for n in spo_nodes if "alias_key" in n]
-    if len(alias_keys) != len(set(alias_keys)):
-        bail("duplicate alias_key detected in sentence")
-
-    # roles known ----------------------------------------------------------------
-    valid_roles = set(role_registry)
-    unknown_roles = {
-        r for n in spo_nodes for r in n.get("roles", []) if r not in valid_roles
-    }
+    n_chv = 0
+    spo_ids: set[str] = set()
+    missing_ids = 0
+    alias_keys: set[str] = set()
+    duplicate_alias = False
+    unknown_roles: set[str] = set()
+    for n in nodes:
+        ntype = n.get("ntype")
+        if ntype == _CHV_NTYPE:
+            n_chv += 1
+        elif ntype == _SPO_NTYPE:
+            node_id = n.get("id")
+            if isinstance(node_id, str):
+                spo_ids.add(node_id)
+            else:
+                missing_ids += 1
+            alias = n.get("alias_key")
+            if isinstance(alias, str):
+                duplicate_alias |= alias in alias_keys
+                alias_keys.add(alias)
+            roles = n.get("roles") or []
+            unknown_roles.update(r if isinstance(r, str) else repr(r)
+                                 for r in (roles if isinstance(roles, list) else [roles])
+                                 if not isinstance(r, str) or r not in role_registry)
+
+    if missing_ids:
+        problems.append(("missing_id", f"{missing_ids} spo node(s) without a string id"))
+    if n_chv != 1:
+        problems.append(("chv_count", "must contain exactly one chv node per sentence"))
+    if not spo_ids:
+        problems.append(("no_spo", "no SPO nodes present – extractor should have injected SentenceStub"))
+    if duplicate_alias:
+        problems.append(("duplicate_alias", "duplicate alias_key detected in sentence"))
     if unknown_roles:
-        bail(f"unknown role strings: {sorted(unknown_roles)!r}")
+        problems.append(("unknown_role", f"unknown role strings: {sorted(unknown_roles)!r}"))
 
     # C. edge‑level checks ------------------------------------------------------
+    bad_kinds: list = []
+    has_binder = False
     for e in edges:
-        if e.get("kind") not in _REQUIRED_EDGE_KINDS:
-            bail(f"unknown edge kind: {e.get('kind')!r}")
-
-    if not any(e["kind"] == "binder" for e in edges):
-        bail("no binder edge linking to chv node found")
+        kind = e.get("kind")
+        if kind not in _REQUIRED_EDGE_KINDS:
+            bad_kinds.append(kind)
+        has_binder |= kind == "binder"
+    if bad_kinds:
+        problems.append(("unknown_edge_kind", f"unknown edge kind: {bad_kinds[0]!r}"))
+    if not has_binder:
+        problems.append(("no_binder", "no binder edge linking to chv node found"))
 
     # D. hull integrity ---------------------------------------------------------
-    hulls = payload.get("layouts", {}).get("hulls", [])
-    spo_id_set = {n["id"] for n in spo_nodes}
-    for h in hulls:
-        missing = set(h.get("members", [])) - spo_id_set
+    layouts = payload.get("layouts")
+    hulls = layouts.get("hulls", []) if isinstance(layouts, dict) else []
+    for h in hulls if isinstance(hulls, list) else []:
+        members = h.get("members", []) if isinstance(h, dict) else None
+        if not isinstance(members, list):
+            problems.append(("malformed", f"hull entries must be objects with a members array, got {h!r}"))
+            break
+        missing = {m for m in members if not isinstance(m, str) or m not in spo_ids}
         if missing:
-            bail(f"hull {h['eid']} references unknown members: {missing}")
+            problems.append(("hull_members", f"hull {h.get('eid')} references unknown members: {missing}"))
+            break
+
+    return problems
+
+
+def validate(payload: dict, role_registry: Iterable[str]) -> None:
+    """Validate *payload* in‑place, raising :class:`PayloadValidationError` if bad."""
+    problems = check(payload, _role_set(role_registry))
+    if problems:
+        raise PayloadValidationError(problems[0][1])
+
+
+# ------------------------------------------------------------------------------
+# Corpus validation
+# ------------------------------------------------------------------------------
+_WORKER_ROLES: frozenset[str] = frozenset()
+
+
+def _init_worker(roles: frozenset[str]) -> None:
+    global _WORKER_ROLES
+    _WORKER_ROLES = roles
+
+
+def _check_chunk(items: list[dict | str], roles: Collection[str] | None = None) -> ValidationReport:
+    roles = _WORKER_ROLES if roles is None else roles
+    report = ValidationReport()
+    for item in items:
+        if isinstance(item, (str, bytes)):
+            try:
+                item = json.loads(item)
+            except ValueError as exc:
+                report.add([("bad_json", f"invalid JSON: {exc}")])
+                continue
+        try:
+            problems = check(item, roles)
+        except (AttributeError, KeyError, TypeError) as exc:   # shapes check() does not guard
+            problems = [("malformed", f"malformed payload: {exc!r}")]
+        report.add(problems)
+    return report
+
+
+def _chunks(items: Iterable, size: int) -> Iterator[list]:
+    it = iter(items)
+    while chunk := list(islice(it, size)):
+        yield chunk
+
+
+def validate_many(payloads: Iterable[dict | str], role_registry: Iterable[str] | str | Path, *,
+                  n_workers: int = 0, chunk_size: int = 1024) -> ValidationReport:
+    """
+    Check every payload (a dict or one JSON line) and count problems by
+    type instead of stopping at the first one.  *role_registry* is a role
+    collection or a TSV path (loaded once via :func:`load_roles`).  With
+    ``n_workers > 1`` chunks of *chunk_size* payloads are checked in a
+    process pool; at most two chunks per worker are in flight, so the
+    input may be an arbitrarily long stream.
+    """
+    roles = frozenset(_role_set(role_registry))
+    report = ValidationReport()
+    if n_workers <= 1:
+        for chunk in _chunks(payloads, chunk_size):
+            report.merge(_check_chunk(chunk, roles))
+        return report
+
+    with ProcessPoolExecutor(n_workers, initializer=_init_worker, initargs=(roles,)) as pool:
+        pending: list[Future] = []
+        for chunk in _chunks(payloads, chunk_size):
+            if len(pending) >= 2 * n_workers:
+                report.merge(pending.pop(0).result())
+            pending.append(pool.submit(_check_chunk, chunk))
+        for fut in pending:
+            report.merge(fut.result())
+    return report
+
+
+def validate_jsonl(path: str | Path, role_registry: Iterable[str] | str | Path, *,
+                   n_workers: int = 0, chunk_size: int = 1024) -> ValidationReport:
+    """:func:`validate_many` over the non‑blank lines of a JSONL corpus."""
+    with open(path, encoding="utf-8") as fh:
+        lines = (line for line in fh if line.strip())
+        return validate_many(lines, role_registry, n_workers=n_workers, chunk_size=chunk_size)
 
 
 # ------------------------------------------------------------------------------
@@ -107,6 +311,5 @@ def ep0_process(payload_json: str | dict, role_registry_path: str | Path) -> dic
     else:
         payload = payload_json
 
-    roles = {line.split("\t", 1)[0] for line in Path(role_registry_path).read_text("utf‑8").splitlines() if line}
-    validate(payload, roles)
+    validate(payload, load_roles(role_registry_path))
     return payload
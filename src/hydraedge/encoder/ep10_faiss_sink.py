@@ -0,0 +1,239 @@
+# ── hydraedge.encoder.ep10_faiss_sink ──────────────────────────────────────
+"""Stage E10 – hand finished CHVs to a vector index.
+
+Any index with ``add(vecs, ids)`` works: ``index.FaissIndex`` (float32
+rows) or ``index.HammingIndex`` (±1 rows, packed internally).  Records
+that E9 flagged as duplicates (``batch.unique`` False) are skipped.
+
+:class:`FaissSink` adds each batch synchronously.  :class:`BufferedFaissSink`
+copies batches into a preallocated ring buffer and a background thread
+adds them to the index in large slices, so encoding the next batch
+overlaps with index insertion.  The buffer is bounded – ``write`` blocks
+while it is full – and a slice is flushed once ``flush_rows`` rows are
+pending or the oldest pending row is ``flush_secs`` old.  An optional
+checkpoint file lists (as raw int64) every id the index has accepted.
+With ``index_path`` set, the index is written out every ``write_every``
+flushes and on ``flush`` / ``close``, and ids are appended to the
+checkpoint only after the write that contains them, so checkpointed ids
+survive a crash while a long run rewrites the index O(N / write_every)
+times rather than once per slice.
+"""
+from __future__ import annotations
+
+import os
+import threading
+import time
+from pathlib import Path
+
+import numpy as np
+from numpy.typing import NDArray
+
+from hydraedge.encoder.batch import PairBatch
+
+__all__ = ["FaissSink", "BufferedFaissSink", "checkpointed_ids"]
+
+
+def _unique_rows(batch: PairBatch) -> tuple[NDArray, NDArray[np.int64]]:
+    vectors, ids = batch.vectors, batch.ids
+    if batch.unique is not None:
+        vectors, ids = vectors[batch.unique], ids[batch.unique]
+    return vectors, ids
+
+
+class FaissSink:
+    """Adds every batch's vectors to *index* under the batch's record ids."""
+
+    def __init__(self, index):
+        self.index = index
+        self.n_added = 0
+
+    def write(self, batch: PairBatch) -> PairBatch:
+        vectors, ids = _unique_rows(batch)
+        if len(ids):
+            self.index.add(vectors.astype(np.float32), ids)
+            self.n_added += len(ids)
+        return batch
+
+    __call__ = write
+
+
+def checkpointed_ids(path: str | Path) -> NDArray[np.int64]:
+    """Ids recorded in a :class:`BufferedFaissSink` checkpoint (empty if none)."""
+    path = Path(path)
+    if not path.exists():
+        return np.empty(0, dtype=np.int64)
+    data = path.read_bytes()
+    return np.frombuffer(data[: len(data) // 8 * 8], dtype=np.int64).copy()
+
+
+class BufferedFaissSink:
+    """
+    Parameters
+    ----------
+    index      : target index (``add(vecs, ids)``; ``write(path)`` if
+                 *index_path* is given)
+    dim        : vector dimensionality
+    capacity   : ring-buffer rows; ``write`` blocks while it is full
+    flush_rows : pending rows that trigger a flush
+    flush_secs : maximum age of a pending row before it is flushed
+    checkpoint : file the added ids are appended to (None: no checkpoint)
+    index_path : write the index here every *write_every* flushes and on
+                 ``flush`` / ``close``, before the checkpoint append
+    write_every: flushes between index writes
+
+    Use as a context manager or call :meth:`close` to drain the buffer;
+    errors raised by the index surface on the next ``write`` / ``flush``.
+    """
+
+    def __init__(self, index, dim: int, *, capacity: int = 65_536,
+                 flush_rows: int = 8_192, flush_secs: float = 1.0,
+                 checkpoint: str | Path | None = None,
+                 index_path: str | Path | None = None, write_every: int = 16):
+        if not 0 < flush_rows <= capacity:
+            raise ValueError(f"need 0 < flush_rows ≤ capacity, got {flush_rows}, {capacity}")
+        if write_every < 1:
+            raise ValueError(f"write_every must be ≥ 1, got {write_every}")
+        self.index = index
+        self.capacity = capacity
+        self.flush_rows = flush_rows
+        self.flush_secs = flush_secs
+        self.checkpoint = None if checkpoint is None else Path(checkpoint)
+        self.index_path = None if index_path is None else Path(index_path)
+        self.write_every = write_every
+        self.n_added = 0
+
+        self._vecs = np.empty((capacity, dim), dtype=np.float32)
+        self._ids = np.empty(capacity, dtype=np.int64)
+        self._times = np.empty(capacity, dtype=np.float64)   # arrival time per row
+        self._head = 0                  # oldest buffered row
+        self._size = 0                  # buffered rows, including the slice being added
+        self._oldest = 0.0              # arrival time of the oldest pending row
+        self._unsaved: list[NDArray[np.int64]] = []   # added ids not yet checkpointed
+        self._n_flushes = 0
+        self._io_lock = threading.Lock()              # index.add / index.write / checkpoint
+        self._flush_requested = False
+        self._closed = False
+        self._error: BaseException | None = None
+        self._cond = threading.Condition()
+        self._thread = threading.Thread(target=self._flush_loop, name="faiss-sink", daemon=True)
+        self._thread.start()
+
+    # ── producer side ───────────────────────────────────────────────────
+    def write(self, batch: PairBatch) -> PairBatch:
+        vectors, ids = _unique_rows(batch)
+        self.put(vectors, ids)
+        return batch
+
+    __call__ = write
+
+    def put(self, vectors: NDArray, ids: NDArray[np.int64]) -> None:
+        """Copy rows into the ring buffer, blocking while it is full."""
+        n, lo = len(ids), 0
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("sink is closed")
+            while lo < n:
+                while self._size == self.capacity and self._error is None:
+                    self._cond.wait()
+                self._raise()
+                tail = (self._head + self._size) % self.capacity
+                m = min(n - lo, self.capacity - self._size, self.capacity - tail)
+                self._vecs[tail:tail + m] = vectors[lo:lo + m]
+                self._ids[tail:tail + m] = ids[lo:lo + m]
+                self._times[tail:tail + m] = time.monotonic()
+                arm = self._size == 0           # idle flusher must start the age timer
+                if arm:
+                    self._oldest = self._times[tail]
+                self._size += m
+                lo += m
+                if arm or self._size >= self.flush_rows:
+                    self._cond.notify_all()
+
+    def flush(self) -> None:
+        """Block until every buffered row has been added to the index and saved."""
+        with self._cond:
+            self._flush_requested = True
+            self._cond.notify_all()
+            while self._size and self._error is None:
+                self._cond.wait()
+            self._flush_requested = False
+            self._raise()
+        with self._io_lock:
+            self._save()
+
+    def close(self) -> None:
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join()
+        self._raise()
+        with self._io_lock:
+            self._save()
+
+    def __enter__(self) -> "BufferedFaissSink":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _raise(self) -> None:
+        if self._error is not None:
+            raise RuntimeError("background index flush failed") from self._error
+
+    # ── flusher thread ──────────────────────────────────────────────────
+    def _due(self) -> bool:
+        return bool(self._size) and (
+            self._size >= self.flush_rows or self._closed or self._flush_requested
+            or time.monotonic() - self._oldest >= self.flush_secs)
+
+    def _flush_loop(self) -> None:
+        while True:
+            with self._cond:
+                while not self._due():
+                    if self._closed and not self._size:
+                        return
+                    wait = (self.flush_secs - (time.monotonic() - self._oldest)
+                            if self._size else None)
+                    self._cond.wait(wait)
+                head = self._head
+                k = min(self._size, self.capacity - head)     # contiguous slice
+            try:
+                # rows [head, head + k) stay reserved until released below
+                with self._io_lock:
+                    self.index.add(self._vecs[head:head + k], self._ids[head:head + k])
+                    self._record(self._ids[head:head + k])
+            except BaseException as exc:                     # surfaced to producers
+                with self._cond:
+                    self._error = exc
+                    self._cond.notify_all()
+                return
+            with self._cond:
+                self._head = (head + k) % self.capacity
+                self._size -= k
+                self.n_added += k
+                if self._size:                               # partial flush: re-arm the timer
+                    self._oldest = self._times[self._head]
+                self._cond.notify_all()
+
+    def _record(self, ids: NDArray[np.int64]) -> None:
+        if self.checkpoint is None and self.index_path is None:
+            return
+        self._unsaved.append(ids.copy())
+        self._n_flushes += 1
+        if self.index_path is None or self._n_flushes % self.write_every == 0:
+            self._save()
+
+    def _save(self) -> None:
+        """Write the index, then checkpoint the ids it now holds (``_io_lock`` held)."""
+        if not self._unsaved:
+            return
+        if self.index_path is not None:
+            self.index.write(self.index_path)
+        if self.checkpoint is not None:
+            with open(self.checkpoint, "ab") as fh:
+                fh.write(np.concatenate(self._unsaved).tobytes())
+                fh.flush()
+                os.fsync(fh.fileno())
+        self._unsaved.clear()
@@ -0,0 +1,34 @@
+# ── hydraedge.encoder.ep1_alias_norm ───────────────────────────────────────
+"""Stage E1 – normalise filler keys.
+
+The filler key of a node is its ``alias_key`` (falling back to the raw
+``filler``), normalised the way the extractor builds alias keys: surrounding
+whitespace stripped, lower-cased, inner spaces replaced by ``_``.  Cached
+filler vectors (E2) are keyed by this normalised form.
+"""
+from __future__ import annotations
+
+import numpy as np
+from numpy.typing import NDArray
+
+from hydraedge.encoder.batch import PairBatch
+
+__all__ = ["normalize_key", "normalize_keys", "run"]
+
+
+def normalize_key(key: str) -> str:
+    """Normalised form of one filler key."""
+    return key.strip().lower().replace(" ", "_")
+
+
+def normalize_keys(keys: NDArray[np.str_]) -> NDArray[np.str_]:
+    """Vectorised :func:`normalize_key` over a string array."""
+    keys = np.asarray(keys, dtype=np.str_)
+    if keys.size == 0:                      # np.char.replace rejects empty input
+        return keys
+    return np.char.replace(np.char.lower(np.char.strip(keys)), " ", "_")
+
+
+def run(batch: PairBatch) -> PairBatch:
+    batch.key = normalize_keys(batch.key)
+    return batch
@@ -0,0 +1,116 @@
+# ── hydraedge.encoder.ep2_w2hv_embed ───────────────────────────────────────
+"""Stage E2 – filler keys → filler hyper-vectors.
+
+Keys repeat heavily inside a batch, so they are deduplicated first: the
+backend embeds each distinct key once and every pair stores a
+``filler_id`` row index into ``batch.fillers``.
+
+Fillers also repeat across batches and worker processes, so a
+:class:`FillerCache` can sit in front of the backend with two levels:
+
+1. an in-process LRU of at most ``capacity`` vectors;
+2. an on-disk :class:`~hydraedge.kernel.hv_store.HVStore` keyed by the
+   normalised ``alias_key`` – memory-mapped and append-locked, so every
+   worker sharing the path reuses vectors any of them computed.
+
+Only keys missing from both levels reach the backend.
+"""
+from __future__ import annotations
+
+from collections import Counter, OrderedDict
+from pathlib import Path
+from typing import Sequence
+
+import numpy as np
+from numpy.typing import NDArray
+
+from hydraedge.encoder.batch import PairBatch
+from hydraedge.encoder.w2hv_backend import W2HVBackend
+from hydraedge.kernel.hv_store import HVStore
+
+__all__ = ["FillerCache", "run"]
+
+
+class FillerCache:
+    """
+    Caching wrapper with the backend interface (``dim``, ``embed_many``).
+
+    Parameters
+    ----------
+    backend  : the w2hv backend producing vectors on a miss
+    capacity : LRU size in vectors (0 disables the in-process level)
+    store    : HVStore path stem (or an open store); None → LRU only.
+               Use one store per backend – vectors are not interchangeable.
+    """
+
+    def __init__(self, backend: W2HVBackend, *, capacity: int = 8192,
+                 store: HVStore | str | Path | None = None):
+        self.backend = backend
+        self.dim = backend.dim
+        self.capacity = capacity
+        if store is not None and not isinstance(store, HVStore):
+            store = HVStore(store, dim=self.dim)
+        if store is not None and store.dim != self.dim:
+            raise ValueError(f"store holds dim={store.dim} vectors, backend makes {self.dim}")
+        self.store = store
+        self._lru: OrderedDict[str, NDArray[np.int8]] = OrderedDict()
+        self.counters: Counter[str] = Counter(lru_hits=0, store_hits=0, misses=0)
+
+    def stats(self) -> dict[str, float]:
+        """Hit / miss counters plus the overall hit rate."""
+        c = self.counters
+        total = c["lru_hits"] + c["store_hits"] + c["misses"]
+        hits = c["lru_hits"] + c["store_hits"]
+        return {**c, "hit_rate": hits / total if total else 0.0}
+
+    def _remember(self, keys: Sequence[str], vecs: NDArray[np.int8]) -> None:
+        if self.capacity <= 0:
+            return
+        for key, vec in zip(keys[-self.capacity:], vecs[-self.capacity:]):
+            self._lru[key] = np.array(vec)              # own copy, not a memmap view
+            self._lru.move_to_end(key)
+        while len(self._lru) > self.capacity:
+            self._lru.popitem(last=False)
+
+    def embed_many(self, keys: Sequence[str]) -> NDArray[np.int8]:
+        out = np.empty((len(keys), self.dim), dtype=np.int8)
+        todo = []
+        for i, key in enumerate(keys):                  # level 1
+            vec = self._lru.get(key)
+            if vec is None:
+                todo.append(i)
+            else:
+                self._lru.move_to_end(key)
+                out[i] = vec
+        self.counters["lru_hits"] += len(keys) - len(todo)
+        if not todo:
+            return out
+
+        todo = np.asarray(todo, dtype=np.int64)
+        todo_keys = [keys[i] for i in todo]
+        if self.store is not None:                      # level 2
+            rows = self.store.rows_of(todo_keys)
+            if (rows < 0).any():                        # another worker may have them
+                rows = self.store.refresh().rows_of(todo_keys)
+            found = rows >= 0
+            out[todo[found]] = self.store.rows[rows[found]]
+            self.counters["store_hits"] += int(found.sum())
+            self._remember([k for k, f in zip(todo_keys, found) if f], out[todo[found]])
+            todo, todo_keys = todo[~found], [k for k, f in zip(todo_keys, found) if not f]
+
+        if todo_keys:                                   # level 3 – compute
+            vecs = self.backend.embed_many(todo_keys)
+            out[todo] = vecs
+            self.counters["misses"] += len(todo_keys)
+            if self.store is not None:
+                self.store.put_many(todo_keys, vecs)
+            self._remember(todo_keys, vecs)
+        return out
+
+
+def run(batch: PairBatch, backend: W2HVBackend) -> PairBatch:
+    """*backend* may be a plain backend or a :class:`FillerCache`."""
+    uniq, inverse = np.unique(batch.key, return_inverse=True)
+    batch.filler_id = inverse.reshape(-1).astype(np.int64)
+    batch.fillers = backend.embed_many(uniq.tolist())
+    return batch
@@ -0,0 +1,38 @@
+# ── hydraedge.encoder.ep3_role_lookup ──────────────────────────────────────
+"""Stage E3 – role strings → integer role ids.
+
+Ids index the ordered role registry – a compiled
+:class:`~hydraedge.encoder.role_registry.CompiledRegistry` or a plain
+sequence such as ``chv_encoder.ROLES``.  Pairs whose role is not in the
+registry (e.g. ``VerbClass``) carry no role vector and are dropped,
+exactly as ``chv_encoder.payload_pairs`` skips them.
+"""
+from __future__ import annotations
+
+from typing import Sequence
+
+import numpy as np
+from numpy.typing import NDArray
+
+from hydraedge.encoder.batch import PairBatch
+from hydraedge.encoder.role_registry import CompiledRegistry
+
+__all__ = ["role_ids", "run"]
+
+
+def role_ids(roles: NDArray[np.str_], registry: Sequence[str]) -> NDArray[np.int64]:
+    """Registry index of every role string, −1 where unknown."""
+    reg = np.asarray(registry, dtype=np.str_)
+    order = np.argsort(reg)
+    sorted_reg = reg[order]
+    roles = np.asarray(roles, dtype=np.str_)
+    if roles.size == 0:
+        return np.empty(0, dtype=np.int64)
+    pos = np.minimum(np.searchsorted(sorted_reg, roles), len(reg) - 1)
+    return np.where(sorted_reg[pos] == roles, order[pos], -1).astype(np.int64)
+
+
+def run(batch: PairBatch, registry: CompiledRegistry | Sequence[str]) -> PairBatch:
+    batch.role_id = (registry.ids(batch.role) if isinstance(registry, CompiledRegistry)
+                     else role_ids(batch.role, registry))
+    return batch.keep(batch.role_id >= 0)
@@ -0,0 +1,76 @@
+# ── hydraedge.encoder.ep4_dir_tag ──────────────────────────────────────────
+"""Stage E4 – edge-direction tags.
+
+A pair is tagged +1 when its node only *starts* structural edges
+(``S-P``, ``P-O``, ``event-pred``, ``subevt``), −1 when it only *ends*
+them and 0 otherwise.  The tag selects one of three bind plans per role,
+``plan_id = role_id · 3 + (direction + 1)``: the neutral plan is the
+plain role, the directed ones bind the role with a fixed direction
+vector first, so "dog chases cat" and "cat chases dog" stop colliding.
+
+The role × direction vectors are precomputed once per registry
+(``role_registry.CompiledRegistry.dir_matrix``), so a tag is just a row
+index.  Tagging is off by default (every pair gets 0), which keeps CHVs
+identical to ``ChvEncoder`` and to indexes built before E4 existed.
+"""
+from __future__ import annotations
+
+from typing import Sequence
+
+import numpy as np
+from numpy.typing import NDArray
+
+from hydraedge.encoder.batch import PairBatch
+from hydraedge.encoder.chv_encoder import filler_vec
+from hydraedge.kernel.bind_ops import BindPlan, bind
+
+__all__ = ["STRUCTURAL_KINDS", "N_DIRS", "directions", "direction_matrix",
+           "direction_plans", "run"]
+
+STRUCTURAL_KINDS = ("S-P", "P-O", "event-pred", "subevt")
+N_DIRS = 3                                  # −1, 0, +1
+_DIR_KEYS = {-1: "<dir:in>", 1: "<dir:out>"}
+
+
+def _node_keys(record: NDArray[np.int64], node: NDArray[np.str_]) -> NDArray[np.str_]:
+    """Batch-unique node keys (node ids are only unique per payload)."""
+    if record.size == 0:
+        return np.empty(0, dtype=np.str_)
+    return np.char.add(np.char.add(record.astype(np.str_), "\x1f"), node)
+
+
+def directions(batch: PairBatch) -> NDArray[np.int8]:
+    """(P,) int8 direction tag of every pair."""
+    structural = np.isin(batch.edge_kind, STRUCTURAL_KINDS)
+    rec = batch.edge_record[structural]
+    sources = _node_keys(rec, batch.edge_source[structural])
+    targets = _node_keys(rec, batch.edge_target[structural])
+    nodes = _node_keys(batch.record, batch.node)
+    return (np.isin(nodes, sources).astype(np.int8)
+            - np.isin(nodes, targets).astype(np.int8))
+
+
+def direction_matrix(role_vecs: Sequence[NDArray[np.int8]]) -> NDArray[np.int8]:
+    """(R · 3, D) int8 matrix, row ``plan_id`` = role bound with its direction."""
+    dim = len(role_vecs[0])
+    out = np.empty((len(role_vecs) * N_DIRS, dim), dtype=np.int8)
+    for d, key in _DIR_KEYS.items():
+        dir_vec = filler_vec(key, dim)
+        for i, vec in enumerate(role_vecs):
+            out[i * N_DIRS + d + 1] = bind(dir_vec, vec)
+    out[1::N_DIRS] = role_vecs
+    return out
+
+
+def direction_plans(role_vecs: Sequence[NDArray[np.int8]]) -> list[BindPlan]:
+    """Bind plans indexed by ``plan_id`` for an ordered list of role vectors."""
+    return [BindPlan(row) for row in direction_matrix(role_vecs)]
+
+
+def run(batch: PairBatch, directed: bool = False) -> PairBatch:
+    if directed:
+        batch.direction = directions(batch)
+    else:
+        batch.direction = np.zeros(len(batch), dtype=np.int8)
+    batch.plan_id = batch.role_id * N_DIRS + (batch.direction.astype(np.int64) + 1)
+    return batch
@@ -0,0 +1,48 @@
+# ── hydraedge.encoder.ep5_gamma_gate ───────────────────────────────────────
+"""Stage E5 – bind every pair and apply the γ-gate.
+
+Pairs are sorted by ``plan_id`` so each bind plan runs once per batch on
+a contiguous block; one scatter restores record order for E6.  A per-role
+γ (``kernel.bundles.gamma_gate``) then blends bound vectors back towards
+their raw fillers; γ = 0 everywhere – the default – skips the gate.
+"""
+from __future__ import annotations
+
+from typing import Sequence
+
+import numpy as np
+from numpy.typing import NDArray
+
+from hydraedge.encoder.batch import PairBatch
+from hydraedge.kernel.bind_ops import BindPlan
+from hydraedge.kernel.bundles import gamma_gate_many
+
+__all__ = ["bind_pairs", "run"]
+
+
+def bind_pairs(plan_id: NDArray[np.int64], filler_id: NDArray[np.int64],
+               fillers: NDArray[np.int8], plans: Sequence[BindPlan]) -> NDArray[np.int8]:
+    """(P, D) bound vectors, row *i* = ``plans[plan_id[i]].bind(fillers[filler_id[i]])``."""
+    if len(plan_id) == 0:
+        return np.empty((0, fillers.shape[1]), dtype=np.int8)
+    order = np.argsort(plan_id, kind="stable")
+    sorted_ids = plan_id[order]
+    staged = np.take(fillers, filler_id[order], axis=0)
+    cuts = np.flatnonzero(np.diff(sorted_ids)) + 1
+    bound_sorted = np.empty_like(staged)
+    for lo, hi in zip(np.r_[0, cuts], np.r_[cuts, len(order)]):
+        plans[sorted_ids[lo]].bind(staged[lo:hi], out=bound_sorted[lo:hi])
+    bound = np.empty_like(bound_sorted)
+    bound[order] = bound_sorted
+    return bound
+
+
+def run(batch: PairBatch, plans: Sequence[BindPlan],
+        gamma: NDArray[np.float64] | None = None) -> PairBatch:
+    """*gamma* is an optional per-role-id array of γ values."""
+    batch.bound = bind_pairs(batch.plan_id, batch.filler_id, batch.fillers, plans)
+    if gamma is not None and len(batch):
+        g = np.asarray(gamma)[batch.role_id]
+        if g.any():
+            gamma_gate_many(batch.bound, batch.fillers[batch.filler_id], g, out=batch.bound)
+    return batch
@@ -0,0 +1,27 @@
+# ── hydraedge.encoder.ep6_bundle ───────────────────────────────────────────
+"""Stage E6 – bundle each record's bound vectors.
+
+Pairs are grouped by record, so the per-record vote sums are a single
+``np.add.reduceat`` over the (P, D) bound matrix.  Records served from
+the E9 cache have no pairs and keep all-zero sums.
+"""
+from __future__ import annotations
+
+import numpy as np
+
+from hydraedge.encoder.batch import PairBatch
+
+__all__ = ["run"]
+
+
+def run(batch: PairBatch) -> PairBatch:
+    starts = batch.record_start
+    encoded = ~batch.cached
+    empty = np.flatnonzero((np.diff(starts) == 0) & encoded)
+    if empty.size:
+        raise ValueError(f"record {int(batch.ids[empty[0]])} has no (role, filler) pairs to encode")
+    batch.counts = np.zeros((batch.n_records, batch.bound.shape[1]), dtype=np.int32)
+    if len(batch):
+        batch.counts[encoded] = np.add.reduceat(batch.bound, starts[:-1][encoded],
+                                                axis=0, dtype=np.int32)
+    return batch
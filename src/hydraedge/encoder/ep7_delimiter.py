@@ -0,0 +1,42 @@
+# ── hydraedge.encoder.ep7_delimiter ────────────────────────────────────────
+"""Stage E7 – event-group delimiters.
+
+Bundling mixes the pairs of every event in a sentence.  With delimiters
+enabled each record additionally bundles one delimiter vector per event
+group (distinct ``eid``), rolled by the group's ordinal, so one- and
+multi-event sentences with the same fillers no longer share a CHV.  Off
+by default for parity with ``ChvEncoder``.
+"""
+from __future__ import annotations
+
+import numpy as np
+from numpy.typing import NDArray
+
+from hydraedge.encoder.batch import PairBatch
+from hydraedge.encoder.chv_encoder import filler_vec
+from hydraedge.kernel.bind_ops import _roll_rows
+
+__all__ = ["delimiter_rows", "run"]
+
+_DELIM_KEY = "<delim:eid>"
+
+
+def delimiter_rows(record: NDArray[np.int64], eid: NDArray[np.str_],
+                   dim: int) -> tuple[NDArray[np.int64], NDArray[np.int8]]:
+    """(record of each event group, (G, dim) delimiter vectors)."""
+    has_eid = eid != ""
+    if not has_eid.any():
+        return np.empty(0, dtype=np.int64), np.empty((0, dim), dtype=np.int8)
+    names, code = np.unique(eid[has_eid], return_inverse=True)
+    groups = np.unique(record[has_eid] * len(names) + code.reshape(-1))
+    group_rec = groups // len(names)
+    ordinal = np.arange(len(groups)) - np.searchsorted(group_rec, group_rec)
+    base = np.broadcast_to(filler_vec(_DELIM_KEY, dim), (len(groups), dim))
+    return group_rec, _roll_rows(base, ordinal)
+
+
+def run(batch: PairBatch, enabled: bool = False) -> PairBatch:
+    if enabled:
+        group_rec, rows = delimiter_rows(batch.record, batch.eid, batch.counts.shape[1])
+        np.add.at(batch.counts, group_rec, rows)
+    return batch
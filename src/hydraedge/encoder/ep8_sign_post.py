@@ -0,0 +1,21 @@
+# ── hydraedge.encoder.ep8_sign_post ────────────────────────────────────────
+"""Stage E8 – vote sums → ±1 CHVs (ties resolve to +1, as ``majority_vote``)."""
+from __future__ import annotations
+
+import numpy as np
+from numpy.typing import NDArray
+
+from hydraedge.encoder.batch import PairBatch
+
+__all__ = ["run"]
+
+
+def run(batch: PairBatch, out: NDArray[np.int8] | None = None) -> PairBatch:
+    """Write the signs into *out* (an (N, D) int8 buffer) when given."""
+    if out is None:
+        out = np.empty(batch.counts.shape, dtype=np.int8)
+    np.greater_equal(batch.counts, 0, out=out, casting="unsafe")   # 1 / 0
+    out *= 2
+    out -= 1
+    batch.vectors = out
+    return batch
@@ -0,0 +1,168 @@
+# ── hydraedge.encoder.ep9_qc_digest ────────────────────────────────────────
+"""Stage E9 – quality counters, content digests, payload cache and dedup.
+
+``qc["n_pairs"]``  : bound pairs per record
+``qc["tie_frac"]`` : fraction of dimensions whose vote sum was 0 (high
+                     values mean too few pairs for a stable CHV; NaN for
+                     records served from the cache)
+``digests``        : BLAKE2b-128 hex digest of each CHV's bytes
+
+Two optional layers sit on top of the digests:
+
+* :class:`DigestCache` – a persistent payload-digest → CHV store.  The
+  payload digest (:func:`payload_digests`) covers the canonical form of
+  the nodes and edges plus a *salt* naming the encoder configuration and
+  role-registry version, so a repeated payload is looked up before E1
+  and skips encoding; a config or registry change simply misses.
+* :class:`VectorDedup` – CHV digest → first record id.  Records whose CHV
+  was already seen are flagged ``unique=False`` and their id kept as an
+  alias of the first record, so identical CHVs reach the index once.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Mapping, Sequence
+
+import numpy as np
+from numpy.typing import NDArray
+
+from hydraedge.encoder.batch import PairBatch
+from hydraedge.kernel.hv_store import HVStore
+
+__all__ = [
+    "digest",
+    "canonical_payload",
+    "payload_digests",
+    "config_salt",
+    "DigestCache",
+    "VectorDedup",
+    "run",
+]
+
+
+def digest(vec: np.ndarray) -> str:
+    return hashlib.blake2b(np.ascontiguousarray(vec).tobytes(), digest_size=16).hexdigest()
+
+
+# ── payload digests ──────────────────────────────────────────────────────
+def canonical_payload(payload: Mapping) -> bytes:
+    """
+    Order-independent serialisation of a payload's nodes and edges: nodes
+    sorted by id, edges by (source, target, kind), keys sorted.  Other
+    top-level fields (sentence text, ids) do not affect the CHV and are
+    left out.
+    """
+    nodes = sorted(payload.get("nodes", []), key=lambda n: str(n.get("id")))
+    edges = sorted(payload.get("edges", []),
+                   key=lambda e: (str(e.get("source")), str(e.get("target")), str(e.get("kind"))))
+    return json.dumps({"nodes": nodes, "edges": edges}, sort_keys=True,
+                      separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def payload_digests(payloads: Sequence[Mapping], salt: str = "") -> list[str]:
+    """BLAKE2b-128 hex digest of ``salt`` + the canonical form of each payload."""
+    prefix = hashlib.blake2b(salt.encode("utf-8"), digest_size=16)
+    out = []
+    for payload in payloads:
+        h = prefix.copy()
+        h.update(canonical_payload(payload))
+        out.append(h.hexdigest())
+    return out
+
+
+def config_salt(config: Mapping, backend: str, registry: str) -> str:
+    """
+    Salt for :func:`payload_digests` from the settings that shape a CHV;
+    *registry* is ``CompiledRegistry.version``.
+    """
+    return json.dumps({"config": dict(config), "backend": backend, "registry": registry},
+                      sort_keys=True, default=str)
+
+
+# ── persistent payload cache ─────────────────────────────────────────────
+class DigestCache:
+    """
+    Payload digest → CHV rows in an :class:`~hydraedge.kernel.hv_store.HVStore`
+    (``<path>.hv`` / ``<path>.keys``), shareable by worker processes.
+    """
+
+    def __init__(self, path: str | Path, dim: int):
+        self.store = HVStore(path, dim=dim, dtype=np.int8)
+        if self.store.dim != dim:
+            raise ValueError(f"digest cache at {path} has dim {self.store.dim}, expected {dim}")
+        self.hits = 0
+        self.misses = 0
+
+    def lookup(self, digests: Sequence[str]) -> NDArray[np.int64]:
+        """Cache row of each digest, −1 on a miss."""
+        rows = self.store.rows_of(digests)
+        if (rows < 0).any():
+            rows = self.store.refresh().rows_of(digests)     # other writers' rows
+        n_hit = int((rows >= 0).sum())
+        self.hits += n_hit
+        self.misses += len(rows) - n_hit
+        return rows
+
+    def vectors(self, rows: NDArray[np.int64]) -> NDArray[np.int8]:
+        return self.store.rows[rows]
+
+    def put(self, digests: Sequence[str], vecs: NDArray[np.int8]) -> None:
+        if len(digests):
+            self.store.put_many(digests, vecs)
+
+
+# ── output dedup ─────────────────────────────────────────────────────────
+class VectorDedup:
+    """
+    Remembers the first record id seen for every CHV digest; later records
+    with the same CHV become aliases of it (``aliases[dup_id] = first_id``).
+    """
+
+    def __init__(self):
+        self._first: dict[str, int] = {}
+        self.aliases: dict[int, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._first)
+
+    def run(self, ids: NDArray[np.int64],
+            digests: Sequence[str]) -> tuple[NDArray[np.bool_], NDArray[np.int64]]:
+        """(unique mask, id of the first record with the same CHV) per record."""
+        alias_of = np.empty(len(ids), dtype=np.int64)
+        for i, (rid, d) in enumerate(zip(ids.tolist(), digests)):
+            first = self._first.setdefault(d, rid)
+            alias_of[i] = first
+            if first != rid:
+                self.aliases[rid] = first
+        return alias_of == ids, alias_of
+
+    def save(self, path: str | Path) -> None:
+        """Write the aliases as ``<dup_id>\\t<first_id>`` lines."""
+        Path(path).write_text("".join(f"{a}\t{b}\n" for a, b in self.aliases.items()),
+                              encoding="utf-8")
+
+
+# ── stage ────────────────────────────────────────────────────────────────
+def run(batch: PairBatch, cache: DigestCache | None = None,
+        dedup: VectorDedup | None = None) -> PairBatch:
+    """
+    Fill cached records' CHVs, store the freshly encoded ones under their
+    payload digest, then compute digests, dedup flags and QC counters.
+    """
+    hit = batch.cached
+    if hit.any():
+        batch.vectors[hit] = cache.vectors(batch.cache_rows[hit])
+    if cache is not None and batch.payload_digests and not hit.all():
+        miss = np.flatnonzero(~hit)
+        cache.put([batch.payload_digests[i] for i in miss], batch.vectors[miss])
+
+    batch.qc["n_pairs"] = np.diff(batch.record_start)
+    tie_frac = (batch.counts == 0).mean(axis=1, dtype=np.float32)
+    tie_frac[hit] = np.nan
+    batch.qc["tie_frac"] = tie_frac
+    batch.digests = [digest(v) for v in batch.vectors]
+    if dedup is not None:
+        batch.unique, batch.alias_of = dedup.run(batch.ids, batch.digests)
+    return batch
@@ -0,0 +1,207 @@
+# ── hydraedge.encoder.pipeline ─────────────────────────────────────────────
+"""
+Streaming encoder: payloads → CHVs through stages E1 – E10.
+
+Payloads are grouped into batches of ``config.batch_size``, flattened
+into a columnar :class:`~hydraedge.encoder.batch.PairBatch` and passed
+through the stages in order; each stage runs one vectorised step per
+batch, so throughput grows with the batch size rather than being bound
+by per-node Python overhead.  E3 runs before E2 so fillers that only
+appear under unknown roles are never embedded.
+
+>>> pipe = EncoderPipeline()
+>>> for batch in pipe.stream(payloads):       # lazily, batch by batch
+...     use(batch.ids, batch.vectors)
+
+With the default :class:`PipelineConfig` the CHVs equal
+``ChvEncoder().encode_json(payload)`` bit for bit.
+
+With ``config.digest_cache`` set, payloads are looked up by their E9
+payload digest before E1 and only the misses are encoded; with
+``config.dedup`` the sink only receives the first record of each
+distinct CHV (the others are listed in ``pipeline.dedup.aliases``).
+"""
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass, field
+from itertools import islice
+from typing import Iterable, Iterator, Mapping, Sequence
+
+import numpy as np
+from numpy.typing import NDArray
+
+from hydraedge.encoder import (
+    ep0_pre_check,
+    ep1_alias_norm,
+    ep2_w2hv_embed,
+    ep3_role_lookup,
+    ep4_dir_tag,
+    ep5_gamma_gate,
+    ep6_bundle,
+    ep7_delimiter,
+    ep8_sign_post,
+    ep9_qc_digest,
+)
+from hydraedge.encoder.batch import PairBatch, from_payloads
+from hydraedge.encoder.chv_encoder import D
+from hydraedge.encoder.role_registry import compile_registry, default_registry
+from hydraedge.encoder.w2hv_backend import W2HVBackend, get_backend
+
+__all__ = ["PipelineConfig", "EncoderPipeline"]
+
+
+@dataclass(frozen=True)
+class PipelineConfig:
+    """
+    batch_size   : payloads per columnar batch
+    backend      : w2hv backend name (``w2hv_backend.get_backend``)
+    cache_size   : in-process filler LRU size (0 disables it)
+    filler_store : HVStore path stem shared by workers for filler vectors
+                   (None keeps the cache in-process only)
+    directed     : tag edge directions in E4
+    delimit      : add event-group delimiters in E7
+    gamma        : role → γ for the E5 gate (missing roles: 0, no gating)
+    digest_cache : HVStore path stem of the E9 payload-digest → CHV cache
+                   (None encodes every payload)
+    dedup        : keep only the first record of each distinct CHV for the sink
+    roles_tsv    : role registry TSV compiled for E3 / E4 (None: the
+                   built-in ``ROLE_LIST``)
+    """
+
+    batch_size: int = 256
+    backend: str = "hash"
+    cache_size: int = 8192
+    filler_store: str | None = None
+    directed: bool = False
+    delimit: bool = False
+    gamma: Mapping[str, float] = field(default_factory=dict)
+    digest_cache: str | None = None
+    dedup: bool = False
+    roles_tsv: str | None = None
+
+    # fields that change the CHVs – the rest only affect speed or storage
+    _ENCODING_FIELDS = ("directed", "delimit", "gamma")
+
+    def encoding_settings(self) -> dict:
+        settings = asdict(self)
+        return {k: settings[k] for k in self._ENCODING_FIELDS}
+
+
+def _backend_id(backend) -> str:
+    """Name, dimension and seed/model of a w2hv backend (unwrapping caches)."""
+    backend = getattr(backend, "backend", backend)
+    parts = [type(backend).__name__, str(backend.dim)]
+    for attr in ("seed", "model_name"):
+        if hasattr(backend, attr):
+            parts.append(str(getattr(backend, attr)))
+    fn = getattr(backend, "fn", None)
+    if fn is not None:
+        parts.append(getattr(fn, "__qualname__", repr(fn)))
+    return ":".join(parts)
+
+
+class EncoderPipeline:
+    """
+    Parameters
+    ----------
+    config        : :class:`PipelineConfig` (defaults reproduce ``ChvEncoder``)
+    backend       : w2hv backend instance; overrides ``config.backend``
+    sink          : optional E10 sink (``ep10_faiss_sink.FaissSink`` or
+                    ``BufferedFaissSink``; the latter is flushed after
+                    ``stream`` / ``encode``)
+    role_registry : role names for E0 validation; None skips E0 (payloads
+                    are then assumed to be pre-validated)
+    """
+
+    def __init__(self, config: PipelineConfig | None = None, *,
+                 backend: W2HVBackend | None = None, sink=None,
+                 role_registry: Iterable[str] | None = None):
+        self.config = config or PipelineConfig()
+        backend = backend or get_backend(self.config.backend)
+        if self.config.cache_size > 0 or self.config.filler_store:
+            backend = ep2_w2hv_embed.FillerCache(backend, capacity=self.config.cache_size,
+                                                 store=self.config.filler_store)
+        self.backend = backend
+        self.sink = sink
+        self.role_registry = None if role_registry is None else set(role_registry)
+        self.registry = (compile_registry(self.config.roles_tsv)
+                         if self.config.roles_tsv else default_registry())
+        self.roles: list[str] = list(self.registry.roles)
+        self.dim = D
+        self.plans = self.registry.plans
+        gamma = np.array([self.config.gamma.get(r, 0.0) for r in self.roles])
+        self.gamma = gamma if gamma.any() else None
+        self.salt = ep9_qc_digest.config_salt(
+            self.config.encoding_settings(), _backend_id(backend), self.registry.version)
+        self.digest_cache = (ep9_qc_digest.DigestCache(self.config.digest_cache, self.dim)
+                             if self.config.digest_cache else None)
+        self.dedup = ep9_qc_digest.VectorDedup() if self.config.dedup else None
+        self.next_id = 0                # first record id of the next stream / encode
+
+    # ── one batch ────────────────────────────────────────────────────────
+    def encode_batch(self, payloads: Sequence[dict], ids: Sequence[int] | None = None,
+                     out: NDArray[np.int8] | None = None) -> PairBatch:
+        """
+        Run E1 – E10 on one list of payloads; CHVs land in ``batch.vectors``.
+        Without *ids* the records are numbered from ``self.next_id``.
+        """
+        if ids is None:
+            ids = np.arange(self.next_id, self.next_id + len(payloads), dtype=np.int64)
+            self.next_id += len(payloads)
+        if self.role_registry is not None:
+            for payload in payloads:
+                ep0_pre_check.validate(payload, self.role_registry)
+        cfg = self.config
+        digests = ep9_qc_digest.payload_digests(payloads, self.salt)
+        rows = (self.digest_cache.lookup(digests) if self.digest_cache is not None
+                else np.full(len(payloads), -1, dtype=np.int64))
+        batch = from_payloads(payloads, ids, skip=rows >= 0)
+        batch.payload_digests, batch.cache_rows = digests, rows
+        ep1_alias_norm.run(batch)
+        ep3_role_lookup.run(batch, self.registry)    # drop unknown roles before embedding
+        ep2_w2hv_embed.run(batch, self.backend)
+        ep4_dir_tag.run(batch, directed=cfg.directed)
+        ep5_gamma_gate.run(batch, self.plans, self.gamma)
+        ep6_bundle.run(batch)
+        ep7_delimiter.run(batch, enabled=cfg.delimit)
+        ep8_sign_post.run(batch, out=out)
+        ep9_qc_digest.run(batch, self.digest_cache, self.dedup)
+        if self.sink is not None:
+            self.sink.write(batch)
+        return batch
+
+    # ── streaming ────────────────────────────────────────────────────────
+    def stream(self, payloads: Iterable[dict], *,
+               start_id: int | None = None) -> Iterator[PairBatch]:
+        """
+        Encode *payloads* lazily; record ids count up from *start_id*
+        (None: from ``self.next_id``, so repeated calls never reuse ids).
+        """
+        it = iter(payloads)
+        if start_id is not None:
+            self.next_id = start_id
+        while chunk := list(islice(it, self.config.batch_size)):
+            yield self.encode_batch(chunk)
+        self._flush_sink()
+
+    def encode(self, payloads: Sequence[dict], *,
+               start_id: int | None = None) -> NDArray[np.int8]:
+        """
+        (N, D) int8 CHVs for a finite sequence, written into one buffer;
+        record ids are numbered as in :meth:`stream`.
+        """
+        out = np.empty((len(payloads), self.dim), dtype=np.int8)
+        if start_id is not None:
+            self.next_id = start_id
+        size = self.config.batch_size
+        for lo in range(0, len(payloads), size):
+            chunk = payloads[lo:lo + size]
+            self.encode_batch(chunk, out=out[lo:lo + len(chunk)])
+        self._flush_sink()
+        return out
+
+    def _flush_sink(self) -> None:
+        """Drain a buffered sink (``BufferedFaissSink``) at the end of a run."""
+        flush = getattr(self.sink, "flush", None)
+        if flush is not None:
+            flush()
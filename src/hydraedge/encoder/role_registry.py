@@ -0,0 +1,152 @@
+# ── hydraedge.encoder.role_registry ────────────────────────────────────────
+"""
+Compiled role registry for stages E0 / E3 / E4.
+
+A registry is an ordered list of role names – the built-in
+``role_vectors.ROLE_LIST`` or the first column of a ``roles.tsv``.
+Compiling it once yields
+
+  roles      : role names, position = integer role id
+  vectors    : (R, D) int8 role vectors (``ROLE_VECS`` where the name is
+               known, otherwise a deterministic ``<role:NAME>`` vector)
+  dir_matrix : contiguous (R · 3, D) int8 matrix, row ``role_id · 3 + (dir + 1)``
+               = the role already bound with its direction tag (E4)
+  plans      : one ``BindPlan`` per ``dir_matrix`` row
+
+so after one string → id lookup per batch (E3) both tagging and binding
+are plain array indexing.  ``dir_matrix`` is cached on disk under
+*cache_dir*, else ``HYDRA_ROLE_CACHE`` (default ``~/.cache/hydraedge/roles``),
+and memory-mapped by later processes.  The cache key hashes everything
+the matrix depends on: the TSV bytes, the role vectors themselves (so a
+different ``HYDRA_HV_STORE`` or seed misses), D, the direction keys and
+``_COMPILE_VERSION``.
+"""
+from __future__ import annotations
+
+import hashlib
+from functools import cached_property
+from pathlib import Path
+from typing import Iterator, Sequence
+
+import numpy as np
+from numpy.typing import NDArray
+
+from hydraedge.encoder.chv_encoder import D, ROLES, filler_vec, role_vec
+from hydraedge.encoder.ep4_dir_tag import _DIR_KEYS, N_DIRS, direction_matrix
+from hydraedge.kernel.bind_ops import BindPlan
+from hydraedge.kernel.npy_cache import cached_npy, resolve_cache_dir
+
+__all__ = ["CompiledRegistry", "read_roles", "compile_registry", "default_registry"]
+
+_COMPILE_VERSION = 2                 # bump when direction_matrix / _vector change
+
+
+def _cache_dir(cache_dir: str | Path | None) -> Path:
+    return resolve_cache_dir(cache_dir, "HYDRA_ROLE_CACHE", "roles")
+
+
+def read_roles(path: str | Path) -> list[str]:
+    """Role names from the first column of a TSV (order kept, duplicates dropped)."""
+    text = Path(path).read_text(encoding="utf-8")
+    return list(dict.fromkeys(line.split("\t", 1)[0].strip()
+                              for line in text.splitlines() if line.strip()))
+
+
+def _vector(role: str, dim: int) -> NDArray[np.int8]:
+    if role in role_vec and dim == D:
+        return role_vec[role]
+    return filler_vec(f"<role:{role}>", dim)
+
+
+def _cache_key(source: bytes, roles: Sequence[str], dim: int) -> str:
+    h = hashlib.blake2b(digest_size=8)
+    h.update(f"v{_COMPILE_VERSION}|D={dim}|dirs={sorted(_DIR_KEYS.items())}|".encode("utf-8"))
+    h.update(source)
+    if dim == D:                     # other dims use filler_vec only (covered by the version)
+        for r in roles:
+            if r in role_vec:
+                h.update(np.ascontiguousarray(role_vec[r]).tobytes())
+    return h.hexdigest()
+
+
+class CompiledRegistry:
+    """Ordered role names with their precomputed role × direction vectors."""
+
+    def __init__(self, roles: Sequence[str], dir_matrix: NDArray[np.int8], version: str):
+        if dir_matrix.shape[0] != len(roles) * N_DIRS:
+            raise ValueError(f"dir_matrix has {dir_matrix.shape[0]} rows for {len(roles)} roles")
+        self.roles: tuple[str, ...] = tuple(roles)
+        self.dir_matrix = dir_matrix
+        self.version = version
+        self.dim = dir_matrix.shape[1]
+        names = np.asarray(self.roles, dtype=np.str_)
+        self._order = np.argsort(names)
+        self._sorted = names[self._order]
+        self._id = {r: i for i, r in enumerate(self.roles)}
+
+    def __len__(self) -> int:
+        return len(self.roles)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.roles)
+
+    def __contains__(self, role: object) -> bool:
+        return role in self._id
+
+    def id(self, role: str) -> int:
+        """Integer id of *role* (KeyError when unknown)."""
+        return self._id[role]
+
+    def ids(self, roles: NDArray[np.str_]) -> NDArray[np.int64]:
+        """Role id of every role string, −1 where unknown."""
+        roles = np.asarray(roles, dtype=np.str_)
+        if roles.size == 0 or not self.roles:
+            return np.full(roles.shape, -1, dtype=np.int64)
+        pos = np.minimum(np.searchsorted(self._sorted, roles), len(self._sorted) - 1)
+        return np.where(self._sorted[pos] == roles, self._order[pos], -1).astype(np.int64)
+
+    @property
+    def vectors(self) -> NDArray[np.int8]:
+        """(R, D) plain role vectors – the neutral-direction rows."""
+        return self.dir_matrix[1::N_DIRS]
+
+    @cached_property
+    def plans(self) -> list[BindPlan]:
+        """Bind plans indexed by ``plan_id`` (``dir_matrix`` row)."""
+        return [BindPlan(row) for row in self.dir_matrix]
+
+
+def _compile(roles: list[str], key: str, dim: int,
+             cache_dir: str | Path | None) -> CompiledRegistry:
+    path = _cache_dir(cache_dir) / f"roles_{key}_{dim}.npy"
+    matrix = cached_npy(path, lambda: direction_matrix([_vector(r, dim) for r in roles]))
+    if matrix.shape != (len(roles) * N_DIRS, dim):
+        raise ValueError(f"stale role cache {path}: shape {matrix.shape}")
+    return CompiledRegistry(roles, matrix, key)
+
+
+def compile_registry(path: str | Path | None = None, *, dim: int = D,
+                     cache_dir: str | Path | None = None) -> CompiledRegistry:
+    """
+    Compile the registry in the TSV at *path* (None: the built-in roles).
+    The cache key – and ``CompiledRegistry.version`` – hashes the TSV
+    bytes and the role vectors, so editing either recompiles it.
+    """
+    if path is None:
+        roles = list(ROLES)
+        source = "\n".join(roles).encode("utf-8")
+    else:
+        source = Path(path).read_bytes()
+        roles = read_roles(path)
+    return _compile(roles, _cache_key(source, roles, dim), dim, cache_dir)
+
+
+_DEFAULT: dict[Path, CompiledRegistry] = {}
+
+
+def default_registry(cache_dir: str | Path | None = None) -> CompiledRegistry:
+    """The compiled built-in registry, shared by every caller using the same cache."""
+    cache_dir = _cache_dir(cache_dir)
+    if cache_dir not in _DEFAULT:
+        _DEFAULT[cache_dir] = compile_registry(cache_dir=cache_dir)
+    return _DEFAULT[cache_dir]
@@ -0,0 +1,45 @@
+# ── hydraedge.encoder.role_vectors ─────────────────────────────────────────
+"""
+Fixed ±1 role hyper-vectors for the CHV encoder.
+
+The vectors are drawn from ``default_rng(42)`` so every worker agrees on
+them; ``sitecustomize`` installs an identical stand-in when this module
+cannot be imported.  When ``HYDRA_HV_STORE`` names a directory, they are
+persisted once in ``<dir>/roles`` (:class:`~hydraedge.kernel.hv_store.HVStore`)
+and later processes memory-map those rows instead of regenerating them.
+"""
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import numpy as np
+
+__all__ = ["D", "ROLE_LIST", "H", "ROLE_VECS"]
+
+D = 4096
+
+ROLE_LIST = [
+    "Subject", "Predicate", "Object",
+    "Event", "Tense", "Attr",
+    "IndirectObject", "Type", "Source", "Date", "Venue",
+]
+
+
+def _generate() -> np.ndarray:
+    rng = np.random.default_rng(42)
+    return rng.choice([-1, 1], size=(len(ROLE_LIST), D), replace=True).astype(np.int8)
+
+
+def _load(store_dir: str | None) -> np.ndarray:
+    if not store_dir:
+        return _generate()
+    from hydraedge.kernel.hv_store import HVStore
+    store = HVStore(Path(store_dir) / "roles", dim=D)
+    if not all(r in store for r in ROLE_LIST):
+        store.put_many(ROLE_LIST, _generate())
+    return store.get_many(ROLE_LIST)
+
+
+H = _load(os.getenv("HYDRA_HV_STORE"))
+ROLE_VECS = {r: H[i] for i, r in enumerate(ROLE_LIST)}
@@ -0,0 +1,241 @@
+# ── hydraedge.encoder.w2hv_backend ─────────────────────────────────────────
+"""
+Word → hyper-vector backends used by stage E2.
+
+A backend turns a batch of normalised filler keys into a (U, D) int8 ±1
+matrix in one call::
+
+    backend.embed_many(["dog", "chase"])   # → (2, D) int8
+
+``KeyedBackend`` lifts any per-key function – by default
+:func:`~hydraedge.encoder.chv_encoder.filler_vec` – to that interface, so
+the batched pipeline reproduces ``ChvEncoder`` exactly.
+
+``PhiloxBackend`` needs no model and no shared state: each key's 64-bit
+BLAKE2b digest is the key of a Philox4x32-10 counter-based generator,
+and the D bits of its vector are the outputs for counters 0 … ⌈D/128⌉−1.
+Every (key, counter) block is independent, so a whole batch is generated
+with a handful of array operations, and a key maps to the same vector in
+every process, on every machine, whatever batch it arrives in.
+
+``SemanticBackend`` is the batched form of the legacy per-token
+``sign(PROJ @ MiniLM(token))``: unique keys are embedded in large model
+batches, projected by one matmul against a memory-mapped (D, E) matrix
+and binarised (ties → +1).
+
+Backends are looked up by name with :func:`get_backend`.
+"""
+from __future__ import annotations
+
+import hashlib
+from pathlib import Path
+from typing import Callable, Protocol, Sequence
+
+import numpy as np
+from numpy.typing import NDArray
+
+from hydraedge.encoder.chv_encoder import D, filler_vec
+from hydraedge.kernel.bundles import _sign_with_tiebreak
+from hydraedge.kernel.npy_cache import cached_npy, resolve_cache_dir
+from hydraedge.kernel.parallel import run_chunks
+
+__all__ = ["W2HVBackend", "KeyedBackend", "PhiloxBackend", "philox4x32",
+           "SemanticBackend", "projection_matrix", "BACKENDS", "get_backend"]
+
+
+class W2HVBackend(Protocol):
+    dim: int
+
+    def embed_many(self, keys: Sequence[str]) -> NDArray[np.int8]:
+        """(len(keys), dim) int8 ±1 filler vectors."""
+
+
+class KeyedBackend:
+    """Batch adapter around a per-key ``fn(key, dim) -> (dim,) int8``."""
+
+    def __init__(self, fn: Callable[[str, int], NDArray[np.int8]] | None = None,
+                 dim: int = D):
+        self.fn = fn or filler_vec
+        self.dim = dim
+
+    def embed_many(self, keys: Sequence[str]) -> NDArray[np.int8]:
+        out = np.empty((len(keys), self.dim), dtype=np.int8)
+        for i, key in enumerate(keys):
+            out[i] = self.fn(str(key), self.dim)
+        return out
+
+
+# ── counter-based backend ────────────────────────────────────────────────
+_M0, _M1 = np.uint64(0xD2511F53), np.uint64(0xCD9E8D57)
+_W0, _W1 = np.uint64(0x9E3779B9), np.uint64(0xBB67AE85)
+_LO32 = np.uint64(0xFFFFFFFF)
+_SHIFT32 = np.uint64(32)
+
+
+def philox4x32(counter: NDArray[np.uint64], key: NDArray[np.uint64],
+               rounds: int = 10) -> NDArray[np.uint64]:
+    """
+    Philox4x32 (Salmon et al., SC'11) over arrays.
+
+    *counter* is (…, 4) and *key* (…, 2), both holding 32-bit words in
+    uint64 lanes (so the 32×32→64 products never overflow); they
+    broadcast against each other.  Returns (…, 4) 32-bit words.
+    """
+    c0, c1, c2, c3 = (counter[..., i] for i in range(4))
+    k0, k1 = key[..., 0], key[..., 1]
+    for _ in range(rounds):
+        p0 = _M0 * c0
+        p1 = _M1 * c2
+        c0, c1, c2, c3 = ((p1 >> _SHIFT32) ^ c1 ^ k0, p1 & _LO32,
+                          (p0 >> _SHIFT32) ^ c3 ^ k1, p0 & _LO32)
+        k0 = (k0 + _W0) & _LO32
+        k1 = (k1 + _W1) & _LO32
+    return np.stack(np.broadcast_arrays(c0, c1, c2, c3), axis=-1)
+
+
+class PhiloxBackend:
+    """
+    Digest-seeded Philox filler vectors (see module docstring).
+
+    Parameters
+    ----------
+    dim   : vector length D
+    seed  : 32-bit stream id mixed into every counter – a different seed
+            gives an independent codebook
+    chunk : keys generated per vectorised step (bounds temporaries)
+    """
+
+    def __init__(self, dim: int = D, seed: int = 0, chunk: int = 4096):
+        self.dim = dim
+        self.seed = seed & 0xFFFFFFFF
+        self.chunk = chunk
+        n_blocks = -(-dim // 128)                  # 128 bits per Philox call
+        self._counters = np.zeros((n_blocks, 4), dtype=np.uint64)
+        self._counters[:, 0] = np.arange(n_blocks, dtype=np.uint64)
+        self._counters[:, 1] = self.seed
+
+    @staticmethod
+    def key_words(keys: Sequence[str]) -> NDArray[np.uint64]:
+        """(U, 2) Philox keys: the 64-bit BLAKE2b digest of each key, split."""
+        digests = b"".join(hashlib.blake2b(str(k).encode("utf-8"), digest_size=8).digest()
+                           for k in keys)
+        return np.frombuffer(digests, dtype="<u4").astype(np.uint64).reshape(-1, 2)
+
+    def embed_many(self, keys: Sequence[str]) -> NDArray[np.int8]:
+        out = np.empty((len(keys), self.dim), dtype=np.int8)
+        words = self.key_words(keys)
+        for lo in range(0, len(keys), self.chunk):
+            key = words[lo:lo + self.chunk, None, :]             # (u, 1, 2)
+            blocks = philox4x32(self._counters[None, :, :], key)  # (u, n_blocks, 4)
+            as_bytes = blocks.astype("<u4").reshape(len(key), -1).view(np.uint8)
+            bits = np.unpackbits(as_bytes, axis=1, count=self.dim, bitorder="little")
+            np.subtract(2 * bits, 1, out=out[lo:lo + self.chunk], casting="unsafe")
+        return out
+
+
+# ── semantic backend ─────────────────────────────────────────────────────
+_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+
+
+def projection_matrix(dim: int = D, emb_dim: int = 384, seed: int = 42,
+                      cache_dir: str | Path | None = None) -> NDArray[np.float32]:
+    """
+    Memory-mapped (dim, emb_dim) projection, drawn like the legacy ``A.npy``
+    (row-normalised standard normal, ``default_rng(seed)``) on first use,
+    under *cache_dir*, else ``HYDRA_W2HV_CACHE``, else ``~/.cache``.
+    """
+    def build() -> NDArray[np.float32]:
+        rng = np.random.default_rng(seed)
+        proj = rng.standard_normal((dim, emb_dim)).astype(np.float32)
+        proj /= np.linalg.norm(proj, axis=1, keepdims=True) + 1e-6
+        return proj
+
+    path = (resolve_cache_dir(cache_dir, "HYDRA_W2HV_CACHE", "w2hv")
+            / f"proj_{dim}x{emb_dim}_seed{seed}.npy")
+    return cached_npy(path, build)
+
+
+class SemanticBackend:
+    """
+    Embedding-model fillers: ``sign(PROJ @ embed(key))`` in batches.
+
+    Parameters
+    ----------
+    encode     : ``texts -> (n, E) float32`` normalised embeddings; defaults
+                 to a lazily loaded sentence-transformers *model*
+    dim        : output dimensionality D
+    batch_size : texts per model call
+    n_threads  : threads for the projection (``kernel.parallel``); the
+                 result does not depend on it
+    proj       : (D, E) projection – an array or an ``.npy`` path (e.g. a
+                 legacy ``A.npy``); default :func:`projection_matrix`
+    """
+
+    def __init__(self, encode: Callable[[list[str]], NDArray[np.float32]] | None = None, *,
+                 model: str = _MODEL, dim: int = D, batch_size: int = 256,
+                 n_threads: int | None = None,
+                 proj: NDArray[np.float32] | str | Path | None = None,
+                 cache_dir: str | Path | None = None):
+        self.dim = dim
+        self.batch_size = batch_size
+        self.n_threads = n_threads
+        self.model_name = model
+        self._encode = encode
+        self._proj = proj
+        self._cache_dir = cache_dir
+
+    @property
+    def encode(self) -> Callable[[list[str]], NDArray[np.float32]]:
+        if self._encode is None:
+            from sentence_transformers import SentenceTransformer   # optional dependency
+            model = SentenceTransformer(self.model_name)
+            self._encode = lambda texts: model.encode(
+                texts, batch_size=self.batch_size, normalize_embeddings=True,
+                convert_to_numpy=True)
+        return self._encode
+
+    @property
+    def proj(self) -> NDArray[np.float32]:
+        if self._proj is None:
+            self._proj = projection_matrix(self.dim, cache_dir=self._cache_dir)
+        elif isinstance(self._proj, (str, Path)):
+            self._proj = np.load(self._proj, mmap_mode="r")
+        return self._proj
+
+    def embed_one(self, key: str) -> NDArray[np.int8]:
+        """Per-token reference path (one model call, one mat-vec)."""
+        e = np.asarray(self.encode([key]), dtype=np.float32)[0]
+        return _sign_with_tiebreak(self.proj @ e)
+
+    def embed_many(self, keys: Sequence[str]) -> NDArray[np.int8]:
+        uniq, inverse = np.unique(np.asarray(keys, dtype=np.str_), return_inverse=True)
+        texts = uniq.tolist()
+        emb = np.empty((len(texts), self.proj.shape[1]), dtype=np.float32)
+        for lo in range(0, len(texts), self.batch_size):
+            emb[lo:lo + self.batch_size] = self.encode(texts[lo:lo + self.batch_size])
+
+        signs = np.empty((len(texts), self.dim), dtype=np.int8)
+        proj_t = np.asarray(self.proj).T                    # (E, D), read once
+
+        def job(lo, hi):
+            np.greater_equal(emb[lo:hi] @ proj_t, 0, out=signs[lo:hi], casting="unsafe")
+
+        run_chunks(job, len(texts), chunk_rows=self.batch_size, n_threads=self.n_threads)
+        signs *= 2
+        signs -= 1
+        return signs[inverse.reshape(-1)]
+
+
+BACKENDS: dict[str, Callable[..., W2HVBackend]] = {
+    "hash": KeyedBackend,
+    "philox": PhiloxBackend,
+    "semantic": SemanticBackend,
+}
+
+
+def get_backend(name: str = "hash", **kwargs) -> W2HVBackend:
+    """Instantiate a registered backend by name."""
+    try:
+        return BACKENDS[name](**kwargs)
+    except KeyError:
+        raise ValueError(f"unknown w2hv backend {name!r}; choose from {sorted(BACKENDS)}") from None
@@ -1,5 +1,11 @@
 # src/hydraedge/index/__init__.py
 
-from .faiss_index import FaissIndex
+from .hamming_index import HammingIndex
 
-__all__ = ["FaissIndex"]
+__all__ = ["HammingIndex"]
+
+try:                                    # faiss is optional (slim CPU images)
+    from .faiss_index import FaissIndex
+    __all__.append("FaissIndex")
+except ModuleNotFoundError:
+    pass
@@ -32,15 +32,20 @@ class FaissIndex:
     # ──────────────────────────────────────────────────────────────────────
     # public api
     # ──────────────────────────────────────────────────────────────────────
+    @property
+    def ntotal(self) -> int:
+        return self._index.ntotal
+
     def add(self, vecs: np.ndarray, ids: list[int] | None = None) -> None:
-        """Add `vecs` (n×d, float32).  If ids omitted, uses [0…n−1]."""
+        """Add `vecs` (n×d, float32).  If ids omitted, continues from ntotal."""
+        vecs = np.ascontiguousarray(vecs, dtype=np.float32)
         if ids is not None:
             ids_np = np.array(ids, dtype=np.int64)
             if len(ids_np) != len(vecs):
                 raise ValueError("ids length mismatch")
-            self._index.add_with_ids(vecs, ids_np)
         else:
-            self._index.add(vecs)
+            ids_np = np.arange(self.ntotal, self.ntotal + len(vecs), dtype=np.int64)
+        self._index.add_with_ids(vecs, ids_np)
 
     def search(self, queries: np.ndarray, k: int = 10) -> Tuple[np.ndarray, np.ndarray]:
         """Return (dists, ids) for each query row."""
@@ -65,9 +70,10 @@ class FaissIndex:
     # internal helpers
     # ──────────────────────────────────────────────────────────────────────
     def _make_index(self) -> faiss.Index:
-        cpu_index = faiss.IndexHNSWFlat(self.dim, 32, self.metric)
-        cpu_index.hnsw.efConstruction = 400
-        return self._maybe_to_gpu(cpu_index)
+        hnsw = faiss.IndexHNSWFlat(self.dim, 32, self.metric)
+        hnsw.hnsw.efConstruction = 400
+        # plain HNSW has no add_with_ids; the id map stores caller ids
+        return self._maybe_to_gpu(faiss.IndexIDMap2(hnsw))
 
     def _maybe_to_gpu(self, idx: faiss.Index) -> faiss.Index:
         if self.gpu:
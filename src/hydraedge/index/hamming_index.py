@@ -0,0 +1,143 @@
+"""
+Exact Hamming k-NN over bit-packed ±1 CHVs – pure NumPy, no faiss.
+
+▪ metric        – "hamming" (distance, ascending) or "cosine"
+                  (1 − 2·ham/D, descending; same ranking)
+▪ n_threads     – database chunks are scored on a thread pool
+                  (XOR / popcount release the GIL); each query block's
+                  top-k is merged as its chunks finish.  Defaults to
+                  ``kernel.parallel.get_num_threads()``
+▪ index_path    – .npz file produced by write() / consumed by read()
+
+Gives exact ground truth for recall measurements of the ANN index and a
+search path for slim CPU containers without faiss.  The public API
+mirrors :class:`FaissIndex` (``add`` / ``search`` / ``write`` / ``read``).
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Tuple
+
+import numpy as np
+
+from hydraedge.kernel.item_memory import blocked_topk
+from hydraedge.kernel.packed import _n_words, _popcount, pack_bits
+from hydraedge.kernel.parallel import chunk_bounds
+
+__all__ = ["HammingIndex"]
+
+_METRICS = ("hamming", "cosine")
+_CHUNK_BYTES = 64 * 2**20          # XOR temporaries per (query-block, db-chunk) job
+_MIN_CAPACITY = 1024               # rows allocated by the first add()
+
+
+class HammingIndex:
+    def __init__(self, dim: int, metric: str = "hamming", n_threads: int | None = None):
+        if metric not in _METRICS:
+            raise ValueError(f"metric must be one of {list(_METRICS)}")
+        self.dim = dim
+        self.metric_name = metric
+        self.n_threads = n_threads      # None: kernel.parallel.get_num_threads()
+        # rows live in buffers with spare capacity; the first _n are valid
+        self._word_buf = np.empty((0, _n_words(dim)), dtype=np.uint64)
+        self._id_buf = np.empty(0, dtype=np.int64)
+        self._n = 0
+
+    @property
+    def ntotal(self) -> int:
+        return self._n
+
+    @property
+    def _words(self) -> np.ndarray:
+        return self._word_buf[:self._n]
+
+    @property
+    def _ids(self) -> np.ndarray:
+        return self._id_buf[:self._n]
+
+    def _reserve(self, n: int) -> None:
+        """Grow the buffers geometrically so they hold at least *n* rows."""
+        if n <= len(self._id_buf):
+            return
+        cap = max(n, 2 * len(self._id_buf), _MIN_CAPACITY)
+        words = np.empty((cap, self._word_buf.shape[1]), dtype=np.uint64)
+        ids = np.empty(cap, dtype=np.int64)
+        words[:self._n] = self._words
+        ids[:self._n] = self._ids
+        self._word_buf, self._id_buf = words, ids
+
+    # ──────────────────────────────────────────────────────────────────────
+    # public api
+    # ──────────────────────────────────────────────────────────────────────
+    def _as_words(self, vecs: np.ndarray) -> np.ndarray:
+        vecs = np.atleast_2d(np.asarray(vecs))
+        if vecs.dtype == np.uint64 and vecs.shape[1] == self._words.shape[1]:
+            return vecs                                   # already packed
+        if vecs.shape[1] != self.dim:
+            raise ValueError(f"expected dim={self.dim}, got {vecs.shape[1]}")
+        return pack_bits(np.where(vecs >= 0, 1, -1).astype(np.int8))
+
+    def add(self, vecs: np.ndarray, ids: list[int] | None = None) -> None:
+        """
+        Add `vecs` – (n×d) ±1 / real-valued rows (sign is kept) or packed
+        uint64 words.  If ids omitted, uses [ntotal…ntotal+n−1].
+        """
+        words = self._as_words(vecs)
+        if ids is not None:
+            ids_np = np.array(ids, dtype=np.int64)
+            if len(ids_np) != len(words):
+                raise ValueError("ids length mismatch")
+        else:
+            ids_np = np.arange(self.ntotal, self.ntotal + len(words), dtype=np.int64)
+        n0, n1 = self._n, self._n + len(words)
+        self._reserve(n1)
+        self._word_buf[n0:n1] = words
+        self._id_buf[n0:n1] = ids_np
+        self._n = n1
+
+    def search(self, queries: np.ndarray, k: int = 10) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Return (dists, ids) for each query row, best first.  Rows are padded
+        with id −1 (and ±inf distance) when the index holds fewer than k.
+        """
+        q = self._as_words(queries)
+        n_q, n_w = q.shape
+        dist = np.full((n_q, k), np.inf, dtype=np.float32)
+        ids = np.full((n_q, k), -1, dtype=np.int64)
+        if self.ntotal == 0:
+            return self._finish(dist, ids)
+
+        q_block = max(1, min(n_q, 256))
+        db_chunk = max(1, _CHUNK_BYTES // (q_block * n_w * 8))
+        words = self._words
+
+        def score(q0, q1, lo, hi):                         # −distance: higher is better
+            return -_popcount(q[q0:q1, None, :] ^ words[None, lo:hi, :]).astype(np.float32)
+
+        kk = min(k, self.ntotal)
+        rows, neg = blocked_topk(score, n_q, chunk_bounds(self.ntotal, db_chunk), kk,
+                                 query_rows=q_block, n_threads=self.n_threads)
+        dist[:, :kk] = -neg
+        ids[:, :kk] = self._ids[rows]
+        return self._finish(dist, ids)
+
+    def _finish(self, dist: np.ndarray, ids: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        if self.metric_name == "cosine":
+            dist = 1.0 - 2.0 * dist / self.dim               # inf → −inf padding
+        return dist.astype(np.float32), ids
+
+    def write(self, path: str | Path) -> None:
+        path = Path(path)
+        with open(path, "wb") as fh:                          # keep the exact name
+            np.savez(fh, words=self._words, ids=self._ids,
+                     dim=self.dim, metric=self.metric_name)
+
+    @classmethod
+    def read(cls, path: str | Path, n_threads: int | None = None) -> "HammingIndex":
+        with np.load(path) as data:
+            obj = cls(int(data["dim"]), str(data["metric"]), n_threads)
+            obj._word_buf = data["words"]
+            obj._id_buf = data["ids"]
+            obj._n = len(obj._id_buf)
+        return obj
@@ -23,12 +23,25 @@ Binding does two things:
 
 Because cyclic shifts compose by simple addition, this gives us both
 associativity and an easy unbind.
+
+Batched variants
+----------------
+``bind_many`` / ``unbind_many`` apply the same algebra to the rows of an
+(N, D) int8 matrix.  Headers are decoded / encoded with one vectorised
+pass over the H leading columns, and the per-row cyclic shifts are done
+with a single gather, so the output is bit-identical to calling the
+scalar functions row by row.
+
+Role vectors never change inside a process, so ``BindPlan`` compiles one
+role into k_r, a gather index for the body and a header lookup table
+over every possible filler header; binding through a plan is a single
+``take`` into a caller-provided buffer.
 """
 
 from __future__ import annotations
 
 import math
-from typing import Tuple
+from typing import Mapping, Tuple
 
 import numpy as np
 from numpy.typing import NDArray
@@ -51,6 +64,12 @@ def _encode_shift(k: int, h: int) -> NDArray[np.int8]:
                     dtype=np.int8)
 
 
+def _encode_shifts(ks: NDArray[np.int64], h: int) -> NDArray[np.int8]:
+    """Vectorised ``_encode_shift``: (N,) shifts → (N, h) ±1 headers."""
+    bits = (ks[:, None] >> np.arange(h, dtype=np.int64)) & 1
+    return (2 * bits - 1).astype(np.int8)
+
+
 def _decode_shift(vec: NDArray[np.int8]) -> int:
     """Decode the header (first H bits) back to an int k."""
     n = vec.size
@@ -62,6 +81,43 @@ def _decode_shift(vec: NDArray[np.int8]) -> int:
     return k % mod                           # always < body_len
 
 
+def _decode_shifts(mat: NDArray[np.int8]) -> NDArray[np.int64]:
+    """Vectorised ``_decode_shift`` over the rows of an (N, D) matrix."""
+    h, body_len, mod = _params(mat.shape[-1])
+    weights = np.int64(1) << np.arange(h, dtype=np.int64)
+    k = np.where(mat[..., :h] == 1, weights, 0).sum(axis=-1)
+    return k % mod
+
+
+def _roll_rows(body: NDArray[np.int8],
+               shifts: NDArray[np.int64] | int) -> NDArray[np.int8]:
+    """
+    Cyclic right-shift of every row of *body* in one gather.
+
+    *shifts* is either a scalar (same roll for all rows) or an (N,) array
+    of per-row rolls; ``np.roll(row, k)`` semantics in both cases.
+    """
+    body_len = body.shape[1]
+    cols = np.arange(body_len, dtype=np.int64)
+    if np.ndim(shifts) == 0:                 # take() is far faster than body[:, idx]
+        return np.take(body, (cols - int(shifts)) % body_len, axis=1)
+    idx = (cols[None, :] - np.asarray(shifts)[:, None]) % body_len
+    return np.take_along_axis(body, idx, axis=1)
+
+
+def _check_batch(mat: NDArray[np.int8],
+                 other: NDArray[np.int8]) -> NDArray[np.int8]:
+    """Validate an (N, D) batch against a (D,) or (N, D) partner."""
+    if mat.ndim != 2:
+        raise ValueError(f"expected an (N, D) matrix, got shape {mat.shape}")
+    if other.ndim == 1:
+        if other.shape[0] != mat.shape[1]:
+            raise ValueError("vector length mismatch")
+    elif other.shape != mat.shape:
+        raise ValueError(f"shape mismatch: {other.shape} vs {mat.shape}")
+    return mat
+
+
 # ────────────────────────── public API ────────────────────────────────────
 
 
@@ -121,3 +177,149 @@ def unbind(bound_vec: NDArray[np.int8],
     body = np.roll(bound_vec[h:], -k_r)      # inverse shift
 
     return np.concatenate((header, body)).astype(np.int8)
+
+
+def bind_many(role_vecs: NDArray[np.int8],
+              filler_vecs: NDArray[np.int8],
+              out: NDArray[np.int8] | None = None) -> NDArray[np.int8]:
+    """
+    Row-wise ``bind`` over a batch.
+
+    Parameters
+    ----------
+    role_vecs   : (D,) or (N, D) int8 ±1.  A single role is broadcast
+                  against every filler row.
+    filler_vecs : (N, D) int8 ±1.
+    out         : optional (N, D) int8 buffer to write the result into.
+
+    Returns
+    -------
+    bound : (N, D) int8, row *i* equal to ``bind(role_i, filler_i)``.
+    """
+    role_vecs = np.asarray(role_vecs)
+    filler_vecs = _check_batch(np.asarray(filler_vecs), role_vecs)
+    n, d = filler_vecs.shape
+    h, body_len, mod = _params(d)
+
+    k_r = _decode_shifts(role_vecs)          # scalar or (N,)
+    k_f = _decode_shifts(filler_vecs)
+    k_new = (k_r + k_f) % mod
+
+    if out is None:
+        out = np.empty((n, d), dtype=np.int8)
+    out[:, :h] = _encode_shifts(k_new, h)
+    out[:, h:] = _roll_rows(filler_vecs[:, h:], k_r)
+    return out
+
+
+def unbind_many(bound_vecs: NDArray[np.int8],
+                role_vecs: NDArray[np.int8],
+                out: NDArray[np.int8] | None = None) -> NDArray[np.int8]:
+    """
+    Row-wise ``unbind`` over a batch.
+
+    Parameters
+    ----------
+    bound_vecs : (N, D) int8 ±1, e.g. output of ``bind_many``.
+    role_vecs  : (D,) or (N, D) int8 ±1 (broadcast like ``bind_many``).
+    out        : optional (N, D) int8 buffer to write the result into.
+
+    Returns
+    -------
+    fillers : (N, D) int8, row *i* equal to ``unbind(bound_i, role_i)``.
+    """
+    role_vecs = np.asarray(role_vecs)
+    bound_vecs = _check_batch(np.asarray(bound_vecs), role_vecs)
+    n, d = bound_vecs.shape
+    h, body_len, mod = _params(d)
+
+    k_r = _decode_shifts(role_vecs)
+    k_b = _decode_shifts(bound_vecs)
+    k_f = (k_b - k_r) % mod
+
+    if out is None:
+        out = np.empty((n, d), dtype=np.int8)
+    out[:, :h] = _encode_shifts(k_f, h)
+    out[:, h:] = _roll_rows(bound_vecs[:, h:], -k_r)
+    return out
+
+
+# ────────────────────────── compiled role plans ───────────────────────────
+
+
+class BindPlan:
+    """
+    Pre-compiled ``bind`` / ``unbind`` for one fixed role vector.
+
+    Attributes
+    ----------
+    k_r        : decoded role shift
+    gather     : (D,) index – ``filler[gather]`` is the bound vector up to
+                 its header (identity on the H header columns)
+    ungather   : (D,) index for the inverse roll used by ``unbind``
+    header_lut : (2**H, H) int8 – row k is the bound header for a filler
+                 whose *raw* header value is k
+    unbind_lut : (2**H, H) int8 – same for ``unbind``
+    """
+
+    __slots__ = ("dim", "h", "k_r", "gather", "ungather",
+                 "header_lut", "unbind_lut", "_weights")
+
+    def __init__(self, role_vec: NDArray[np.int8]):
+        role_vec = np.asarray(role_vec)
+        if role_vec.ndim != 1:
+            raise ValueError("BindPlan compiles a single 1-D role vector")
+        n = role_vec.size
+        h, body_len, mod = _params(n)
+
+        self.dim = n
+        self.h = h
+        self.k_r = _decode_shift(role_vec)
+
+        cols = np.arange(body_len, dtype=np.intp)
+        head = np.arange(h, dtype=np.intp)
+        self.gather = np.concatenate((head, h + (cols - self.k_r) % body_len))
+        self.ungather = np.concatenate((head, h + (cols + self.k_r) % body_len))
+
+        raw = np.arange(1 << h, dtype=np.int64)
+        self.header_lut = _encode_shifts((raw + self.k_r) % mod, h)
+        self.unbind_lut = _encode_shifts((raw - self.k_r) % mod, h)
+        self._weights = np.int64(1) << np.arange(h, dtype=np.int64)
+
+    def raw_header(self, vecs: NDArray[np.int8]) -> NDArray[np.int64]:
+        """Undecoded header value(s) – the row index into the LUTs."""
+        return np.where(vecs[..., :self.h] == 1, self._weights, 0).sum(axis=-1)
+
+    def _apply(self, vecs: NDArray[np.int8], index: NDArray[np.intp],
+               lut: NDArray[np.int8], out: NDArray[np.int8] | None,
+               raw_k: NDArray[np.int64] | None = None) -> NDArray[np.int8]:
+        vecs = np.asarray(vecs)
+        if vecs.shape[-1] != self.dim:
+            raise ValueError("vector length mismatch")
+        if out is None:
+            out = np.empty(vecs.shape, dtype=np.int8)
+        if raw_k is None:
+            raw_k = self.raw_header(vecs)
+        np.take(vecs, index, axis=-1, out=out, mode="clip")
+        out[..., :self.h] = lut[raw_k]
+        return out
+
+    def bind(self, filler_vecs: NDArray[np.int8],
+             out: NDArray[np.int8] | None = None) -> NDArray[np.int8]:
+        """``bind(role, f)`` for a (D,) filler or every row of an (N, D) batch."""
+        return self._apply(filler_vecs, self.gather, self.header_lut, out)
+
+    def unbind(self, bound_vecs: NDArray[np.int8],
+               out: NDArray[np.int8] | None = None,
+               raw_k: NDArray[np.int64] | None = None) -> NDArray[np.int8]:
+        """
+        ``unbind(b, role)`` for a (D,) vector or every row of a batch.
+        Pass *raw_k* (``raw_header(bound_vecs)``) to share the header
+        decode when unbinding the same batch with several plans.
+        """
+        return self._apply(bound_vecs, self.ungather, self.unbind_lut, out, raw_k)
+
+
+def compile_plans(role_vecs: Mapping[str, NDArray[np.int8]]) -> dict[str, BindPlan]:
+    """Compile a ``BindPlan`` for every role in a registry."""
+    return {role: BindPlan(vec) for role, vec in role_vecs.items()}
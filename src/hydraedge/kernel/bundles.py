@@ -1,8 +1,10 @@
 """Bundling operations: γ-gate and majority-vote superposition."""
 from __future__ import annotations
+from typing import Iterable
+
 import numpy as np
 
-__all__ = ["gamma_gate", "majority_vote"]
+__all__ = ["Bundler", "gamma_gate", "gamma_gate_many", "majority_vote"]
 
 def _sign_with_tiebreak(x: np.ndarray) -> np.ndarray:
     """Sign(·) that resolves 0 → +1 (matches unit-test expectation)."""
@@ -12,17 +14,158 @@ def _sign_with_tiebreak(x: np.ndarray) -> np.ndarray:
     return out.astype(np.int8)
 
 # ──────────────────────────────────────────────────────────────────────────────
+def _gate_side(gamma: np.ndarray) -> np.ndarray:
+    """
+    Which input wins the γ-blend of two ±1 values that disagree:
+      +1 → bound,  −1 → filler,  0 → exact tie (resolved to +1).
+
+    Where the inputs agree the blend keeps their common sign, so for ±1
+    inputs the gate only ever copies *bound*, copies *filler* or (γ = ½)
+    takes their element-wise max.  The comparison is done on the same
+    weights the blend would use – float32 for a Python float, float64 for
+    an ``np.float64`` or float64 array (NumPy promotion) – so the result
+    is bit-identical at the γ ≈ ½ boundary too.
+    """
+    g = np.asarray(gamma)
+    wdt = np.result_type(gamma if np.isscalar(gamma) else g, np.float32)
+    if g.dtype != np.float32:
+        g = g.astype(np.float64)
+    if np.any((g < 0.0) | (g > 1.0)) or np.any(np.isnan(g)):
+        raise ValueError("gamma must be in [0,1]")
+    return np.sign((1.0 - g).astype(wdt) - g.astype(wdt))
+
+
+def _gamma_gate_reference(bound: np.ndarray, filler: np.ndarray, gamma: float) -> np.ndarray:
+    """Float blend + sign; kept for parity tests and non-±1 inputs."""
+    mixed = (1.0 - gamma) * bound.astype(np.float32) + gamma * filler.astype(np.float32)
+    return _sign_with_tiebreak(mixed)
+
+
 def gamma_gate(*, bound: np.ndarray, filler: np.ndarray, gamma: float) -> np.ndarray:
     """
     Linear blend between *bound* and *filler* controlled by γ ∈ [0,1].
       γ = 0   → return bound
       γ = 1   → return filler
-    The output is binarised with tie-break to +1.
+    The output is binarised with tie-break to +1.  Inputs are ±1, which
+    lets the blend run without float temporaries (see ``_gate_side``).
     """
-    if not (0.0 <= gamma <= 1.0):
-        raise ValueError("gamma must be in [0,1]")
-    mixed = (1.0 - gamma) * bound.astype(np.float32) + gamma * filler.astype(np.float32)
-    return _sign_with_tiebreak(mixed)
+    side = _gate_side(gamma)
+    if side > 0:
+        return bound.astype(np.int8)              # always a fresh array
+    if side < 0:
+        return filler.astype(np.int8)
+    return np.maximum(bound, filler).astype(np.int8)
+
+
+def gamma_gate_many(bound: np.ndarray, filler: np.ndarray,
+                    gamma: float | np.ndarray,
+                    out: np.ndarray | None = None) -> np.ndarray:
+    """
+    Row-wise ``gamma_gate`` over (N, D) matrices.
+
+    *gamma* is a scalar or an (N,) array of per-row values.  The result
+    is written into *out* (allocated as int8 when omitted).
+    """
+    if bound.shape != filler.shape or bound.ndim != 2:
+        raise ValueError(f"expected two (N, D) matrices, got {bound.shape} and {filler.shape}")
+    side = np.broadcast_to(_gate_side(gamma), bound.shape[:1])
+    if out is None:
+        out = np.empty(bound.shape, dtype=np.int8)
+
+    pick_b, pick_f = side > 0, side < 0
+    tie = ~(pick_b | pick_f)
+    out[pick_b] = bound[pick_b]
+    out[pick_f] = filler[pick_f]
+    if tie.any():
+        out[tie] = np.maximum(bound[tie], filler[tie])
+    return out
+
+# ──────────────────────────────────────────────────────────────────────────────
+class Bundler:
+    """
+    Streaming majority-vote accumulator over ±1 vectors.
+
+    Keeps one signed counter per dimension, so memory is O(D) however
+    many vectors are bundled.  Counters start as int16 and are widened
+    only when the number of updates could overflow them.
+
+      b = Bundler(4096)
+      b.add(v); b.add_many(batch); b.subtract(v)
+      b.merge(partial_from_other_worker)
+      chv = b.finalize()           # ties → +1, as in majority_vote
+    """
+
+    _WIDTHS = (np.int16, np.int32, np.int64)
+
+    def __init__(self, dim: int):
+        self.dim = dim
+        self.n = 0                   # net number of bundled vectors
+        self._updates = 0            # |counter| ≤ _updates, drives widening
+        self._counts = np.zeros(dim, dtype=np.int16)
+
+    @property
+    def counts(self) -> np.ndarray:
+        """Read-only view of the per-dimension vote sums."""
+        view = self._counts.view()
+        view.flags.writeable = False
+        return view
+
+    def _reserve(self, k: int) -> None:
+        self._updates += k
+        if self._updates > np.iinfo(self._counts.dtype).max:
+            for dt in self._WIDTHS:
+                if self._updates <= np.iinfo(dt).max:
+                    self._counts = self._counts.astype(dt)
+                    break
+
+    def _check(self, vecs: np.ndarray) -> np.ndarray:
+        vecs = np.asarray(vecs)
+        if vecs.shape[-1] != self.dim:
+            raise ValueError(f"expected dim={self.dim}, got {vecs.shape[-1]}")
+        return vecs
+
+    def add(self, vec: np.ndarray) -> "Bundler":
+        """Bundle one (D,) vector."""
+        vec = self._check(vec)
+        self._reserve(1)
+        np.add(self._counts, vec, out=self._counts, casting="unsafe")
+        self.n += 1
+        return self
+
+    def add_many(self, vecs: np.ndarray | Iterable[np.ndarray]) -> "Bundler":
+        """Bundle the rows of an (N, D) matrix (or any iterable of vectors)."""
+        if not isinstance(vecs, np.ndarray):
+            for v in vecs:
+                self.add(v)
+            return self
+        vecs = self._check(vecs).reshape(-1, self.dim)
+        self._reserve(len(vecs))
+        self._counts += vecs.sum(axis=0, dtype=self._counts.dtype)
+        self.n += len(vecs)
+        return self
+
+    def subtract(self, vec: np.ndarray) -> "Bundler":
+        """Retract a previously bundled vector."""
+        vec = self._check(vec)
+        self._reserve(1)
+        np.subtract(self._counts, vec, out=self._counts, casting="unsafe")
+        self.n -= 1
+        return self
+
+    def merge(self, other: "Bundler") -> "Bundler":
+        """Fold in a partial bundle (e.g. from a parallel worker)."""
+        if other.dim != self.dim:
+            raise ValueError(f"dim mismatch: {other.dim} vs {self.dim}")
+        self._reserve(other._updates)
+        self._counts += other._counts.astype(self._counts.dtype)
+        self.n += other.n
+        return self
+
+    def finalize(self) -> np.ndarray:
+        """Majority sign of the counters (ties resolve to +1)."""
+        if self.n <= 0:
+            raise ValueError("Bundler.finalize() needs ≥1 bundled vector")
+        return _sign_with_tiebreak(self._counts)
 
 # ──────────────────────────────────────────────────────────────────────────────
 def majority_vote(vectors: list[np.ndarray]) -> np.ndarray:
@@ -32,6 +175,4 @@ def majority_vote(vectors: list[np.ndarray]) -> np.ndarray:
     """
     if len(vectors) == 0:
         raise ValueError("majority_vote() needs ≥1 vector")
-    stacked = np.stack(vectors).astype(np.int32)
-    votes = stacked.sum(axis=0)
-    return _sign_with_tiebreak(votes)
+    return Bundler(np.shape(vectors[0])[-1]).add_many(vectors).finalize()
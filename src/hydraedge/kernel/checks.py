@@ -1,16 +1,261 @@
+from pathlib import Path
+
 import numpy as np
 from hydraedge.encoder.chv_encoder import role_vec, D, ROLES
 
-# 1) Default kernel parameters (identity symmetric, zero antisymmetric & slot weights)
-W_S = np.eye(D, dtype=np.float32)                       # symmetric block
-W_A = np.zeros((D, D), dtype=np.float32)                # antisymmetric block
-M   = np.zeros((len(ROLES), len(ROLES)), dtype=np.float32)  # slot–slot interactions
+# Working-set cap (bytes) for the tiled batch scorers below.
+MEM_BUDGET = 256 * 2**20
+
+# |ROLES|×D role matrix, built once – slot sums are one matmul against it.
+ROLE_MATRIX = np.stack([role_vec[r] for r in ROLES]).astype(np.float32)
+
+
+def _as_float32(rows: np.ndarray, buf: np.ndarray) -> np.ndarray:
+    """*rows* converted into the head of a preallocated float32 buffer."""
+    view = buf[:len(rows)]
+    np.copyto(view, rows, casting="unsafe")
+    return view
+
+
+class HybridKernel:
+    """
+    Structured kernel parameters with O(D·r) memory and cost per pair:
+
+      W_S = diag(d_S) + ½ (U_S V_Sᵀ + V_S U_Sᵀ)      symmetric block
+      W_A = ½ (U_A V_Aᵀ − V_A U_Aᵀ)                  antisymmetric block
+      M   ∈ ℝ^{|ROLES|×|ROLES|}                        slot–slot interactions
+
+    An antisymmetric matrix has a zero diagonal, so W_A is purely
+    low-rank.  Defaults reproduce the historical dense parameters
+    (W_S = I, W_A = 0, M = 0).  ``dense=True`` materialises the D×D
+    blocks on every call and exists as a reference for parity tests.
+    """
+
+    def __init__(self, dim: int = D, rank: int = 8, *, dense: bool = False,
+                 role_matrix: np.ndarray | None = None):
+        if role_matrix is None:
+            role_matrix = ROLE_MATRIX
+        if role_matrix.shape[1] != dim:
+            raise ValueError(f"role matrix has dim {role_matrix.shape[1]}, kernel has {dim}")
+        self.dim = dim
+        self.rank = rank
+        self.dense = dense
+        self.role_matrix = role_matrix.astype(np.float32, copy=False)
+        self.d_S = np.ones(dim, dtype=np.float32)
+        self.U_S = np.zeros((dim, rank), dtype=np.float32)
+        self.V_S = np.zeros((dim, rank), dtype=np.float32)
+        self.U_A = np.zeros((dim, rank), dtype=np.float32)
+        self.V_A = np.zeros((dim, rank), dtype=np.float32)
+        n_roles = len(self.role_matrix)
+        self.M = np.zeros((n_roles, n_roles), dtype=np.float32)
+
+    # dense views (reference only – D×D float32 each) -------------------------
+    def W_S(self) -> np.ndarray:
+        lr = self.U_S @ self.V_S.T
+        return np.diag(self.d_S) + 0.5 * (lr + lr.T)
+
+    def W_A(self) -> np.ndarray:
+        lr = self.U_A @ self.V_A.T
+        return 0.5 * (lr - lr.T)
+
+    # scoring ------------------------------------------------------------------
+    def logit(self, e_src: np.ndarray, e_dst: np.ndarray) -> float:
+        """Pre-sigmoid score z(e_src, e_dst)."""
+        x = e_src.astype(np.float32, copy=False)
+        y = e_dst.astype(np.float32, copy=False)
+        s_src = self.role_matrix @ x
+        s_dst = self.role_matrix @ y
+        z_m = s_src @ self.M @ s_dst                # slot–slot term
+
+        if self.dense:
+            z_ss = x @ self.W_S() @ y
+            z_sa = x @ self.W_A() @ y
+            return float(z_ss + z_sa + z_m)
+
+        # xᵀ U Vᵀ y = (Uᵀx)·(Vᵀy) – never forms a D×D matrix
+        ux_s, vx_s = x @ self.U_S, x @ self.V_S
+        uy_s, vy_s = y @ self.U_S, y @ self.V_S
+        ux_a, vx_a = x @ self.U_A, x @ self.V_A
+        uy_a, vy_a = y @ self.U_A, y @ self.V_A
+
+        z_ss = (x * self.d_S) @ y + 0.5 * (ux_s @ vy_s + vx_s @ uy_s)
+        z_sa = 0.5 * (ux_a @ vy_a - vx_a @ uy_a)
+        return float(z_ss + z_sa + z_m)
+
+    def forward(self, e_src: np.ndarray, e_dst: np.ndarray) -> float:
+        z = self.logit(e_src, e_dst)
+        return float(1.0 / (1.0 + np.exp(-z)))
+
+    # batched scoring ----------------------------------------------------------
+    def slot_sums(self, E: np.ndarray) -> np.ndarray:
+        """Slot features of each row of E against this kernel's role matrix."""
+        return E.astype(np.float32, copy=False) @ self.role_matrix.T
+
+    def tile_rows(self, mem_budget: int = MEM_BUDGET) -> int:
+        """
+        Side t of the square score tiles: two t×D float32 operands plus a
+        t×t tile and its low-rank update stay within *mem_budget* bytes.
+        """
+        d = self.dim
+        return max(1, int((np.sqrt(d * d + mem_budget / 2) - d) / 2))
+
+    def factors(self, E: np.ndarray, side: str, *, S: np.ndarray | None = None,
+                mem_budget: int = MEM_BUDGET) -> np.ndarray:
+        """
+        Small per-vector factors so that, for every pair,
+          z = (x ⊙ d_S)·y + F_a[x]·F_b[y]
+        with F stacking the low-rank projections and the slot term
+        (``side`` "a" for source rows, "b" for destination rows).  In
+        dense mode F_a is S_x·M and F_b is S_y.  Rows are converted to
+        float32 in blocks of at most *mem_budget* bytes; cached slot
+        features (*S*) skip the slot sums.
+        """
+        if side not in ("a", "b"):
+            raise ValueError(f"side must be 'a' or 'b', got {side!r}")
+        E = np.atleast_2d(E)
+        r, n_roles = self.rank, len(self.role_matrix)
+        width = n_roles if self.dense else 4 * r + n_roles
+        F = np.empty((len(E), width), dtype=np.float32)
+        UV = None if self.dense else np.hstack([self.U_S, self.V_S, self.U_A, self.V_A])
+        # half the budget for the float32 block, the rest for F and temporaries
+        block = max(1, min(len(E), mem_budget // (8 * self.dim)))
+        buf = np.empty((block, self.dim), dtype=np.float32)   # reused for every block
+        for lo in range(0, len(E), block):
+            hi = min(lo + block, len(E))
+            X = _as_float32(E[lo:hi], buf)
+            S_blk = self.slot_sums(X) if S is None else np.atleast_2d(S)[lo:hi]
+            slot = S_blk @ self.M if side == "a" else S_blk
+            if self.dense:
+                F[lo:hi] = slot
+                continue
+            P = X @ UV                                   # [U_S | V_S | U_A | V_A] projections
+            p_us, p_vs, p_ua, p_va = (P[:, i * r:(i + 1) * r] for i in range(4))
+            parts = ([0.5 * p_us, 0.5 * p_vs, 0.5 * p_ua, -0.5 * p_va] if side == "a"
+                     else [p_vs, p_us, p_va, p_ua])
+            F[lo:hi] = np.hstack(parts + [slot])
+        return F
+
+    def logits_pairs(self, E_a: np.ndarray, E_b: np.ndarray, *,
+                     mem_budget: int = MEM_BUDGET,
+                     out: np.ndarray | None = None,
+                     S_a: np.ndarray | None = None,
+                     S_b: np.ndarray | None = None,
+                     F_a: np.ndarray | None = None,
+                     F_b: np.ndarray | None = None) -> np.ndarray:
+        """
+        All-pairs pre-sigmoid scores, shape (len(E_a), len(E_b)), float32.
+        S_a / S_b are optional precomputed slot features (``slot_features``);
+        F_a / F_b optional precomputed :meth:`factors`.  Only the small
+        factors exist for all rows at once – the float32 copies of E_a /
+        E_b are made tile by tile, so the working set beyond ``out`` stays
+        within *mem_budget* (the dense reference mode is not budgeted).
+        """
+        E_a, E_b = np.atleast_2d(E_a), np.atleast_2d(E_b)
+        n_a, n_b = len(E_a), len(E_b)
+        if out is None:
+            out = np.empty((n_a, n_b), dtype=np.float32)
+
+        if F_a is None:
+            F_a = self.factors(E_a, "a", S=S_a, mem_budget=mem_budget)
+        if F_b is None:
+            F_b = self.factors(E_b, "b", S=S_b, mem_budget=mem_budget)
+        W = self.W_S() + self.W_A() if self.dense else None
+
+        t = self.tile_rows(mem_budget)
+        x_buf = np.empty((min(t, n_a), self.dim), dtype=np.float32)
+        y_buf = np.empty((min(t, n_b), self.dim), dtype=np.float32)
+        for a0 in range(0, n_a, t):
+            a1 = min(a0 + t, n_a)
+            X = _as_float32(E_a[a0:a1], x_buf)
+            if self.dense:
+                X = X @ W
+            else:
+                X *= self.d_S
+            for b0 in range(0, n_b, t):
+                b1 = min(b0 + t, n_b)
+                Y = _as_float32(E_b[b0:b1], y_buf)
+                z = out[a0:a1, b0:b1]
+                np.matmul(X, Y.T, out=z)
+                z += F_a[a0:a1] @ F_b[b0:b1].T
+        return out
+
+    def forward_pairs(self, E_a: np.ndarray, E_b: np.ndarray, *,
+                      mem_budget: int = MEM_BUDGET,
+                      out: np.ndarray | None = None,
+                      S_a: np.ndarray | None = None,
+                      S_b: np.ndarray | None = None,
+                      F_a: np.ndarray | None = None,
+                      F_b: np.ndarray | None = None) -> np.ndarray:
+        """All-pairs kernel scores σ(z), shape (len(E_a), len(E_b)), float32."""
+        z = self.logits_pairs(E_a, E_b, mem_budget=mem_budget, out=out,
+                              S_a=S_a, S_b=S_b, F_a=F_a, F_b=F_b)
+        with np.errstate(over="ignore"):
+            np.negative(z, out=z)
+            np.exp(z, out=z)
+            z += 1.0
+            np.reciprocal(z, out=z)
+        return z
+
+    def forward_many(self, e_src: np.ndarray, E_dst: np.ndarray, *,
+                     mem_budget: int = MEM_BUDGET,
+                     S_dst: np.ndarray | None = None) -> np.ndarray:
+        """Scores of one source CHV against every row of E_dst, (N,) float32."""
+        return self.forward_pairs(e_src[None, :], E_dst, mem_budget=mem_budget, S_b=S_dst)[0]
+
 
 def slot_sum(e: np.ndarray) -> np.ndarray:
     """
     Compute the slot‐sum vector s∈ℝ^{|ROLES|} by projecting composite CHV e onto each role.
     """
-    return np.array([np.dot(role_vec[r], e) for r in ROLES], dtype=np.float32)
+    return ROLE_MATRIX @ e.astype(np.float32, copy=False)
+
+
+def slot_sum_many(E: np.ndarray) -> np.ndarray:
+    """Row-wise ``slot_sum`` for an (N, D) batch → (N, |ROLES|) float32, one matmul."""
+    return E.astype(np.float32, copy=False) @ ROLE_MATRIX.T
+
+
+def _slots_path(vectors_path: str | Path) -> Path:
+    vectors_path = Path(vectors_path)
+    return vectors_path.with_name(vectors_path.stem + ".slots.npy")
+
+
+def save_slot_features(vectors_path: str | Path, *, chunk: int = 65_536) -> Path:
+    """
+    Compute slot features for every row of *vectors_path* (e.g. vectors.npy)
+    and store them next to it as ``<stem>.slots.npy`` (N×|ROLES| float32).
+    Rows are processed in chunks off a memory map.
+    """
+    E = np.load(vectors_path, mmap_mode="r")
+    path = _slots_path(vectors_path)
+    S = np.lib.format.open_memmap(path, mode="w+", dtype=np.float32,
+                                  shape=(len(E), len(ROLES)))
+    for i in range(0, len(E), chunk):
+        S[i:i + chunk] = slot_sum_many(np.asarray(E[i:i + chunk]))
+    S.flush()
+    return path
+
+
+def slot_features(vectors_path: str | Path) -> np.ndarray:
+    """
+    Memory-mapped slot features for *vectors_path*, (re)computed when the
+    sidecar is missing, older than the vectors, or has the wrong shape.
+    """
+    path = _slots_path(vectors_path)
+    n = np.load(vectors_path, mmap_mode="r").shape[0]
+    fresh = path.exists() and path.stat().st_mtime >= Path(vectors_path).stat().st_mtime
+    if fresh:
+        S = np.load(path, mmap_mode="r")
+        if S.shape == (n, len(ROLES)):
+            return S
+    save_slot_features(vectors_path)
+    return np.load(path, mmap_mode="r")
+
+
+# 1) Default kernel parameters (identity symmetric, zero antisymmetric & slot weights)
+KERNEL = HybridKernel(D)
+M = KERNEL.M                                            # slot–slot interactions
+
 
 def forward(e_src: np.ndarray, e_dst: np.ndarray) -> float:
     """
@@ -18,14 +263,29 @@ def forward(e_src: np.ndarray, e_dst: np.ndarray) -> float:
       K(e_src, e_dst) = σ( e_src^T W_S e_dst
                          + e_src^T W_A e_dst
                          + slot_sum(e_src)^T M slot_sum(e_dst) )
-    where σ is the logistic.
+    where σ is the logistic and W_S / W_A are the structured blocks of
+    the module-level ``KERNEL`` (see :class:`HybridKernel`).
     """
-    s_src = slot_sum(e_src)
-    s_dst = slot_sum(e_dst)
+    return KERNEL.forward(e_src, e_dst)
+
 
-    z_ss = e_src @ W_S @ e_dst      # symmetric term
-    z_sa = e_src @ W_A @ e_dst      # antisymmetric term
-    z_m  = s_src @ M   @ s_dst      # slot–slot term
-    z    = z_ss + z_sa + z_m
+def forward_many(e_src: np.ndarray, E_dst: np.ndarray, *,
+                 mem_budget: int = MEM_BUDGET,
+                 S_dst: np.ndarray | None = None) -> np.ndarray:
+    """``forward(e_src, e)`` for every row e of E_dst, as one float32 array."""
+    return KERNEL.forward_many(e_src, E_dst, mem_budget=mem_budget, S_dst=S_dst)
 
-    return float(1.0 / (1.0 + np.exp(-z)))
+
+def forward_pairs(E_a: np.ndarray, E_b: np.ndarray, *,
+                  mem_budget: int = MEM_BUDGET,
+                  out: np.ndarray | None = None,
+                  S_a: np.ndarray | None = None,
+                  S_b: np.ndarray | None = None) -> np.ndarray:
+    """
+    All-pairs ``forward`` between the rows of E_a and E_b, tiled so the
+    float32 working set stays under *mem_budget* bytes.  Returns (or
+    fills *out* with) an (len(E_a), len(E_b)) float32 score matrix.
+    Pass cached slot features (``slot_features``) as S_a / S_b to skip
+    recomputing them for indexed vectors.
+    """
+    return KERNEL.forward_pairs(E_a, E_b, mem_budget=mem_budget, out=out, S_a=S_a, S_b=S_b)
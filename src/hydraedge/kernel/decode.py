@@ -0,0 +1,82 @@
+# ── hydraedge.kernel.decode ───────────────────────────────────────────────
+"""
+Role-wise decoding of CHVs: "what fills role X in this CHV?"
+
+For a batch E of N CHVs and R requested roles, ``decode_roles``
+
+1. decodes the N CHV headers **once** (shared by every role),
+2. unbinds each role with its compiled ``BindPlan`` – one gather per
+   role over the whole batch into a preallocated (R, N, D) buffer,
+3. cleans all R·N noisy fillers up against an :class:`ItemMemory` in a
+   single batched query.
+"""
+from __future__ import annotations
+
+from typing import Mapping, Sequence
+
+import numpy as np
+from numpy.typing import NDArray
+
+from hydraedge.kernel.bind_ops import BindPlan
+from hydraedge.kernel.item_memory import ItemMemory
+
+__all__ = ["unbind_roles", "decode_roles"]
+
+
+def _default_plans() -> Mapping[str, BindPlan]:
+    from hydraedge.encoder.chv_encoder import PLANS
+    return PLANS
+
+
+def unbind_roles(E: NDArray[np.int8], roles: Sequence[str],
+                 plans: Mapping[str, BindPlan] | None = None,
+                 out: NDArray[np.int8] | None = None) -> NDArray[np.int8]:
+    """
+    Unbind every role in *roles* from every row of E.
+
+    Returns an (R, N, D) int8 array; ``out[j, i]`` equals
+    ``unbind(E[i], role_vec[roles[j]])``.
+    """
+    plans = plans or _default_plans()
+    E = np.atleast_2d(np.asarray(E))
+    missing = [r for r in roles if r not in plans]
+    if missing:
+        raise KeyError(f"no bind plan for roles {missing}")
+    if out is None:
+        out = np.empty((len(roles), *E.shape), dtype=np.int8)
+
+    raw_k = plans[roles[0]].raw_header(E) if roles else None   # shared decode
+    for j, role in enumerate(roles):
+        plans[role].unbind(E, out=out[j], raw_k=raw_k)
+    return out
+
+
+def decode_roles(E: NDArray[np.int8], roles: Sequence[str], memory: ItemMemory, *,
+                 k: int = 1, plans: Mapping[str, BindPlan] | None = None,
+                 method: str = "hamming", n_threads: int | None = None
+                 ) -> dict[str, tuple[NDArray[np.object_], NDArray[np.float32]]]:
+    """
+    Top-*k* fillers of each requested role for a batch of CHVs.
+
+    Parameters
+    ----------
+    E      : (D,) or (N, D) int8 CHVs
+    roles  : role names to decode
+    memory : filler codebook used for cleanup
+    k      : candidates per (CHV, role)
+
+    Returns
+    -------
+    role → (fillers, scores), both of shape (N, k): filler keys (object
+    array of str) and cosine scores (float32), best first.
+    """
+    E = np.atleast_2d(np.asarray(E))
+    n, d = E.shape
+    noisy = unbind_roles(E, roles, plans)
+    rows, scores = memory.cleanup(noisy.reshape(-1, d), k, kind="filler",
+                                  method=method, n_threads=n_threads)
+    keys = np.asarray(memory.keys, dtype=object)
+    kk = rows.shape[1]
+    return {role: (keys[rows[j * n:(j + 1) * n]].reshape(n, kk),
+                   scores[j * n:(j + 1) * n])
+            for j, role in enumerate(roles)}
@@ -0,0 +1,205 @@
+# ── hydraedge.kernel.hv_store ─────────────────────────────────────────────
+"""
+Append-only, memory-mapped store of fixed-size hyper-vector rows.
+
+Files (``<path>`` is a stem)
+----------------------------
+<path>.hv    : 64-byte header + rows, each ``row_len`` items of ``dtype``
+               (int8 ±1 rows of length D, or packed uint64 words)
+<path>.keys  : one UTF-8 key per line, line *i* ↔ row *i*
+
+Rows are written before their keys, so a crashed writer leaves at most
+some unreferenced trailing bytes; readers only expose rows that have a
+key.  Rows are normally immutable; ``put_many(..., overwrite=True)``
+rewrites existing rows in place (e.g. mutable accumulators).  Appends
+take an exclusive ``flock`` (where available) so several worker
+processes can share one store; ``refresh()`` picks up rows other
+processes appended.  Reads go through ``np.memmap``, so every process
+maps the same page-cache pages instead of holding its own copy.
+"""
+from __future__ import annotations
+
+import os
+import struct
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterable, Iterator, Sequence
+
+import numpy as np
+from numpy.typing import NDArray
+
+try:                                        # POSIX only – no locking elsewhere
+    import fcntl
+except ModuleNotFoundError:                 # pragma: no cover
+    fcntl = None
+
+__all__ = ["HVStore"]
+
+_MAGIC = b"HVSTORE1"
+_HEADER = struct.Struct("<8sII16s")         # magic, row_len, dim, dtype str
+_HEADER_SIZE = 64
+
+
+class HVStore:
+    """Fixed-size hyper-vector rows with an O(1) string-key index."""
+
+    def __init__(self, path: str | Path, dim: int | None = None,
+                 dtype: str | np.dtype = np.int8, row_len: int | None = None):
+        """
+        Open *path* (a file stem), creating it when *dim* is given and the
+        store does not exist yet.  ``row_len`` defaults to *dim*; pass
+        ⌈D/64⌉ with ``dtype=np.uint64`` for bit-packed rows.
+        """
+        self.path = Path(path)
+        self._data_path = self.path.with_name(self.path.name + ".hv")
+        self._keys_path = self.path.with_name(self.path.name + ".keys")
+
+        if not self._data_path.exists():
+            if dim is None:
+                raise FileNotFoundError(f"no HVStore at {self._data_path}")
+            self._create(dim, np.dtype(dtype), row_len or dim)
+        self._read_header()
+
+        self.keys: list[str] = []
+        self._row: dict[str, int] = {}
+        self._keys_offset = 0
+        self._rows: NDArray | None = None
+        self.refresh()
+
+    # ── file plumbing ───────────────────────────────────────────────────
+    def _create(self, dim: int, dtype: np.dtype, row_len: int) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        header = _HEADER.pack(_MAGIC, row_len, dim, dtype.str.encode("ascii"))
+        tmp = self._data_path.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_bytes(header.ljust(_HEADER_SIZE, b"\0"))
+        self._keys_path.touch()
+        try:
+            os.link(tmp, self._data_path)     # fails if another process won
+        except FileExistsError:
+            pass
+        finally:
+            tmp.unlink()
+
+    def _read_header(self) -> None:
+        with open(self._data_path, "rb") as fh:
+            magic, row_len, dim, dt = _HEADER.unpack(fh.read(_HEADER.size))
+        if magic != _MAGIC:
+            raise ValueError(f"{self._data_path} is not an HVStore file")
+        self.row_len = row_len
+        self.dim = dim
+        self.dtype = np.dtype(dt.rstrip(b"\0").decode("ascii"))
+        self._row_bytes = row_len * self.dtype.itemsize
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        with open(self._keys_path, "a", encoding="utf-8") as fh:
+            if fcntl is not None:
+                fcntl.flock(fh, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(fh, fcntl.LOCK_UN)
+
+    def refresh(self) -> "HVStore":
+        """Pick up rows appended since the last refresh (by any process)."""
+        with open(self._keys_path, "rb") as fh:
+            fh.seek(self._keys_offset)
+            tail = fh.read()
+        complete = tail[: tail.rfind(b"\n") + 1]        # ignore a half-written line
+        # only b"\n" ends a key: splitlines() would also split on \r, \u2028, …
+        for line in complete.split(b"\n")[:-1]:
+            key = line.decode("utf-8")
+            self._row.setdefault(key, len(self.keys))
+            self.keys.append(key)
+        self._keys_offset += len(complete)
+
+        n = len(self.keys)
+        if self._rows is None or len(self._rows) != n:
+            self._rows = (np.memmap(self._data_path, dtype=self.dtype, mode="r",
+                                    offset=_HEADER_SIZE, shape=(n, self.row_len))
+                          if n else np.empty((0, self.row_len), dtype=self.dtype))
+        return self
+
+    # ── reads ───────────────────────────────────────────────────────────
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._row
+
+    @property
+    def rows(self) -> NDArray:
+        """(N, row_len) read-only memory map of every row."""
+        return self._rows
+
+    def index(self, key: str) -> int:
+        return self._row[key]
+
+    def rows_of(self, keys: Sequence[str]) -> NDArray[np.int64]:
+        """Row index of each key, −1 where the key is unknown."""
+        return np.fromiter((self._row.get(k, -1) for k in keys), dtype=np.int64,
+                           count=len(keys))
+
+    def get(self, key: str) -> NDArray:
+        return self._rows[self._row[key]]
+
+    def get_many(self, keys: Sequence[str]) -> NDArray:
+        """
+        (len(keys), row_len) rows gathered in one pass (KeyError if any is
+        missing).  A run of consecutive rows is returned as a zero-copy
+        view of the memory map.
+        """
+        rows = self.rows_of(keys)
+        if (rows < 0).any():
+            missing = [k for k, r in zip(keys, rows) if r < 0]
+            raise KeyError(f"{len(missing)} unknown keys, e.g. {missing[:3]}")
+        if len(rows) and (np.diff(rows) == 1).all():
+            return self._rows[rows[0]:rows[-1] + 1]
+        return self._rows[rows]
+
+    # ── writes ──────────────────────────────────────────────────────────
+    def put(self, key: str, vec: NDArray) -> int:
+        return int(self.put_many([key], np.asarray(vec)[None, :])[0])
+
+    def put_many(self, keys: Sequence[str], vecs: NDArray, *,
+                 overwrite: bool = False) -> NDArray[np.int64]:
+        """
+        Append rows for keys not stored yet and return the row index of
+        every key.  Existing rows are kept (first write wins) unless
+        *overwrite* is set, in which case they are rewritten in place –
+        memory maps in other processes see the new values.
+        """
+        vecs = np.asarray(vecs, dtype=self.dtype)
+        if vecs.shape != (len(keys), self.row_len):
+            raise ValueError(f"expected ({len(keys)}, {self.row_len}) rows, got {vecs.shape}")
+        if any("\n" in k for k in keys):
+            raise ValueError("keys may not contain newlines")
+
+        with self._locked():
+            self.refresh()                               # see other writers' rows
+            new: dict[str, int] = {}
+            old: dict[str, int] = {}
+            for i, k in enumerate(keys):
+                if k in self._row:
+                    old[k] = i                           # last write wins here
+                elif k not in new or overwrite:
+                    new[k] = i
+            if overwrite and old:
+                with open(self._data_path, "r+b") as fh:
+                    for k, i in old.items():
+                        fh.seek(_HEADER_SIZE + self._row[k] * self._row_bytes)
+                        fh.write(np.ascontiguousarray(vecs[i]).tobytes())
+            if new:
+                idx = np.fromiter(new.values(), dtype=np.int64, count=len(new))
+                with open(self._data_path, "r+b") as fh:
+                    fh.seek(_HEADER_SIZE + len(self.keys) * self._row_bytes)
+                    fh.write(np.ascontiguousarray(vecs[idx]).tobytes())
+                with open(self._keys_path, "ab") as fh:
+                    fh.write(b"".join(k.encode("utf-8") + b"\n" for k in new))
+                self.refresh()
+        return self.rows_of(keys)
+
+    def items(self) -> Iterable[tuple[str, NDArray]]:
+        for i, k in enumerate(self.keys):
+            yield k, self._rows[i]
@@ -0,0 +1,272 @@
+# ── hydraedge.kernel.item_memory ──────────────────────────────────────────
+"""
+Item memory: clean up noisy hyper-vectors against a codebook.
+
+After ``unbind`` on a bundled CHV the recovered filler is only *similar*
+to the true one; cleanup finds its nearest codebook entries.
+
+On-disk layout (one directory of two ``HVStore`` stems)
+-------------------------------------------------------
+items.hv / .keys  : (N, D)        int8 ±1 rows       – int8 matmul search
+packed.hv / .keys : (N, ⌈D/64⌉)   packed uint64 rows – Hamming search
+
+Both stores hold the same rows in the same order under the store key
+``kind<TAB>key`` (kind ∈ {"filler", "role"}).  Both are memory-mapped on
+open, so worker processes share pages.
+Queries are split into blocks and each block is scored against codebook
+chunks on a thread pool (NumPy releases the GIL inside matmul / XOR /
+popcount).  Block and chunk sizes come from a per-job byte budget, and
+each chunk's top-k is folded into a running per-block top-k with
+``argpartition``, so memory stays O(block · k) beyond the job
+temporaries.  Scores are cosine similarities for both search methods
+(``cos = 1 − 2·ham / D`` for Hamming).
+"""
+from __future__ import annotations
+
+import math
+from pathlib import Path
+from typing import Callable, Iterable, Mapping, Sequence
+
+import numpy as np
+from numpy.typing import NDArray
+
+from hydraedge.kernel.hv_store import HVStore
+from hydraedge.kernel.packed import _popcount, pack_bits
+from hydraedge.kernel.parallel import chunk_bounds, get_num_threads, ordered_map
+
+__all__ = ["ItemMemory", "topk_merge", "blocked_topk"]
+
+_KINDS = ("filler", "role")
+_CHUNK_BYTES = 64 * 2**20          # temporaries per chunk job
+
+
+def topk_merge(scores: NDArray[np.float32], rows: NDArray[np.int64] | None,
+               k: int) -> tuple[NDArray[np.int64], NDArray[np.float32]]:
+    """
+    Best-*k* columns of each row of *scores*, sorted by descending score.
+    *rows* maps columns back to codebook rows: a per-column (C,) array,
+    a per-entry (Q, C) array, or None for the identity.
+    """
+    k = min(k, scores.shape[1])
+    if k < scores.shape[1]:
+        part = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+    else:
+        part = np.broadcast_to(np.arange(scores.shape[1]), scores.shape).copy()
+    top = np.take_along_axis(scores, part, axis=1)
+    order = np.argsort(-top, axis=1, kind="stable")
+    part = np.take_along_axis(part, order, axis=1)
+    top = np.take_along_axis(top, order, axis=1)
+    if rows is not None:
+        part = rows[part] if rows.ndim == 1 else np.take_along_axis(rows, part, axis=1)
+    return part.astype(np.int64), top.astype(np.float32)
+
+
+def blocked_topk(score: Callable[[int, int, int, int], NDArray[np.float32]], n_q: int,
+                 bounds: Sequence[tuple[int, int]], k: int, *, query_rows: int,
+                 allowed: NDArray[np.int64] | None = None,
+                 n_threads: int | None = None) -> tuple[NDArray[np.int64], NDArray[np.float32]]:
+    """
+    Top-*k* rows (highest score first) for *n_q* queries, scored block by
+    block: ``score(q0, q1, lo, hi)`` returns the (q1 − q0, hi − lo) scores
+    of queries ``[q0, q1)`` against rows ``[lo, hi)`` (one of *bounds*).
+
+    The (query block, row chunk) jobs run through
+    :func:`~hydraedge.kernel.parallel.ordered_map`; each job's top-k is
+    folded into its block's running top-k in chunk order (deterministic
+    ties) and the block is written out after its last chunk, so memory is
+    O(jobs in flight + n_q · k).  *allowed* (sorted row numbers) restricts
+    the candidates; chunks without such rows are skipped.  *k* must not
+    exceed the number of candidate rows.
+    """
+    if allowed is not None:
+        bounds = [(lo, hi) for lo, hi in bounds
+                  if np.searchsorted(allowed, lo) < np.searchsorted(allowed, hi)]
+    out_rows = np.empty((n_q, k), dtype=np.int64)
+    out_scores = np.empty((n_q, k), dtype=np.float32)
+    jobs = ((q0, min(q0 + query_rows, n_q), lo, hi)
+            for q0 in range(0, n_q, query_rows) for lo, hi in bounds)
+
+    def job(q_c):
+        q0, q1, lo, hi = q_c
+        scores = score(q0, q1, lo, hi)
+        if allowed is not None:
+            cols = allowed[np.searchsorted(allowed, lo):np.searchsorted(allowed, hi)] - lo
+            return q0, topk_merge(scores[:, cols], cols + lo, k)
+        return q0, topk_merge(scores, np.arange(lo, hi), k)
+
+    running: dict[int, tuple[NDArray[np.int64], NDArray[np.float32], int]] = {}
+    for q0, (rows, scores) in ordered_map(job, jobs, n_threads=n_threads):
+        if q0 in running:
+            run_rows, run_scores, seen = running.pop(q0)
+            rows, scores = topk_merge(np.hstack([run_scores, scores]),
+                                      np.hstack([run_rows, rows]), k)
+        else:
+            seen = 0
+        if seen + 1 < len(bounds):
+            running[q0] = (rows, scores, seen + 1)
+        else:
+            out_rows[q0:q0 + len(rows)], out_scores[q0:q0 + len(rows)] = rows, scores
+    return out_rows, out_scores
+
+
+class ItemMemory:
+    """Memory-mapped codebook of filler and role hyper-vectors."""
+
+    def __init__(self, keys: list[str], kinds: list[str],
+                 vectors: NDArray[np.int8], words: NDArray[np.uint64],
+                 path: Path | None = None):
+        self.keys = keys
+        self.kinds = np.array(kinds)
+        self.vectors = vectors
+        self.words = words
+        self.path = path
+        self._row = {key: i for i, key in enumerate(keys)}
+        if len(self._row) != len(keys):
+            raise ValueError("duplicate keys in item memory")
+
+    # ── construction / persistence ───────────────────────────────────────
+    @classmethod
+    def build(cls, path: str | Path, *,
+              fillers: Mapping[str, NDArray[np.int8]] | None = None,
+              roles: Mapping[str, NDArray[np.int8]] | None = None) -> "ItemMemory":
+        """Write a codebook directory and return it opened (memory-mapped)."""
+        path = Path(path)
+        path.mkdir(parents=True, exist_ok=True)
+        items = [(k, "filler", v) for k, v in (fillers or {}).items()]
+        items += [(k, "role", v) for k, v in (roles or {}).items()]
+        if not items:
+            raise ValueError("item memory needs at least one vector")
+
+        vecs = np.stack([np.asarray(v, dtype=np.int8) for _, _, v in items])
+        words = pack_bits(vecs)
+        store_keys = [f"{kind}\t{k}" for k, kind, _ in items]
+        if len(set(store_keys)) != len(store_keys):
+            raise ValueError("duplicate keys in item memory")
+        for name in ("items", "packed"):                 # build replaces, never appends
+            for suffix in (".hv", ".keys"):
+                (path / (name + suffix)).unlink(missing_ok=True)
+        HVStore(path / "items", dim=vecs.shape[1]).put_many(store_keys, vecs)
+        HVStore(path / "packed", dim=vecs.shape[1], dtype=np.uint64,
+                row_len=words.shape[1]).put_many(store_keys, words)
+        return cls.open(path)
+
+    @classmethod
+    def open(cls, path: str | Path) -> "ItemMemory":
+        """Memory-map a codebook directory written by :meth:`build`."""
+        path = Path(path)
+        items, packed = HVStore(path / "items"), HVStore(path / "packed")
+        if items.keys != packed.keys:
+            raise ValueError(f"item memory at {path}: items and packed stores disagree")
+        kinds, keys = zip(*(k.split("\t", 1) for k in items.keys)) if len(items) else ((), ())
+        return cls(list(keys), list(kinds), items.rows, packed.rows, path)
+
+    # ── lookup ───────────────────────────────────────────────────────────
+    @property
+    def dim(self) -> int:
+        return self.vectors.shape[1]
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._row
+
+    def index(self, key: str) -> int:
+        """Row of *key* (KeyError if unknown)."""
+        return self._row[key]
+
+    def get(self, key: str) -> NDArray[np.int8]:
+        return np.asarray(self.vectors[self._row[key]])
+
+    def rows_of_kind(self, kind: str | None) -> NDArray[np.int64] | None:
+        if kind is None:
+            return None
+        if kind not in _KINDS:
+            raise ValueError(f"kind must be one of {_KINDS}, got {kind!r}")
+        return np.flatnonzero(self.kinds == kind)
+
+    # ── cleanup ──────────────────────────────────────────────────────────
+    def _score_chunk(self, queries, q_words, lo: int, hi: int, method: str):
+        if method == "hamming":
+            ham = _popcount(q_words[:, None, :] ^ np.asarray(self.words[lo:hi])[None, :, :])
+            return 1.0 - 2.0 * ham.astype(np.float32) / self.dim
+        block = np.asarray(self.vectors[lo:hi], dtype=np.float32)
+        return (queries.astype(np.float32) @ block.T) / np.float32(self.dim)
+
+    def _block_sizes(self, n_q: int, method: str, chunk_rows: int | None,
+                     query_rows: int | None) -> tuple[int, int]:
+        """(queries per block, codebook rows per chunk) within ``_CHUNK_BYTES``."""
+        # temporaries per (query, row) pair: XOR words + popcounts, or scores
+        pair_bytes = self.words.shape[1] * 16 + 16 if method == "hamming" else 8
+        pairs = max(1, _CHUNK_BYTES // pair_bytes)
+        if chunk_rows is None:
+            chunk_rows = max(1, min(len(self), math.isqrt(pairs),
+                                    _CHUNK_BYTES // (4 * 4 * self.dim)))   # float32 block ≤ ¼ budget
+        if query_rows is None:
+            query_rows = max(1, min(n_q, pairs // chunk_rows))
+        return query_rows, chunk_rows
+
+    def cleanup(self, queries: NDArray, k: int = 1, *, kind: str | None = "filler",
+                method: str = "hamming", n_threads: int | None = None,
+                chunk_rows: int | None = None,
+                query_rows: int | None = None) -> tuple[NDArray[np.int64], NDArray[np.float32]]:
+        """
+        Top-*k* codebook rows for each query.
+
+        Parameters
+        ----------
+        queries    : (D,) or (Q, D) noisy vectors (any real dtype; sign used
+                     for Hamming, raw values for matmul)
+        kind       : restrict to "filler" / "role" rows, or None for all
+        method     : "hamming" (packed popcount) or "matmul" (int8 → BLAS)
+        n_threads  : worker threads (default: ``parallel.get_num_threads()``)
+        chunk_rows : codebook rows per job (default: from a 64 MB budget)
+        query_rows : queries per block (default: from the same budget)
+
+        Returns
+        -------
+        rows   : (Q, k) int64 codebook rows, best first
+        scores : (Q, k) float32 cosine similarities
+        """
+        if method not in ("hamming", "matmul"):
+            raise ValueError(f"unknown cleanup method {method!r}")
+        queries = np.atleast_2d(np.asarray(queries))
+        if queries.shape[1] != self.dim:
+            raise ValueError(f"expected dim={self.dim}, got {queries.shape[1]}")
+        allowed = self.rows_of_kind(kind)
+        n_rows = len(self) if allowed is None else len(allowed)
+        if n_rows == 0:
+            raise ValueError(f"item memory holds no {kind!r} rows")
+        k = min(k, n_rows)
+
+        n_q = len(queries)
+        query_rows, chunk_rows = self._block_sizes(n_q, method, chunk_rows, query_rows)
+        bounds = chunk_bounds(len(self), chunk_rows)
+        q_words = None
+        if method == "hamming":                             # packed once, block by block
+            q_words = np.empty((n_q, self.words.shape[1]), dtype=np.uint64)
+            for q0 in range(0, n_q, query_rows):
+                block = queries[q0:q0 + query_rows]
+                q_words[q0:q0 + query_rows] = pack_bits(np.where(block >= 0, 1, -1).astype(np.int8))
+
+        def score(q0, q1, lo, hi):
+            words = None if q_words is None else q_words[q0:q1]
+            return self._score_chunk(queries[q0:q1], words, lo, hi, method)
+
+        return blocked_topk(score, n_q, bounds, k, query_rows=query_rows, allowed=allowed,
+                            n_threads=min(n_threads or get_num_threads(), len(bounds)))
+
+    def cleanup_keys(self, queries: NDArray, k: int = 1,
+                     **kwargs) -> list[list[tuple[str, float]]]:
+        """Like :meth:`cleanup` but returns ``[(key, score), …]`` per query."""
+        rows, scores = self.cleanup(queries, k, **kwargs)
+        return [[(self.keys[r], float(s)) for r, s in zip(rr, ss)]
+                for rr, ss in zip(rows, scores)]
+
+    @classmethod
+    def from_items(cls, items: Iterable[tuple[str, str, NDArray[np.int8]]]) -> "ItemMemory":
+        """In-memory codebook from ``(key, kind, vector)`` triples (no files)."""
+        items = list(items)
+        vecs = np.stack([np.asarray(v, dtype=np.int8) for _, _, v in items])
+        return cls([k for k, _, _ in items], [kind for _, kind, _ in items],
+                   vecs, pack_bits(vecs))
@@ -0,0 +1,41 @@
+# ── hydraedge.kernel.npy_cache ─────────────────────────────────────────────
+"""
+On-disk cache of derived ``.npy`` arrays (JL projections, w2hv projection
+matrices, compiled role registries).
+
+Each cache lives in a directory chosen per call – an explicit argument,
+else an environment variable, else ``~/.cache/hydraedge/<name>`` – so the
+variable can be redirected after import (tests point it at ``tmp_path``).
+Arrays are built once, written under a temporary name and renamed into
+place, then memory-mapped by every later caller and worker process.
+"""
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import Callable
+
+import numpy as np
+
+__all__ = ["resolve_cache_dir", "cached_npy"]
+
+
+def resolve_cache_dir(cache_dir: str | Path | None, env: str, name: str) -> Path:
+    """*cache_dir*, else ``$env`` (read now), else ``~/.cache/hydraedge/<name>``."""
+    return Path(cache_dir or os.getenv(env) or Path.home() / ".cache" / "hydraedge" / name)
+
+
+def cached_npy(path: str | Path, build: Callable[[], np.ndarray]) -> np.ndarray:
+    """
+    Memory-map the array at *path*, calling *build* and saving its result
+    first when the file does not exist.  Concurrent builders race
+    harmlessly: each writes a private temporary file and ``os.replace``
+    installs one of them atomically.
+    """
+    path = Path(path)
+    if not path.exists():
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp.npy")
+        np.save(tmp, build())
+        os.replace(tmp, path)
+    return np.load(path, mmap_mode="r")
@@ -0,0 +1,290 @@
+# ── hydraedge.kernel.packed ───────────────────────────────────────────────
+"""
+Bit-packed ±1 hyper-vectors.
+
+A D-dimensional ±1 vector is stored as ⌈D/64⌉ little-endian ``uint64``
+words: element *j* lives in bit ``j % 64`` of word ``j // 64`` and
+``+1 → 1``, ``−1 → 0``.  Pad bits past D are always zero.  At D = 4096
+that is 512 bytes per vector instead of 4 KB (int8) or 16 KB (float32).
+
+All operators work on the packed words and reproduce the int8 reference
+implementation bit for bit:
+
+* ``bind`` / ``unbind`` – header arithmetic of :mod:`kernel.bind_ops`
+  plus a cyclic rotation of the body *across* word boundaries.
+* ``majority_vote``    – bit-wise majority with the +1 tie-break of
+  :mod:`kernel.bundles`.
+* ``hamming`` / ``cosine`` – popcount of XOR;  for ±1 vectors
+  ``cos = 1 − 2·ham / D``.
+
+Every function accepts a single vector or a batch (leading axis N).
+"""
+from __future__ import annotations
+
+from typing import Sequence
+
+import numpy as np
+from numpy.typing import NDArray
+
+from hydraedge.kernel.bind_ops import _params
+
+__all__ = [
+    "PackedHV",
+    "pack_bits",
+    "unpack_bits",
+    "bind",
+    "unbind",
+    "majority_vote",
+    "hamming",
+    "cosine",
+]
+
+_WORD = 64
+
+
+# ────────────────────────── bit helpers ───────────────────────────────────
+
+
+def _n_words(dim: int) -> int:
+    return (dim + _WORD - 1) // _WORD
+
+
+def pack_bits(vecs: NDArray[np.int8]) -> NDArray[np.uint64]:
+    """(…, D) ±1 int8 → (…, ⌈D/64⌉) uint64 words."""
+    vecs = np.asarray(vecs)
+    dim = vecs.shape[-1]
+    as_bytes = np.packbits(vecs > 0, axis=-1, bitorder="little")
+    pad = 8 * _n_words(dim) - as_bytes.shape[-1]
+    if pad:
+        widths = [(0, 0)] * (as_bytes.ndim - 1) + [(0, pad)]
+        as_bytes = np.pad(as_bytes, widths)
+    return np.ascontiguousarray(as_bytes).view("<u8").astype(np.uint64, copy=False)
+
+
+def unpack_bits(words: NDArray[np.uint64], dim: int) -> NDArray[np.int8]:
+    """(…, W) uint64 words → (…, dim) ±1 int8."""
+    as_bytes = np.ascontiguousarray(words, dtype="<u8").view(np.uint8)
+    bits = np.unpackbits(as_bytes, axis=-1, count=dim, bitorder="little")
+    return (2 * bits.astype(np.int8) - 1).astype(np.int8, copy=False)
+
+
+def _low_mask(nbits: int, n_words: int) -> NDArray[np.uint64]:
+    """Word mask with the lowest *nbits* bits set."""
+    mask = np.zeros(n_words, dtype=np.uint64)
+    full, rest = divmod(nbits, _WORD)
+    mask[:full] = np.uint64(0xFFFFFFFFFFFFFFFF)
+    if rest:
+        mask[full] = np.uint64((1 << rest) - 1)
+    return mask
+
+
+def _gather_words(w: NDArray[np.uint64], idx: NDArray[np.int64]) -> NDArray[np.uint64]:
+    """``w[..., idx]`` per row, with out-of-range word indices reading 0."""
+    n_words = w.shape[-1]
+    idx = np.broadcast_to(idx, w.shape)
+    got = np.take_along_axis(w, np.clip(idx, 0, n_words - 1), axis=-1)
+    return np.where((idx >= 0) & (idx < n_words), got, np.uint64(0))
+
+
+def _shift(w: NDArray[np.uint64], s, *, left: bool) -> NDArray[np.uint64]:
+    """
+    Multi-word logical shift of each row of *w* (N, W) by *s* bits.
+
+    ``left`` moves bits towards higher element indices.  *s* is a scalar
+    or an (N,) array of per-row shifts.
+    """
+    s = np.asarray(s, dtype=np.int64).reshape(-1, 1)
+    q = s // _WORD
+    r = (s % _WORD).astype(np.uint64)
+    back = (np.uint64(_WORD) - r) & np.uint64(_WORD - 1)
+    cols = np.arange(w.shape[-1], dtype=np.int64)
+    if left:
+        main = _gather_words(w, cols - q) << r
+        carry = _gather_words(w, cols - q - 1) >> back
+    else:
+        main = _gather_words(w, cols + q) >> r
+        carry = _gather_words(w, cols + q + 1) << back
+    return main | np.where(r == 0, np.uint64(0), carry)
+
+
+def _header_shifts(w: NDArray[np.uint64], dim: int) -> NDArray[np.int64]:
+    """Decode the H-bit header of each row (cf. ``bind_ops._decode_shift``)."""
+    h, _, mod = _params(dim)
+    k = (w[:, 0] & np.uint64((1 << h) - 1)).astype(np.int64)
+    return k % mod
+
+
+def _rotate_body(w: NDArray[np.uint64], k, dim: int,
+                 new_k: NDArray[np.int64]) -> NDArray[np.uint64]:
+    """
+    Roll the body (bits H…D−1) of each row right by *k* and write *new_k*
+    into the header – the packed counterpart of ``bind_ops.bind``.
+    """
+    h, body_len, _ = _params(dim)
+    n_words = w.shape[-1]
+    body_mask = _low_mask(body_len, n_words)
+
+    k = np.asarray(k, dtype=np.int64) % body_len
+    body = _shift(w, h, left=False) & body_mask
+    rolled = (_shift(body, k, left=True) | _shift(body, body_len - k, left=False))
+    out = _shift(rolled & body_mask, h, left=True)
+    out[:, 0] |= new_k.astype(np.uint64)
+    return out
+
+
+# ────────────────────────── container ─────────────────────────────────────
+
+
+class PackedHV:
+    """
+    One or many bit-packed ±1 hyper-vectors.
+
+    ``words`` has shape (W,) for a single vector or (N, W) for a batch;
+    ``dim`` is the logical dimensionality D.
+    """
+
+    __slots__ = ("words", "dim")
+
+    def __init__(self, words: NDArray[np.uint64], dim: int):
+        words = np.asarray(words, dtype=np.uint64)
+        if words.shape[-1] != _n_words(dim):
+            raise ValueError(f"{words.shape[-1]} words cannot hold dim={dim}")
+        self.words = words
+        self.dim = dim
+
+    # ── conversion ────────────────────────────────────────────────────────
+    @classmethod
+    def from_int8(cls, vecs: NDArray[np.int8]) -> "PackedHV":
+        """Pack a (D,) or (N, D) ±1 array."""
+        vecs = np.asarray(vecs)
+        return cls(pack_bits(vecs), vecs.shape[-1])
+
+    def to_int8(self) -> NDArray[np.int8]:
+        """Lossless inverse of :meth:`from_int8`."""
+        return unpack_bits(self.words, self.dim)
+
+    # ── container protocol ────────────────────────────────────────────────
+    @property
+    def batched(self) -> bool:
+        return self.words.ndim == 2
+
+    @property
+    def nbytes(self) -> int:
+        return self.words.nbytes
+
+    def __len__(self) -> int:
+        if not self.batched:
+            raise TypeError("len() of a single PackedHV")
+        return self.words.shape[0]
+
+    def __getitem__(self, item) -> "PackedHV":
+        if not self.batched:
+            raise TypeError("cannot index a single PackedHV")
+        return PackedHV(self.words[item], self.dim)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, PackedHV):
+            return NotImplemented
+        return self.dim == other.dim and np.array_equal(self.words, other.words)
+
+    def __repr__(self) -> str:
+        shape = f"{len(self)}×" if self.batched else ""
+        return f"PackedHV({shape}{self.dim})"
+
+    def _rows(self) -> NDArray[np.uint64]:
+        return np.atleast_2d(self.words)
+
+
+def _same_dim(*hvs: PackedHV) -> int:
+    dims = {hv.dim for hv in hvs}
+    if len(dims) != 1:
+        raise ValueError(f"dimension mismatch: {sorted(dims)}")
+    return dims.pop()
+
+
+def _broadcast_rows(a: PackedHV, b: PackedHV) -> tuple[NDArray[np.uint64], NDArray[np.uint64]]:
+    """Row views of *a* and *b* broadcast to a common batch size."""
+    ra, rb = a._rows(), b._rows()
+    n = max(ra.shape[0], rb.shape[0])
+    if {ra.shape[0], rb.shape[0]} - {1, n}:
+        raise ValueError(f"batch size mismatch: {ra.shape[0]} vs {rb.shape[0]}")
+    return (np.broadcast_to(ra, (n, ra.shape[1])),
+            np.broadcast_to(rb, (n, rb.shape[1])))
+
+
+def _wrap(words: NDArray[np.uint64], dim: int, batched: bool) -> PackedHV:
+    return PackedHV(words if batched else words[0], dim)
+
+
+# ────────────────────────── public API ────────────────────────────────────
+
+
+def bind(role: PackedHV, filler: PackedHV) -> PackedHV:
+    """
+    Packed ``bind_ops.bind``.  A single *role* broadcasts over a batch of
+    fillers; otherwise batch sizes must match.
+    """
+    dim = _same_dim(role, filler)
+    _, _, mod = _params(dim)
+    r, f = _broadcast_rows(role, filler)
+
+    k_r = _header_shifts(r, dim)
+    k_f = _header_shifts(f, dim)
+    out = _rotate_body(f, k_r, dim, (k_r + k_f) % mod)
+    return _wrap(out, dim, filler.batched or role.batched)
+
+
+def unbind(bound: PackedHV, role: PackedHV) -> PackedHV:
+    """Packed ``bind_ops.unbind`` (inverse of :func:`bind`)."""
+    dim = _same_dim(bound, role)
+    _, _, mod = _params(dim)
+    b, r = _broadcast_rows(bound, role)
+
+    k_r = _header_shifts(r, dim)
+    k_b = _header_shifts(b, dim)
+    out = _rotate_body(b, -k_r, dim, (k_b - k_r) % mod)
+    return _wrap(out, dim, bound.batched or role.batched)
+
+
+def majority_vote(hvs: PackedHV | Sequence[PackedHV]) -> PackedHV:
+    """
+    Bit-wise majority across the rows of a batch (or a list of vectors).
+    Ties resolve to +1, matching ``bundles.majority_vote``.
+    """
+    if not isinstance(hvs, PackedHV):
+        if len(hvs) == 0:
+            raise ValueError("majority_vote() needs ≥1 vector")
+        dim = _same_dim(*hvs)
+        hvs = PackedHV(np.concatenate([hv._rows() for hv in hvs]), dim)
+    rows = hvs._rows()
+    n = rows.shape[0]
+
+    out = np.zeros(rows.shape[-1], dtype=np.uint64)
+    for b in range(_WORD):
+        ones = ((rows >> np.uint64(b)) & np.uint64(1)).sum(axis=0)
+        out |= (2 * ones >= n).astype(np.uint64) << np.uint64(b)
+    return PackedHV(out & _low_mask(hvs.dim, out.size), hvs.dim)
+
+
+def _popcount(w: NDArray[np.uint64]) -> NDArray[np.int64]:
+    if hasattr(np, "bitwise_count"):                      # NumPy ≥ 2.0
+        return np.bitwise_count(w).sum(axis=-1, dtype=np.int64)
+    as_bytes = np.ascontiguousarray(w).view(np.uint8)
+    return _BYTE_POP[as_bytes].sum(axis=-1, dtype=np.int64)
+
+
+_BYTE_POP = np.unpackbits(np.arange(256, dtype=np.uint8)[:, None], axis=1).sum(axis=1)
+
+
+def hamming(a: PackedHV, b: PackedHV) -> NDArray[np.int64] | int:
+    """Number of differing elements (broadcast over batches)."""
+    _same_dim(a, b)
+    dist = _popcount(a.words ^ b.words)
+    return int(dist) if np.ndim(dist) == 0 else dist
+
+
+def cosine(a: PackedHV, b: PackedHV) -> NDArray[np.float32] | float:
+    """Cosine similarity of ±1 vectors, ``1 − 2·ham / D``."""
+    dim = _same_dim(a, b)
+    sim = 1.0 - 2.0 * np.asarray(hamming(a, b), dtype=np.float32) / dim
+    return float(sim) if np.ndim(sim) == 0 else sim.astype(np.float32)
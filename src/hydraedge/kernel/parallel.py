@@ -0,0 +1,276 @@
+# ── hydraedge.kernel.parallel ─────────────────────────────────────────────
+"""
+Thread-parallel, chunked execution of batched kernel operations.
+
+The vectorised kernels (``bind_many``, ``BindPlan.bind``, γ-gating, JL
+projection, pair scoring) spend their time inside NumPy loops that
+release the GIL, so a plain ``ThreadPoolExecutor`` over row chunks keeps
+every core busy without copying inputs to worker processes.
+
+Every wrapper here writes into one preallocated ``out`` buffer: each job
+fills its own row slice, so nothing is concatenated afterwards.  Chunk
+boundaries depend only on the batch shape and ``chunk_rows`` – never on
+the worker count – so results are bit-identical for any ``n_threads``,
+including the sequential ``n_threads=1`` path.
+
+The worker count defaults to ``HYDRA_KERNEL_THREADS`` (or the CPU count)
+and can be changed process-wide with :func:`set_num_threads`.
+"""
+from __future__ import annotations
+
+import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, TypeVar
+
+import numpy as np
+from numpy.typing import NDArray
+
+from hydraedge.kernel import bind_ops, bundles, jl
+
+__all__ = [
+    "get_num_threads",
+    "set_num_threads",
+    "num_threads",
+    "chunk_bounds",
+    "run_chunks",
+    "ordered_map",
+    "bind_many",
+    "unbind_many",
+    "plan_bind",
+    "gamma_gate_many",
+    "majority_vote",
+    "project",
+    "forward_pairs",
+]
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+_CHUNK_BYTES = 1 << 20              # input bytes per job – keeps a chunk cache-resident
+_num_threads: int | None = None
+
+
+# ────────────────────────── configuration ─────────────────────────────────
+
+
+def get_num_threads() -> int:
+    """Worker count used when a call does not pass ``n_threads``."""
+    if _num_threads is not None:
+        return _num_threads
+    env = os.getenv("HYDRA_KERNEL_THREADS")
+    return int(env) if env else (os.cpu_count() or 1)
+
+
+def set_num_threads(n: int | None) -> None:
+    """Set the process-wide worker count (None → environment / CPU count)."""
+    global _num_threads
+    if n is not None and n < 1:
+        raise ValueError(f"need at least one worker thread, got {n}")
+    _num_threads = n
+
+
+@contextmanager
+def num_threads(n: int | None) -> Iterator[None]:
+    """Temporarily override the worker count: ``with num_threads(1): …``."""
+    previous = _num_threads
+    set_num_threads(n)
+    try:
+        yield
+    finally:
+        set_num_threads(previous)
+
+
+# ────────────────────────── executor ──────────────────────────────────────
+
+
+def chunk_bounds(n: int, chunk_rows: int) -> list[tuple[int, int]]:
+    """``[(lo, hi), …]`` row ranges of at most *chunk_rows* covering ``range(n)``."""
+    if chunk_rows < 1:
+        raise ValueError(f"chunk_rows must be ≥ 1, got {chunk_rows}")
+    return [(lo, min(lo + chunk_rows, n)) for lo in range(0, n, chunk_rows)]
+
+
+def _default_chunk(row_bytes: int) -> int:
+    return max(1, _CHUNK_BYTES // max(1, row_bytes))
+
+
+def run_chunks(fn: Callable[[int, int], T], n: int, *, chunk_rows: int,
+               n_threads: int | None = None) -> list[T]:
+    """
+    Call ``fn(lo, hi)`` for every chunk of ``range(n)`` and return the
+    results in chunk order.  Runs inline when only one worker or one
+    chunk is involved.
+    """
+    bounds = chunk_bounds(n, chunk_rows)
+    workers = min(n_threads or get_num_threads(), len(bounds))
+    if workers <= 1:
+        return [fn(lo, hi) for lo, hi in bounds]
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(lambda b: fn(*b), bounds))
+
+
+def ordered_map(fn: Callable[[T], R], items: Iterable[T], *,
+                n_threads: int | None = None) -> Iterator[R]:
+    """
+    Lazy ``map(fn, items)`` on a thread pool: results come back in order
+    and at most 2 · workers jobs are in flight, so a consumer folding the
+    results keeps memory bounded.  Runs inline with one worker.
+    """
+    workers = n_threads or get_num_threads()
+    if workers <= 1:
+        yield from map(fn, items)
+        return
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for item in items:
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+            pending.append(pool.submit(fn, item))
+        while pending:
+            yield pending.popleft().result()
+
+
+def _out(out: NDArray | None, shape: tuple[int, ...], dtype) -> NDArray:
+    if out is None:
+        return np.empty(shape, dtype=dtype)
+    if out.shape != shape:
+        raise ValueError(f"out has shape {out.shape}, expected {shape}")
+    return out
+
+
+def _rows(vecs: NDArray, lo: int, hi: int) -> NDArray:
+    """Row slice of a batch operand; (D,) operands broadcast unchanged."""
+    return vecs if vecs.ndim == 1 else vecs[lo:hi]
+
+
+# ────────────────────────── batched operations ────────────────────────────
+
+
+def bind_many(role_vecs: NDArray[np.int8], filler_vecs: NDArray[np.int8], *,
+              out: NDArray[np.int8] | None = None, n_threads: int | None = None,
+              chunk_rows: int | None = None) -> NDArray[np.int8]:
+    """Chunked ``bind_ops.bind_many``."""
+    role_vecs, filler_vecs = np.asarray(role_vecs), np.asarray(filler_vecs)
+    bind_ops._check_batch(filler_vecs, role_vecs)
+    out = _out(out, filler_vecs.shape, np.int8)
+
+    def job(lo, hi):
+        bind_ops.bind_many(_rows(role_vecs, lo, hi), filler_vecs[lo:hi], out=out[lo:hi])
+
+    run_chunks(job, len(filler_vecs), n_threads=n_threads,
+               chunk_rows=chunk_rows or _default_chunk(filler_vecs.shape[1]))
+    return out
+
+
+def unbind_many(bound_vecs: NDArray[np.int8], role_vecs: NDArray[np.int8], *,
+                out: NDArray[np.int8] | None = None, n_threads: int | None = None,
+                chunk_rows: int | None = None) -> NDArray[np.int8]:
+    """Chunked ``bind_ops.unbind_many``."""
+    bound_vecs, role_vecs = np.asarray(bound_vecs), np.asarray(role_vecs)
+    bind_ops._check_batch(bound_vecs, role_vecs)
+    out = _out(out, bound_vecs.shape, np.int8)
+
+    def job(lo, hi):
+        bind_ops.unbind_many(bound_vecs[lo:hi], _rows(role_vecs, lo, hi), out=out[lo:hi])
+
+    run_chunks(job, len(bound_vecs), n_threads=n_threads,
+               chunk_rows=chunk_rows or _default_chunk(bound_vecs.shape[1]))
+    return out
+
+
+def plan_bind(plan: bind_ops.BindPlan, filler_vecs: NDArray[np.int8], *,
+              out: NDArray[np.int8] | None = None, n_threads: int | None = None,
+              chunk_rows: int | None = None) -> NDArray[np.int8]:
+    """Chunked ``BindPlan.bind`` over the rows of an (N, D) batch."""
+    filler_vecs = np.asarray(filler_vecs)
+    out = _out(out, filler_vecs.shape, np.int8)
+
+    def job(lo, hi):
+        plan.bind(filler_vecs[lo:hi], out=out[lo:hi])
+
+    run_chunks(job, len(filler_vecs), n_threads=n_threads,
+               chunk_rows=chunk_rows or _default_chunk(filler_vecs.shape[1]))
+    return out
+
+
+def gamma_gate_many(bound: NDArray[np.int8], filler: NDArray[np.int8],
+                    gamma: float | NDArray, *, out: NDArray[np.int8] | None = None,
+                    n_threads: int | None = None,
+                    chunk_rows: int | None = None) -> NDArray[np.int8]:
+    """Chunked ``bundles.gamma_gate_many`` (*gamma* scalar or per row)."""
+    bound, filler = np.asarray(bound), np.asarray(filler)
+    if not np.isscalar(gamma):                # scalars keep their type (see _gate_side)
+        gamma = np.asarray(gamma)
+    out = _out(out, bound.shape, np.int8)
+
+    def job(lo, hi):
+        g = gamma if np.ndim(gamma) == 0 else gamma[lo:hi]
+        bundles.gamma_gate_many(bound[lo:hi], filler[lo:hi], g, out=out[lo:hi])
+
+    run_chunks(job, len(bound), n_threads=n_threads,
+               chunk_rows=chunk_rows or _default_chunk(bound.shape[1]))
+    return out
+
+
+def majority_vote(vecs: NDArray[np.int8], *, n_threads: int | None = None,
+                  chunk_rows: int | None = None) -> NDArray[np.int8]:
+    """
+    Majority vote over the rows of an (N, D) batch: one ``Bundler`` per
+    chunk, merged in chunk order.  Integer counters make this exact.
+    """
+    vecs = np.asarray(vecs)
+    if vecs.ndim != 2 or len(vecs) == 0:
+        raise ValueError(f"expected a non-empty (N, D) matrix, got shape {vecs.shape}")
+    parts = run_chunks(lambda lo, hi: bundles.Bundler(vecs.shape[1]).add_many(vecs[lo:hi]),
+                       len(vecs), n_threads=n_threads,
+                       chunk_rows=chunk_rows or _default_chunk(vecs.shape[1]))
+    total = bundles.Bundler(vecs.shape[1])
+    for part in parts:
+        total.merge(part)
+    return total.finalize()
+
+
+def project(E: NDArray, dim: int, *, binarize: bool = False, seed: int = 0,
+            cache_dir: str | Path | None = None, out: NDArray | None = None,
+            n_threads: int | None = None, chunk_rows: int | None = None) -> NDArray:
+    """Chunked ``jl.project`` of the rows of an (N, D) batch to *dim* columns."""
+    E = np.asarray(E)
+    proj = jl._projector(E.shape[1], dim, seed, cache_dir)
+    out = _out(out, (len(E), dim), np.int8 if binarize else np.float32)
+
+    def job(lo, hi):
+        out[lo:hi] = proj(E[lo:hi], binarize=binarize)
+
+    run_chunks(job, len(E), n_threads=n_threads,
+               chunk_rows=chunk_rows or _default_chunk(4 * E.shape[1]))
+    return out
+
+
+def forward_pairs(kernel, E_a: NDArray, E_b: NDArray, *,
+                  out: NDArray[np.float32] | None = None,
+                  S_a: NDArray | None = None, S_b: NDArray | None = None,
+                  mem_budget: int | None = None, n_threads: int | None = None,
+                  chunk_rows: int | None = None) -> NDArray[np.float32]:
+    """
+    ``kernel.forward_pairs`` split over row blocks of E_a (*kernel* is a
+    ``checks.HybridKernel``).  E_b's per-row factors are computed once,
+    before the workers start, and shared by every block; each block only
+    factors its own E_a rows.  Blocks default to one score-tile height
+    (``kernel.tile_rows``), so each worker does the same work per block
+    as one sequential tile row and holds at most *mem_budget* bytes.
+    """
+    E_a, E_b = np.atleast_2d(E_a), np.atleast_2d(E_b)
+    budget = {} if mem_budget is None else {"mem_budget": mem_budget}
+    F_b = kernel.factors(E_b, "b", S=S_b, **budget)
+    out = _out(out, (len(E_a), len(E_b)), np.float32)
+
+    def job(lo, hi):
+        kernel.forward_pairs(E_a[lo:hi], E_b, out=out[lo:hi], F_b=F_b,
+                             S_a=None if S_a is None else S_a[lo:hi], **budget)
+
+    run_chunks(job, len(E_a), n_threads=n_threads,
+               chunk_rows=chunk_rows or kernel.tile_rows(**budget))
+    return out
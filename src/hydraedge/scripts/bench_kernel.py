@@ -0,0 +1,75 @@
+"""
+CLI: hydra-bench-kernel — time the hypervector kernel and catch regressions
+----------------------------------------------------------------------------
+
+Examples
+--------
+# full grid (D ∈ {1k, 4k, 16k, 64k} × batch ∈ {1, 64, 1024}) → JSON
+hydra-bench-kernel --out bench.json
+
+# quick subset, compared against a stored baseline (exit 1 on regression)
+hydra-bench-kernel --ops bind unbind --dims 4096 --baseline base.json \\
+                   --threshold 0.15 --op-threshold jl.project=0.3
+
+# record a new baseline
+hydra-bench-kernel --save-baseline base.json
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+
+from hydraedge.benchmarks.kernel.cases import CASES
+from hydraedge.benchmarks.kernel.runner import (
+    BATCHES, DEFAULT_THRESHOLD, DIMS, compare, load, run_suite, save,
+)
+
+
+def parse_args(argv=None):
+    p = argparse.ArgumentParser(prog="hydra-bench-kernel")
+    p.add_argument("--ops", nargs="+", choices=sorted(CASES), default=None,
+                   help="Subset of operations (default: all)")
+    p.add_argument("--dims", nargs="+", type=int, default=list(DIMS))
+    p.add_argument("--batches", nargs="+", type=int, default=list(BATCHES))
+    p.add_argument("--repeat", type=int, default=5)
+    p.add_argument("-o", "--out", default=None, help="Write results JSON here")
+    p.add_argument("--baseline", default=None, help="Baseline JSON to compare against")
+    p.add_argument("--save-baseline", default=None, help="Write results as new baseline")
+    p.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                   help="Allowed median slow-down as a fraction (default 0.10)")
+    p.add_argument("--op-threshold", action="append", default=[], metavar="OP=FRAC",
+                   help="Per-op threshold override, repeatable")
+    return p.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    per_op = {}
+    for item in args.op_threshold:
+        op, _, frac = item.partition("=")
+        per_op[op] = float(frac)
+
+    result = run_suite(args.ops, args.dims, args.batches, args.repeat)
+    for r in result["results"]:
+        print(f"{r['op']:<15} D={r['dim']:<6} N={r['batch']:<5} "
+              f"median {r['median_s'] * 1e3:9.3f} ms   min {r['min_s'] * 1e3:9.3f} ms")
+
+    if args.out:
+        save(result, args.out)
+        print(f"✅  results → {args.out}")
+    if args.save_baseline:
+        save(result, args.save_baseline)
+        print(f"✅  baseline → {args.save_baseline}")
+
+    if args.baseline:
+        regressions = compare(result, load(args.baseline), args.threshold, per_op)
+        for r in regressions:
+            print(f"❌  {r['op']} D={r['dim']} N={r['batch']}: "
+                  f"{r['ratio']:.2f}× baseline (limit {1 + r['threshold']:.2f}×)")
+        if regressions:
+            sys.exit(1)
+        print("✅  no regressions against baseline")
+
+
+if __name__ == "__main__":
+    main()
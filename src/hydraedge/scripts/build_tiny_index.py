@@ -3,6 +3,7 @@
 build_tiny_index.py  – offline helper that:
 
 1. encodes `data/sample/tiny_corpus.jsonl` → vectors.npy
+   (+ vectors.slots.npy – cached kernel slot features)
 2. builds a faiss HNSW index (CPU or GPU)
 3. writes tiny.index  (faiss native binary)
 
@@ -10,10 +11,12 @@ Run from repo root:
 
     python scripts/build_tiny_index.py
 """
+import json
 from pathlib import Path
 import numpy as np
 from hydraedge.index.faiss_index import FaissIndex
 from hydraedge.encoder.chv_encoder import ChvEncoder
+from hydraedge.kernel.checks import save_slot_features
 
 CORPUS   = Path("data/sample/tiny_corpus.jsonl")
 VEC_FILE = Path("vectors.npy")
@@ -23,11 +26,11 @@ IDX_FILE = Path("tiny.index")
 def main():
     print("◼︎ encoding corpus …")
     enc = ChvEncoder()
-    vecs = np.stack([enc.encode_json(l)
-                     for l in map(lambda x: __import__("json").loads(x),
-                                  CORPUS.read_text().splitlines())]).astype("float32")
+    records = [json.loads(l) for l in CORPUS.read_text().splitlines() if l.strip()]
+    vecs = enc.encode_many(records, out=np.empty((len(records), enc.dim), dtype=np.float32))
     VEC_FILE.write_bytes(b"")  # touch
     np.save(VEC_FILE, vecs)
+    save_slot_features(VEC_FILE)
 
     print("◼︎ building faiss HNSW …")
     ix = FaissIndex(dim=vecs.shape[1], metric="cosine")
@@ -12,6 +12,12 @@ hydra-encode \
 
 # encode + write separate id list
 hydra-encode -i my.jsonl -o my.npy -d ids.txt
+
+# also cache kernel slot features next to the vectors (my.slots.npy)
+hydra-encode -i my.jsonl -o my.npy --slots
+
+# keep pre-sign accumulators (my.acc.hv / .keys) for ChvEncoder.update()
+hydra-encode -i my.jsonl -o my.npy -d ids.txt --accumulators my.acc
 """
 from __future__ import annotations
 import argparse, json, sys
@@ -19,6 +25,8 @@ import numpy as np
 from pathlib import Path
 from hydraedge.encoder.chv_encoder import ChvEncoder           # <- already exists
 
+CHUNK = 4096                                    # records per encode_many call
+
 
 def parse_args(argv=None):
     p = argparse.ArgumentParser(prog="hydra-encode")
@@ -28,6 +36,10 @@ def parse_args(argv=None):
                    help="Output .npy file (float32 vectors)")
     p.add_argument("-d", "--ids-out", default=None,
                    help="Optional txt file with one doc-id per line")
+    p.add_argument("--slots", action="store_true",
+                   help="Also write <out>.slots.npy kernel slot features")
+    p.add_argument("--accumulators", default=None,
+                   help="HVStore path stem for per-record vote sums (incremental updates)")
     p.add_argument("--model", default="chv:default",
                    help="Encoder name (future-proof – unused for now)")
     return p.parse_args(argv)
@@ -39,21 +51,37 @@ def main(argv=None):
     out  = Path(args.out).with_suffix(".npy")
     ids_out = Path(args.ids_out) if args.ids_out else None
 
-    enc = ChvEncoder()                           # 4096-d default
+    enc = ChvEncoder(accumulators=args.accumulators)   # 4096-d default
+
+    with inp.open() as fh:
+        n = sum(1 for line in fh if line.strip())
 
-    vecs, ids = [], []
+    # signs are written straight into the float32 .npy – no list, no stack
+    out.parent.mkdir(parents=True, exist_ok=True)
+    vecs_np = np.lib.format.open_memmap(out, mode="w+", dtype=np.float32,
+                                        shape=(n, enc.dim))
+    ids, chunk = [], []
     with inp.open() as fh:
         for line in fh:
+            if not line.strip():
+                continue
             rec = json.loads(line)
-            vecs.append(enc.encode_json(rec))
+            chunk.append(rec)
             ids.append(rec.get("id") or rec.get("_id") or str(len(ids)))
-
-    vecs_np = np.stack(vecs).astype("float32")
-    out.parent.mkdir(parents=True, exist_ok=True)
-    np.save(out, vecs_np)
+            if len(chunk) == CHUNK:
+                enc.encode_many(chunk, out=vecs_np[len(ids) - len(chunk):len(ids)],
+                                ids=ids[len(ids) - len(chunk):])
+                chunk = []
+    if chunk:
+        enc.encode_many(chunk, out=vecs_np[len(ids) - len(chunk):len(ids)],
+                        ids=ids[len(ids) - len(chunk):])
+    vecs_np.flush()
     if ids_out:
         ids_out.parent.mkdir(parents=True, exist_ok=True)
         ids_out.write_text("\n".join(map(str, ids)))
+    if args.slots:
+        from hydraedge.kernel.checks import save_slot_features
+        print(f"    slots → {save_slot_features(out)}")
 
     print(f"✅  wrote {len(vecs_np)} × {vecs_np.shape[1]} → {out}")
     if ids_out:
@@ -0,0 +1,53 @@
+"""Unit tests for the kernel micro-benchmark runner."""
+from __future__ import annotations
+
+import json
+
+import numpy as np
+
+from hydraedge.benchmarks.kernel.cases import CASES
+from hydraedge.benchmarks.kernel.runner import compare, run_suite
+from hydraedge.kernel import checks
+from hydraedge.scripts.bench_kernel import main
+
+
+def test_run_suite_covers_every_case() -> None:
+    result = run_suite(dims=[1024], batches=[1, 4], repeat=1)
+    seen = {(r["op"], r["batch"]) for r in result["results"]}
+    assert seen == {(op, b) for op in CASES for b in (1, 4)}
+    assert all(r["median_s"] >= 0 for r in result["results"])
+
+
+def test_compare_flags_only_slowdowns_over_threshold() -> None:
+    def res(t_bind, t_jl):
+        return {"results": [
+            {"op": "bind", "dim": 4096, "batch": 1, "median_s": t_bind},
+            {"op": "jl.project", "dim": 4096, "batch": 1, "median_s": t_jl},
+        ]}
+
+    base = res(1.0, 1.0)
+    assert compare(res(1.05, 1.0), base) == []
+    regs = compare(res(1.2, 1.2), base, threshold=0.1, per_op={"jl.project": 0.5})
+    assert [r["op"] for r in regs] == ["bind"]
+
+
+def test_cli_writes_json_and_checks_baseline(tmp_path) -> None:
+    base = tmp_path / "base.json"
+    main(["--ops", "bind", "--dims", "1024", "--batches", "1",
+          "--repeat", "1", "--save-baseline", str(base)])
+    data = json.loads(base.read_text())
+    assert data["results"][0]["op"] == "bind"
+    # a huge threshold can never regress
+    main(["--ops", "bind", "--dims", "1024", "--batches", "1", "--repeat", "1",
+          "--baseline", str(base), "--threshold", "1000"])
+
+
+def test_checks_cases_time_public_entry_points(monkeypatch, tmp_path) -> None:
+    calls = []
+    for name in ("slot_sum", "slot_sum_many", "forward", "forward_many"):
+        monkeypatch.setattr(checks, name, lambda *a, _n=name, **kw: calls.append(_n))
+
+    for op in ("slot_sum", "checks.forward"):
+        for batch in (1, 4):
+            CASES[op](checks.D, batch, np.random.default_rng(0), tmp_path)()
+    assert calls == ["slot_sum", "slot_sum_many", "forward", "forward_many"]
@@ -0,0 +1,22 @@
+"""Fixtures shared by every unit-test package."""
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _hydra_caches(tmp_path_factory, monkeypatch):
+    """Keep the JL, w2hv and role-registry ``.npy`` caches out of ``~/.cache``."""
+    root = tmp_path_factory.mktemp("cache")
+    for env, name in (("HYDRA_JL_CACHE", "jl"), ("HYDRA_W2HV_CACHE", "w2hv"),
+                      ("HYDRA_ROLE_CACHE", "roles")):
+        monkeypatch.setenv(env, str(root / name))
+
+
+@pytest.fixture
+def rand_hv():
+    """``rand_hv(rng, *shape)`` – random ±1 int8 hyper-vectors of *shape*."""
+    def draw(rng: np.random.Generator, *shape: int) -> np.ndarray:
+        return rng.choice(np.array([-1, 1], dtype=np.int8), size=shape)
+    return draw
@@ -0,0 +1,33 @@
+"""Shared fixtures for the encoder unit tests."""
+from __future__ import annotations
+
+import pytest
+
+
+def _payload(subj: str, pred: str, obj: str, extra_eid: bool = False) -> dict:
+    nodes = [
+        {"id": f"spo:{subj}@e1", "filler": subj, "alias_key": subj.lower(),
+         "roles": ["Subject"], "eid_set": ["e1"], "ntype": "spo"},
+        {"id": f"spo:{pred}@e1", "filler": pred, "alias_key": pred,
+         "roles": ["Predicate"], "eid_set": ["e1"], "ntype": "spo"},
+        {"id": f"spo:{obj}@e1", "filler": obj, "alias_key": obj,
+         "roles": ["Object"], "eid_set": ["e1"], "ntype": "spo"},
+        {"id": "attr:e1:VerbClass:51.1", "filler": "perceive",
+         "roles": ["VerbClass"], "eid_set": ["e1"], "ntype": "attr"},
+        {"id": "attr:e1:Tense:past", "filler": " Past ", "roles": ["Tense"],
+         "eid_set": ["e2" if extra_eid else "e1"], "ntype": "attr"},
+        {"id": "chv:main", "filler": "CHV", "roles": ["CHV"], "eid_set": [], "ntype": "chv"},
+    ]
+    edges = [
+        {"source": f"spo:{subj}@e1", "target": f"spo:{pred}@e1", "kind": "S-P"},
+        {"source": f"spo:{pred}@e1", "target": f"spo:{obj}@e1", "kind": "P-O"},
+        {"source": f"spo:{obj}@e1", "target": "chv:main", "kind": "binder"},
+    ]
+    return {"version": "2.4", "nodes": nodes, "edges": edges}
+
+
+@pytest.fixture
+def payloads() -> list[dict]:
+    """Three small SPO payloads; the third puts its Tense attr on another eid."""
+    return [_payload("Dog", "chase", "cat"), _payload("cat", "chase", "dog"),
+            _payload("bird", "see", "worm", extra_eid=True)]
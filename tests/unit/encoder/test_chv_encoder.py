@@ -0,0 +1,69 @@
+"""Unit tests for *chv_encoder* – plan-based binding of payload pairs."""
+from __future__ import annotations
+
+import json
+
+import numpy as np
+import pytest
+
+from hydraedge.encoder.chv_encoder import PLANS, ROLES, ChvEncoder, filler_vec, role_vec
+from hydraedge.kernel.bind_ops import bind
+from hydraedge.kernel.bundles import majority_vote
+
+_PAYLOAD = {
+    "version": "2.4",
+    "nodes": [
+        {"id": "spo:dog@e1", "filler": "dog", "alias_key": "dog", "roles": ["Subject"], "ntype": "spo"},
+        {"id": "spo:chase@e1", "filler": "chase", "alias_key": "chase", "roles": ["Predicate"], "ntype": "spo"},
+        {"id": "spo:cat@e1", "filler": "cat", "alias_key": "cat", "roles": ["Object"], "ntype": "spo"},
+        {"id": "attr:e1:Attr:brown", "filler": "brown", "roles": ["Attr"], "ntype": "attr"},
+        {"id": "chv:main", "filler": "CHV", "roles": ["CHV"], "ntype": "chv"},
+    ],
+}
+
+
+def test_every_registry_role_has_a_plan() -> None:
+    assert set(PLANS) == set(ROLES)
+
+
+def test_encode_matches_scalar_bind_and_bundle() -> None:
+    pairs = [("Subject", "dog"), ("Predicate", "chase"), ("Object", "cat"), ("Attr", "brown")]
+    want = majority_vote([bind(role_vec[r], filler_vec(f)) for r, f in pairs])
+
+    got = ChvEncoder().encode_json(_PAYLOAD)
+    assert got.dtype == np.int8
+    assert np.array_equal(got, want)
+
+
+def test_encode_many_matches_encode_json() -> None:
+    other = {**_PAYLOAD, "nodes": _PAYLOAD["nodes"][1:]}
+    records = [_PAYLOAD, json.dumps(other), _PAYLOAD]
+    enc = ChvEncoder()
+    want = np.stack([enc.encode_json(r) for r in records])
+
+    assert np.array_equal(enc.encode_many(records, chunk=2), want)
+    out = np.empty((3, enc.dim), dtype=np.float32)
+    assert enc.encode_many(records, out=out) is out
+    assert np.array_equal(out, want)
+
+    with pytest.raises(ValueError):
+        enc.encode_many([{"version": "2.4", "nodes": [_PAYLOAD["nodes"][-1]]}])
+
+
+def test_update_matches_full_reencode(tmp_path) -> None:
+    enc = ChvEncoder(accumulators=tmp_path / "acc")
+    enc.encode_many([_PAYLOAD, _PAYLOAD], ids=["a", "b"])
+
+    old_node = _PAYLOAD["nodes"][3]                            # Attr: brown
+    new_node = {**old_node, "filler": "grey", "roles": ["Type"]}
+    upd = enc.update("a", added_nodes=[new_node], removed_nodes=[old_node])
+
+    edited = {**_PAYLOAD, "nodes": [*_PAYLOAD["nodes"][:3], new_node, _PAYLOAD["nodes"][4]]}
+    assert np.array_equal(upd.vector, ChvEncoder().encode_json(edited))
+    assert upd.changed and upd.n_flipped > 0
+
+    # a no-op edit leaves the indexed vector valid
+    ids, vecs = enc.update_many([("b", [old_node], [old_node]), ("a", [], [])])
+    assert ids == [] and vecs.shape == (0, enc.dim)
+    with pytest.raises(KeyError):
+        enc.update("missing", added_nodes=[new_node])
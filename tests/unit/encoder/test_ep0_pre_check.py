@@ -13,7 +13,13 @@ from typing import Generator
 
 import pytest
 
-from hydraedge.encoder.ep0_pre_check import PayloadValidationError, validate
+from hydraedge.encoder.ep0_pre_check import (
+    PayloadValidationError,
+    load_roles,
+    validate,
+    validate_jsonl,
+    validate_many,
+)
 
 # ------------------------------------------------------------------------------
 # Helpers – load sample payload --------------------------------------------------
@@ -61,3 +67,77 @@ def test_duplicate_alias_key_fails() -> None:
     )
     with pytest.raises(PayloadValidationError):
         validate(payload, _load_roles())
+
+
+# ------------------------------------------------------------------------------
+# Corpus validation -------------------------------------------------------------
+
+
+def _mini_payload(role: str = "AGENT", kind: str = "S-P") -> dict:
+    return {
+        "version": "2.4",
+        "nodes": [
+            {"id": "s1", "ntype": "spo", "filler": "dog", "alias_key": "dog", "roles": [role]},
+            {"id": "s2", "ntype": "spo", "filler": "bark", "alias_key": "bark", "roles": ["PATIENT"]},
+            {"id": "chv", "ntype": "chv", "filler": "CHV", "roles": []},
+        ],
+        "edges": [
+            {"source": "s1", "target": "s2", "kind": kind},
+            {"source": "s2", "target": "chv", "kind": "binder"},
+        ],
+    }
+
+
+def test_validate_many_counts_every_error_type() -> None:
+    roles = {"AGENT", "PATIENT"}
+    both_bad = _mini_payload(role="NOPE", kind="weird")
+    report = validate_many([_mini_payload(), both_bad, _mini_payload(kind="weird")], roles,
+                           chunk_size=2)
+    assert (report.n_payloads, report.n_valid) == (3, 1)
+    assert report.errors == {"unknown_role": 1, "unknown_edge_kind": 2}
+    assert report.examples["unknown_edge_kind"] == "unknown edge kind: 'weird'"
+
+    with pytest.raises(PayloadValidationError, match="unknown role strings"):
+        validate(both_bad, roles)                  # first problem only
+
+
+def test_validate_jsonl_with_pool_and_cached_roles(tmp_path: Path) -> None:
+    tsv = tmp_path / "roles.tsv"
+    tsv.write_text("AGENT\t1\nPATIENT\t2\n", encoding="utf-8")
+    corpus = tmp_path / "corpus.jsonl"
+    lines = [json.dumps(_mini_payload()) for _ in range(5)] + ["{not json", ""]
+    corpus.write_text("\n".join(lines), encoding="utf-8")
+
+    serial = validate_jsonl(corpus, tsv, chunk_size=2)
+    pooled = validate_jsonl(corpus, tsv, n_workers=2, chunk_size=2)
+    for report in (serial, pooled):
+        assert (report.n_payloads, report.n_valid) == (6, 5)
+        assert report.errors == {"bad_json": 1}
+
+    assert load_roles(tsv) is load_roles(tsv)
+    tsv.write_text("AGENT\t1\n", encoding="utf-8")
+    assert load_roles(tsv) == {"AGENT"}
+
+
+def test_malformed_records_are_counted_not_raised(tmp_path: Path) -> None:
+    tsv = tmp_path / "roles.tsv"
+    tsv.write_text("AGENT\t1\nPATIENT\t2\n", encoding="utf-8")
+    no_id = _mini_payload()
+    del no_id["nodes"][0]["id"]
+    bad_hull = _mini_payload()
+    bad_hull["layouts"] = {"hulls": [{"members": ["s1", "ghost"]}]}   # no "eid"
+    odd_hull = _mini_payload()
+    odd_hull["layouts"] = {"hulls": ["s1"]}
+    corpus = tmp_path / "corpus.jsonl"
+    lines = [json.dumps(p) for p in (_mini_payload(), no_id, bad_hull, odd_hull)]
+    lines += ["[1, 2]", '"text"', json.dumps({"version": "2.4", "nodes": [1], "edges": [2]})]
+    corpus.write_text("\n".join(lines), encoding="utf-8")
+
+    report = validate_jsonl(corpus, tsv, chunk_size=3)
+    assert (report.n_payloads, report.n_valid) == (7, 1)
+    assert report.errors["not_object"] == 3
+    assert report.errors["missing_id"] == 1
+    assert report.errors["hull_members"] == 1
+    assert report.errors["malformed"] == 1
+    with pytest.raises(PayloadValidationError, match="JSON object"):
+        validate([1, 2], {"AGENT"})
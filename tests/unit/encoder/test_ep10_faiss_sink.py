@@ -0,0 +1,114 @@
+"""Unit tests for the E10 sinks."""
+from __future__ import annotations
+
+import time
+
+import numpy as np
+import pytest
+
+from hydraedge.encoder.ep10_faiss_sink import BufferedFaissSink, checkpointed_ids
+from hydraedge.encoder.pipeline import EncoderPipeline, PipelineConfig
+from hydraedge.index import HammingIndex
+
+
+def _rows(n: int, dim: int = 128, seed: int = 0) -> np.ndarray:
+    return np.random.default_rng(seed).choice([-1, 1], size=(n, dim)).astype(np.int8)
+
+
+class _SlowIndex:
+    def __init__(self):
+        self.calls: list[np.ndarray] = []
+
+    def add(self, vecs, ids):
+        time.sleep(0.01)
+        self.calls.append(np.array(ids))
+
+
+def test_ring_buffer_wraps_and_checkpoints(tmp_path) -> None:
+    vecs = _rows(50)
+    index = HammingIndex(128)
+    ckpt = tmp_path / "added.ids"
+    with BufferedFaissSink(index, 128, capacity=16, flush_rows=8, checkpoint=ckpt) as sink:
+        for lo in range(0, 50, 7):
+            sink.put(vecs[lo:lo + 7], np.arange(lo, min(lo + 7, 50)))
+    assert index.ntotal == sink.n_added == 50
+    assert checkpointed_ids(ckpt).tolist() == list(range(50))
+    _, ids = index.search(vecs[33:34], k=1)
+    assert ids[0, 0] == 33
+
+
+def test_flushes_on_size_and_age() -> None:
+    index = _SlowIndex()
+    sink = BufferedFaissSink(index, 128, capacity=64, flush_rows=32, flush_secs=0.05)
+    sink.put(_rows(40), np.arange(40))
+    sink.put(_rows(3), np.arange(40, 43))
+    deadline = time.monotonic() + 2.0
+    while sink.n_added < 43 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert sink.n_added == 43                      # no flush() needed
+    assert len(index.calls[0]) >= 32
+    sink.close()
+
+
+def test_index_error_surfaces_to_producer() -> None:
+    class Broken:
+        def add(self, vecs, ids):
+            raise OSError("disk full")
+
+    sink = BufferedFaissSink(Broken(), 128, capacity=8, flush_rows=4)
+    sink.put(_rows(4), np.arange(4))
+    with pytest.raises(RuntimeError, match="background index flush failed"):
+        sink.flush()
+    with pytest.raises(RuntimeError):
+        sink.close()
+
+
+def test_pipeline_drains_buffered_sink(payloads) -> None:
+    index = HammingIndex(4096)
+    sink = BufferedFaissSink(index, 4096, capacity=4, flush_rows=2, flush_secs=60)
+    EncoderPipeline(PipelineConfig(batch_size=1), sink=sink).encode(payloads)
+    assert index.ntotal == 3
+    sink.close()
+
+
+def test_index_written_every_n_flushes_and_on_close(tmp_path) -> None:
+    class Counting(HammingIndex):
+        writes = 0
+
+        def write(self, path):
+            Counting.writes += 1
+            self.ckpt_len = len(checkpointed_ids(ckpt))
+
+    index = Counting(128)
+    ckpt = tmp_path / "added.ids"
+    sink = BufferedFaissSink(index, 128, capacity=4, flush_rows=4, checkpoint=ckpt,
+                             index_path=tmp_path / "index.bin", write_every=4)
+    for lo in range(0, 40, 4):                     # ten full-buffer flushes
+        sink.put(_rows(4, seed=lo), np.arange(lo, lo + 4))
+    sink.close()
+    assert Counting.writes == 3                    # after flush 4, flush 8, close
+    assert index.ckpt_len == 32                    # ids appended only after the write
+    assert checkpointed_ids(ckpt).tolist() == list(range(40))
+
+
+def test_partial_flush_rearms_age_timer() -> None:
+    class Timed:
+        def __init__(self):
+            self.at: list[float] = []
+
+        def add(self, vecs, ids):
+            self.at.append(time.monotonic())
+
+    index = Timed()
+    sink = BufferedFaissSink(index, 128, capacity=8, flush_rows=8, flush_secs=0.2)
+    sink.put(_rows(6), np.arange(6))
+    sink.flush()                                   # head now at row 6
+    sink.put(_rows(2), np.arange(6, 8))            # rows 6-7
+    time.sleep(0.1)
+    sink.put(_rows(4), np.arange(8, 12))           # wraps to rows 0-3, 0.1 s younger
+    deadline = time.monotonic() + 2.0
+    while sink.n_added < 12 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    sink.close()
+    assert sink.n_added == 12
+    assert index.at[2] - index.at[1] >= 0.05       # second slice waited for its own age
@@ -0,0 +1,47 @@
+"""Unit tests for *ep2_w2hv_embed* – the two-level filler cache."""
+from __future__ import annotations
+
+import numpy as np
+
+from hydraedge.encoder.chv_encoder import filler_vec
+from hydraedge.encoder.ep2_w2hv_embed import FillerCache
+from hydraedge.encoder.w2hv_backend import KeyedBackend
+
+
+class _Counting(KeyedBackend):
+    def __init__(self):
+        super().__init__()
+        self.seen: list[str] = []
+
+    def embed_many(self, keys):
+        self.seen += list(keys)
+        return super().embed_many(keys)
+
+
+def test_lru_hits_and_eviction() -> None:
+    backend = _Counting()
+    cache = FillerCache(backend, capacity=2)
+    got = cache.embed_many(["dog", "cat"])
+    assert np.array_equal(got[1], filler_vec("cat"))
+    cache.embed_many(["cat", "bird"])                   # evicts "dog"
+    cache.embed_many(["dog"])
+    assert backend.seen == ["dog", "cat", "bird", "dog"]
+    stats = cache.stats()
+    assert (stats["lru_hits"], stats["misses"]) == (1, 4)
+    assert stats["hit_rate"] == 0.2
+
+
+def test_store_shared_between_caches(tmp_path) -> None:
+    stem = tmp_path / "fillers"
+    first = FillerCache(_Counting(), capacity=0, store=stem)
+    want = first.embed_many(["dog", "cat"])
+
+    other_backend = _Counting()
+    second = FillerCache(other_backend, capacity=16, store=stem)
+    got = second.embed_many(["cat", "dog", "emu"])
+    assert np.array_equal(got[:2], want[::-1])
+    assert other_backend.seen == ["emu"]
+    assert second.stats()["store_hits"] == 2
+
+    first.embed_many(["emu"])                           # picked up via refresh
+    assert first.stats()["store_hits"] == 1
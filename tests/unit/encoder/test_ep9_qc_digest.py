@@ -0,0 +1,60 @@
+"""Unit tests for E9: payload digests, the digest cache and CHV dedup."""
+from __future__ import annotations
+
+import copy
+
+import numpy as np
+
+from hydraedge.encoder import ep9_qc_digest
+from hydraedge.encoder.ep10_faiss_sink import FaissSink
+from hydraedge.encoder.pipeline import EncoderPipeline, PipelineConfig
+from hydraedge.index import HammingIndex
+
+
+def test_payload_digest_ignores_order_but_not_salt(payloads) -> None:
+    shuffled = copy.deepcopy(payloads[0])
+    shuffled["nodes"].reverse()
+    shuffled["edges"].reverse()
+    shuffled["sentence"] = "ignored"
+    a, b, c = ep9_qc_digest.payload_digests([payloads[0], shuffled, payloads[1]], "s")
+    assert a == b != c
+    assert ep9_qc_digest.payload_digests(payloads[:1], "other") != [a]
+
+
+def test_salt_tracks_encoding_settings_only() -> None:
+    base = EncoderPipeline().salt
+    assert EncoderPipeline(PipelineConfig(batch_size=7, cache_size=0)).salt == base
+    assert EncoderPipeline(PipelineConfig(directed=True)).salt != base
+    assert EncoderPipeline(PipelineConfig(backend="philox")).salt != base
+
+
+def test_digest_cache_skips_repeated_payloads(tmp_path, payloads) -> None:
+    cfg = PipelineConfig(digest_cache=str(tmp_path / "chv"))
+    want = EncoderPipeline().encode(payloads)
+
+    first = EncoderPipeline(cfg)
+    assert np.array_equal(first.encode(payloads), want)
+    assert first.digest_cache.misses == 3
+
+    second = EncoderPipeline(cfg)                 # fresh process, same files
+    batch = second.encode_batch(payloads)
+    assert batch.cached.all() and len(batch) == 0
+    assert np.array_equal(batch.vectors, want)
+    assert np.isnan(batch.qc["tie_frac"]).all()
+
+    mixed = second.encode_batch([payloads[0], copy.deepcopy(payloads[2])] + [payloads[1]])
+    assert mixed.cached.tolist() == [True, True, True]
+    assert EncoderPipeline(PipelineConfig(digest_cache=cfg.digest_cache, delimit=True)) \
+        .encode_batch(payloads).cached.sum() == 0
+
+
+def test_dedup_sends_each_chv_once(tmp_path, payloads) -> None:
+    index = HammingIndex(4096)
+    pipe = EncoderPipeline(PipelineConfig(dedup=True, batch_size=2), sink=FaissSink(index))
+    payloads = [payloads[0], payloads[1], copy.deepcopy(payloads[0]), payloads[2]]
+    pipe.encode(payloads)
+    assert index.ntotal == 3
+    assert pipe.dedup.aliases == {2: 0}
+
+    pipe.dedup.save(tmp_path / "aliases.tsv")
+    assert (tmp_path / "aliases.tsv").read_text() == "2\t0\n"
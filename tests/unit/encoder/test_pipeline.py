@@ -0,0 +1,93 @@
+"""Unit tests for the batched encoder pipeline (stages E1 – E10)."""
+from __future__ import annotations
+
+import copy
+
+import numpy as np
+import pytest
+
+from hydraedge.encoder.chv_encoder import ChvEncoder
+from hydraedge.encoder.ep10_faiss_sink import FaissSink
+from hydraedge.encoder.pipeline import EncoderPipeline, PipelineConfig
+from hydraedge.encoder.w2hv_backend import get_backend
+from hydraedge.index import HammingIndex
+
+
+def test_default_pipeline_matches_chv_encoder(payloads) -> None:
+    want = np.stack([ChvEncoder().encode_json(p) for p in payloads])
+    got = EncoderPipeline(PipelineConfig(batch_size=2)).encode(payloads)
+    assert got.dtype == np.int8
+    assert np.array_equal(got, want)
+
+
+def test_stream_batches_ids_and_qc(payloads) -> None:
+    batches = list(EncoderPipeline(PipelineConfig(batch_size=2)).stream(payloads, start_id=10))
+    assert [b.ids.tolist() for b in batches] == [[10, 11], [12]]
+    first = batches[0]
+    assert first.qc["n_pairs"].tolist() == [4, 4]          # VerbClass dropped
+    assert len(set(first.digests)) == 2
+
+
+def test_direction_and_delimiter_options(payloads) -> None:
+    plain = EncoderPipeline().encode(payloads)
+    directed = EncoderPipeline(PipelineConfig(directed=True)).encode(payloads)
+    assert not np.array_equal(plain[0], directed[0])
+    assert np.array_equal(directed, EncoderPipeline(PipelineConfig(directed=True)).encode(payloads))
+
+    delimited = EncoderPipeline(PipelineConfig(delimit=True)).encode(payloads)
+    assert not np.array_equal(plain[2], delimited[2])
+
+
+def test_gamma_one_keeps_raw_filler_for_role(payloads) -> None:
+    gated = EncoderPipeline(PipelineConfig(gamma={"Tense": 1.0})).encode_batch(payloads[:1])
+    tense = np.flatnonzero(gated.role == "Tense")[0]
+    assert np.array_equal(gated.bound[tense], gated.fillers[gated.filler_id[tense]])
+
+
+def test_sink_and_empty_record(payloads) -> None:
+    index = HammingIndex(4096)
+    pipe = EncoderPipeline(sink=FaissSink(index))
+    vecs = pipe.encode(payloads)
+    assert index.ntotal == 3
+    _, ids = index.search(vecs[1:2], k=1)
+    assert ids[0, 0] == 1
+
+    bare = copy.deepcopy(payloads[0])
+    bare["nodes"] = [n for n in bare["nodes"] if n["ntype"] == "chv"]
+    with pytest.raises(ValueError):
+        pipe.encode([bare])
+
+
+def test_roles_tsv_restricts_registry(tmp_path, payloads) -> None:
+    tsv = tmp_path / "roles.tsv"
+    tsv.write_text("Subject\nObject\n", encoding="utf-8")
+    batch = EncoderPipeline(PipelineConfig(roles_tsv=str(tsv))).encode_batch(payloads[:1])
+    assert sorted(batch.role.tolist()) == ["Object", "Subject"]
+    assert batch.role_id.tolist() == [0, 1]
+
+
+def test_unknown_role_fillers_are_not_embedded(payloads) -> None:
+    class Recording:
+        def __init__(self, backend):
+            self.backend, self.dim, self.keys = backend, backend.dim, []
+
+        def embed_many(self, keys):
+            self.keys += keys
+            return self.backend.embed_many(keys)
+
+    backend = Recording(get_backend("hash"))
+    pipe = EncoderPipeline(PipelineConfig(cache_size=0), backend=backend)
+    assert np.array_equal(pipe.encode(payloads), EncoderPipeline().encode(payloads))
+    assert "perceive" not in backend.keys               # VerbClass filler, dropped by E3
+
+
+def test_repeated_calls_continue_record_ids(payloads) -> None:
+    index = HammingIndex(4096)
+    pipe = EncoderPipeline(PipelineConfig(dedup=True, batch_size=2), sink=FaissSink(index))
+    pipe.encode(payloads[:2])
+    vecs = pipe.encode(payloads[1:])
+    assert index.ntotal == 3 and pipe.next_id == 4
+    assert pipe.dedup.aliases == {2: 1}                 # the repeat of record 1, not a clash
+    assert index.search(vecs[1:], k=1)[1][0, 0] == 3
+    assert [b.ids.tolist() for b in pipe.stream(payloads[:1])] == [[4]]
+    assert [b.ids.tolist() for b in pipe.stream(payloads[:1], start_id=0)] == [[0]]
@@ -0,0 +1,66 @@
+"""Unit tests for the compiled role registry."""
+from __future__ import annotations
+
+import numpy as np
+
+from hydraedge.encoder.chv_encoder import ROLES, role_vec
+from hydraedge.encoder.ep4_dir_tag import N_DIRS, direction_plans
+from hydraedge.encoder.role_registry import compile_registry, default_registry, read_roles
+
+
+def test_builtin_registry_matches_role_vectors(tmp_path) -> None:
+    reg = compile_registry(cache_dir=tmp_path)
+    assert reg.roles == tuple(ROLES)
+    assert reg.dir_matrix.shape == (len(ROLES) * N_DIRS, 4096)
+    assert np.array_equal(reg.vectors, np.stack([role_vec[r] for r in ROLES]))
+
+    plans = direction_plans([role_vec[r] for r in ROLES])
+    filler = np.random.default_rng(0).choice([-1, 1], size=(4, 4096)).astype(np.int8)
+    for ours, ref in zip(reg.plans, plans):
+        assert np.array_equal(ours.bind(filler), ref.bind(filler))
+
+
+def test_ids_are_array_lookups() -> None:
+    reg = compile_registry()
+    ids = reg.ids(np.array(["Object", "VerbClass", "Subject", "Object"]))
+    assert ids.tolist() == [ROLES.index("Object"), -1, ROLES.index("Subject"), ROLES.index("Object")]
+    assert reg.ids(np.array([], dtype=str)).shape == (0,)
+    assert "Tense" in reg and "VerbClass" not in reg
+
+
+def test_tsv_registry_cached_by_content(tmp_path) -> None:
+    tsv = tmp_path / "roles.tsv"
+    tsv.write_text("AGENT\t111111\nPATIENT\t222222\nAGENT\t333333\n\n", encoding="utf-8")
+    assert read_roles(tsv) == ["AGENT", "PATIENT"]
+
+    cache = tmp_path / "cache"
+    first = compile_registry(tsv, cache_dir=cache)
+    assert first.roles == ("AGENT", "PATIENT")
+    assert len(list(cache.glob("*.npy"))) == 1
+    again = compile_registry(tsv, cache_dir=cache)
+    assert again.version == first.version
+    assert isinstance(again.dir_matrix, np.memmap)
+
+    tsv.write_text("AGENT\t111111\n", encoding="utf-8")
+    edited = compile_registry(tsv, cache_dir=cache)
+    assert edited.version != first.version and edited.roles == ("AGENT",)
+    assert np.array_equal(edited.vectors[0], first.vectors[0])
+
+
+def test_cache_key_covers_vectors_and_dim(tmp_path, monkeypatch) -> None:
+    base = compile_registry(cache_dir=tmp_path)
+    assert compile_registry(cache_dir=tmp_path, dim=256).version != base.version
+
+    monkeypatch.setitem(role_vec, "Subject", -role_vec["Subject"])   # e.g. another HYDRA_HV_STORE
+    flipped = compile_registry(cache_dir=tmp_path)
+    assert flipped.version != base.version
+    assert np.array_equal(flipped.vectors[ROLES.index("Subject")], role_vec["Subject"])
+
+
+def test_default_registry_honours_cache_override(tmp_path, monkeypatch) -> None:
+    monkeypatch.setenv("HYDRA_ROLE_CACHE", str(tmp_path / "env"))
+    reg = default_registry()
+    assert default_registry() is reg
+    assert len(list((tmp_path / "env").glob("*.npy"))) == 1
+    default_registry(tmp_path / "arg")
+    assert len(list((tmp_path / "arg").glob("*.npy"))) == 1
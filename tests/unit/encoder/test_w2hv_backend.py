@@ -0,0 +1,79 @@
+"""Unit tests for *w2hv_backend* – filler-vector backends."""
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from hydraedge.encoder.chv_encoder import filler_vec
+from hydraedge.encoder.pipeline import EncoderPipeline, PipelineConfig
+from hydraedge.encoder.w2hv_backend import (
+    KeyedBackend,
+    PhiloxBackend,
+    SemanticBackend,
+    get_backend,
+    philox4x32,
+    projection_matrix,
+)
+
+
+def _words(*xs: int) -> np.ndarray:
+    return np.array(xs, dtype=np.uint64)
+
+
+def test_philox_known_answers() -> None:
+    # Random123 known-answer vectors for Philox4x32-10
+    got = philox4x32(_words(0, 0, 0, 0), _words(0, 0))
+    assert got.tolist() == [0x6627E8D5, 0xE169C58D, 0xBC57AC4C, 0x9B00DBD8]
+    got = philox4x32(_words(0x243F6A88, 0x85A308D3, 0x13198A2E, 0x03707344),
+                     _words(0xA4093822, 0x299F31D0))
+    assert got.tolist() == [0xD16CFE09, 0x94FDCCEB, 0x5001E420, 0x24126EA1]
+
+
+def test_philox_vectors_are_stable_per_key() -> None:
+    backend = PhiloxBackend(dim=1000, chunk=2)
+    batch = backend.embed_many(["dog", "cat", "emu", "dog"])
+    assert batch.shape == (4, 1000) and set(np.unique(batch)) == {-1, 1}
+    assert np.array_equal(batch[0], batch[3])
+    assert np.array_equal(PhiloxBackend(dim=1000).embed_many(["emu"])[0], batch[2])
+    assert not np.array_equal(PhiloxBackend(dim=1000, seed=1).embed_many(["dog"])[0], batch[0])
+    assert abs(int(batch[0].astype(np.int32) @ batch[1])) < 200      # quasi-orthogonal
+
+
+def test_backend_registry_and_pipeline() -> None:
+    assert isinstance(get_backend("philox"), PhiloxBackend)
+    assert np.array_equal(KeyedBackend().embed_many(["dog"])[0], filler_vec("dog"))
+    with pytest.raises(ValueError):
+        get_backend("word2vec")
+
+    payload = {"version": "2.4", "nodes": [
+        {"id": "spo:dog@e1", "filler": "dog", "roles": ["Subject"], "ntype": "spo"},
+        {"id": "chv:main", "filler": "CHV", "roles": ["CHV"], "ntype": "chv"}]}
+    vecs = EncoderPipeline(PipelineConfig(backend="philox")).encode([payload, payload])
+    assert np.array_equal(vecs[0], vecs[1])
+
+
+class _FakeModel:
+    """Deterministic stand-in for sentence-transformers; counts calls."""
+
+    def __init__(self):
+        self.calls: list[int] = []
+
+    def __call__(self, texts):
+        self.calls.append(len(texts))
+        rows = [np.random.default_rng(sum(map(ord, t))).standard_normal(16) for t in texts]
+        emb = np.asarray(rows, dtype=np.float32).reshape(-1, 16)
+        return emb / np.linalg.norm(emb, axis=1, keepdims=True)
+
+
+def test_semantic_batches_match_per_token_path(tmp_path) -> None:
+    model = _FakeModel()
+    proj = projection_matrix(512, emb_dim=16, cache_dir=tmp_path)
+    assert isinstance(proj, np.memmap)
+    backend = SemanticBackend(model, dim=512, batch_size=2, n_threads=2, proj=proj)
+
+    keys = ["dog", "cat", "dog", "emu", "cat"]
+    got = backend.embed_many(keys)
+    assert model.calls == [2, 1]                        # three unique keys, batches of 2
+    for key, row in zip(keys, got):
+        assert np.array_equal(row, backend.embed_one(key))
+    assert np.array_equal(projection_matrix(512, emb_dim=16, cache_dir=tmp_path), proj)
@@ -0,0 +1,44 @@
+"""Unit tests for *index.faiss_index* (skipped when faiss is not installed)."""
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+faiss = pytest.importorskip("faiss")
+
+from hydraedge.encoder.ep10_faiss_sink import BufferedFaissSink, FaissSink  # noqa: E402
+from hydraedge.index import FaissIndex  # noqa: E402
+
+
+def _rows(n: int, dim: int = 64, seed: int = 0) -> np.ndarray:
+    return np.random.default_rng(seed).choice([-1, 1], size=(n, dim)).astype(np.float32)
+
+
+def test_add_with_ids_and_reload(tmp_path) -> None:
+    vecs = _rows(20)
+    index = FaissIndex(64, gpu=False)
+    index.add(vecs[:10], ids=np.arange(100, 110))
+    index.add(vecs[10:])                                # continues from ntotal
+    assert index.ntotal == 20
+    _, ids = index.search(vecs[[3, 15]], k=1)
+    assert ids[:, 0].tolist() == [103, 15]
+
+    index.write(tmp_path / "chv.index")
+    again = FaissIndex.read(tmp_path / "chv.index", gpu=False)
+    assert again.search(vecs[[4]], k=1)[1][0, 0] == 104
+
+
+def test_sinks_write_to_faiss_index(tmp_path) -> None:
+    vecs = _rows(30, seed=1)
+    direct = FaissIndex(64, gpu=False)
+    FaissSink(direct).write(SimpleNamespace(vectors=vecs.astype(np.int8),
+                                            ids=np.arange(500, 530), unique=None))
+    buffered = FaissIndex(64, gpu=False)
+    with BufferedFaissSink(buffered, 64, capacity=8, flush_rows=4,
+                           index_path=tmp_path / "buf.index") as sink:
+        sink.put(vecs, np.arange(500, 530))
+    for index in (direct, buffered, FaissIndex.read(tmp_path / "buf.index", gpu=False)):
+        assert index.ntotal == 30
+        assert index.search(vecs[[7]], k=1)[1][0, 0] == 507
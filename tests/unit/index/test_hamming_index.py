@@ -0,0 +1,70 @@
+"""Unit tests for *index.hamming_index* – exact packed Hamming k-NN."""
+from __future__ import annotations
+
+import numpy as np
+
+from hydraedge.index import HammingIndex, hamming_index
+
+
+def _brute_force(db: np.ndarray, q: np.ndarray, k: int) -> np.ndarray:
+    ham = (q[:, None, :] != db[None, :, :]).sum(axis=2)
+    return np.sort(ham, axis=1)[:, :k]
+
+
+def test_search_is_exact(rand_hv) -> None:
+    rng = np.random.default_rng(0)
+    db, q = rand_hv(rng, 500, 1000), rand_hv(rng, 7, 1000)
+    ix = HammingIndex(1000, n_threads=4)
+    ix.add(db[:200])
+    ix.add(db[200:].astype(np.float32))                  # sign of real rows
+
+    dist, ids = ix.search(q, k=5)
+    assert np.array_equal(dist, _brute_force(db, q, 5))
+    ham = (q[:, None, :] != db[ids]).sum(axis=2)
+    assert np.array_equal(ham, dist)
+
+
+def test_custom_ids_cosine_and_padding(rand_hv) -> None:
+    rng = np.random.default_rng(1)
+    db = rand_hv(rng, 3, 256)
+    ix = HammingIndex(256, metric="cosine")
+    ix.add(db, ids=[10, 20, 30])
+
+    sims, ids = ix.search(db[1], k=5)
+    assert ids[0, 0] == 20 and sims[0, 0] == 1.0
+    assert list(ids[0, 3:]) == [-1, -1]
+
+
+def test_write_read_roundtrip(tmp_path, rand_hv) -> None:
+    rng = np.random.default_rng(2)
+    db = rand_hv(rng, 50, 512)
+    ix = HammingIndex(512)
+    ix.add(db)
+    path = tmp_path / "tiny.hamming.npz"
+    ix.write(path)
+
+    again = HammingIndex.read(path)
+    assert again.ntotal == 50
+    for a, b in zip(ix.search(db[:3], 4), again.search(db[:3], 4)):
+        assert np.array_equal(a, b)
+
+
+def test_single_row_adds_grow_geometrically(rand_hv) -> None:
+    db = rand_hv(np.random.default_rng(3), 3000, 128)
+    ix = HammingIndex(128)
+    buffers = set()
+    for i, row in enumerate(db):
+        ix.add(row, [i])
+        buffers.add(id(ix._id_buf))
+    assert ix.ntotal == 3000 and len(buffers) <= 3          # 1024 → 2048 → 4096
+    assert np.array_equal(ix.search(db[:4], k=1)[1][:, 0], np.arange(4))
+
+
+def test_blocks_merge_incrementally(monkeypatch, rand_hv) -> None:
+    rng = np.random.default_rng(4)
+    db, q = rand_hv(rng, 400, 256), rand_hv(rng, 300, 256)
+    ix = HammingIndex(256, n_threads=3)
+    ix.add(db)
+    monkeypatch.setattr(hamming_index, "_CHUNK_BYTES", 256 * 4 * 8 * 30)   # 30-row db chunks
+    dist, _ = ix.search(q, k=6)                              # 2 query blocks × 14 chunks
+    assert np.array_equal(dist, _brute_force(db, q, 6))
@@ -0,0 +1,98 @@
+"""Unit tests for *kernel.bundles* – streaming Bundler vs majority_vote."""
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from hydraedge.kernel import parallel
+from hydraedge.kernel.bundles import (
+    Bundler,
+    _gamma_gate_reference,
+    gamma_gate,
+    gamma_gate_many,
+    majority_vote,
+)
+
+
+def _reference(vecs: np.ndarray) -> np.ndarray:
+    votes = vecs.astype(np.int32).sum(axis=0)
+    return np.where(votes >= 0, 1, -1).astype(np.int8)
+
+
+def test_majority_vote_ties_go_positive() -> None:
+    a = np.array([1, -1, 1, -1], dtype=np.int8)
+    assert np.array_equal(majority_vote([a, -a]), np.ones(4, dtype=np.int8))
+
+
+def test_bundler_add_and_add_many_match_reference(rand_hv) -> None:
+    vecs = rand_hv(np.random.default_rng(0), 50, 256)
+    b = Bundler(256).add(vecs[0]).add_many(vecs[1:])
+    assert b.n == 50
+    assert np.array_equal(b.finalize(), _reference(vecs))
+
+
+def test_subtract_retracts_a_pair(rand_hv) -> None:
+    vecs = rand_hv(np.random.default_rng(1), 9, 128)
+    b = Bundler(128).add_many(vecs).subtract(vecs[3])
+    assert np.array_equal(b.finalize(), _reference(np.delete(vecs, 3, axis=0)))
+
+
+def test_merge_of_chunks_equals_single_pass(rand_hv) -> None:
+    vecs = rand_hv(np.random.default_rng(2), 31, 512)
+    parts = [Bundler(512).add_many(chunk) for chunk in np.array_split(vecs, 4)]
+    merged = parts[0]
+    for p in parts[1:]:
+        merged.merge(p)
+    assert np.array_equal(merged.finalize(), _reference(vecs))
+
+
+def test_counters_widen_instead_of_overflowing() -> None:
+    ones = np.ones((40_000, 8), dtype=np.int8)
+    b = Bundler(8).add_many(ones)
+    assert b.counts.dtype == np.int32
+    assert (b.counts == 40_000).all()
+
+
+def test_finalize_empty_raises() -> None:
+    with pytest.raises(ValueError):
+        Bundler(8).finalize()
+
+
+_GAMMAS = [0.0, 0.1, 0.3, 0.49999997, 0.5, 0.50000003, 0.7, 1.0]
+
+
+@pytest.mark.parametrize("gamma", _GAMMAS)
+def test_gamma_gate_matches_float_blend(gamma: float, rand_hv) -> None:
+    rng = np.random.default_rng(3)
+    b, f = rand_hv(rng, 1024), rand_hv(rng, 1024)
+    got = gamma_gate(bound=b, filler=f, gamma=gamma)
+    assert got.dtype == np.int8
+    assert np.array_equal(got, _gamma_gate_reference(b, f, gamma))
+
+
+def test_gamma_gate_many_per_row_gamma(rand_hv) -> None:
+    rng = np.random.default_rng(4)
+    b, f = rand_hv(rng, len(_GAMMAS), 256), rand_hv(rng, len(_GAMMAS), 256)
+    got = gamma_gate_many(b, f, np.array(_GAMMAS))
+    want = np.stack([_gamma_gate_reference(bi, fi, g) for bi, fi, g in zip(b, f, _GAMMAS)])
+    assert np.array_equal(got, want)
+
+
+@pytest.mark.parametrize("gamma", [0.5 + 1e-10, np.float64(0.5 + 1e-10), np.float32(0.5),
+                                   np.float64(0.5 - 1e-10), np.array(0.5 + 1e-10)])
+def test_gamma_gate_boundary_follows_gamma_dtype(gamma, rand_hv) -> None:
+    rng = np.random.default_rng(5)
+    b, f = rand_hv(rng, 1024), rand_hv(rng, 1024)
+    want = _gamma_gate_reference(b, f, gamma)
+    assert np.array_equal(gamma_gate(bound=b, filler=f, gamma=gamma), want)
+    bm, fm = np.stack([b, b]), np.stack([f, f])
+    assert np.array_equal(gamma_gate_many(bm, fm, gamma)[1], want)
+    assert np.array_equal(parallel.gamma_gate_many(bm, fm, gamma, chunk_rows=1)[1], want)
+
+
+def test_gamma_gate_rejects_out_of_range() -> None:
+    v = np.ones((2, 4), dtype=np.int8)
+    with pytest.raises(ValueError):
+        gamma_gate(bound=v[0], filler=v[0], gamma=1.5)
+    with pytest.raises(ValueError):
+        gamma_gate_many(v, v, np.array([0.2, -0.1]))
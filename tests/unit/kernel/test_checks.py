@@ -0,0 +1,115 @@
+"""Unit tests for *kernel.checks* – low-rank HybridKernel vs dense reference."""
+from __future__ import annotations
+
+import tracemalloc
+
+import numpy as np
+
+from hydraedge.kernel.checks import (
+    D,
+    ROLES,
+    HybridKernel,
+    forward,
+    forward_pairs,
+    role_vec,
+    slot_features,
+    slot_sum,
+    slot_sum_many,
+)
+
+
+def _random_kernel(dense: bool, rank: int = 4) -> HybridKernel:
+    rng = np.random.default_rng(0)
+    k = HybridKernel(D, rank, dense=dense)
+    k.d_S = rng.normal(size=D).astype(np.float32) * 1e-3
+    for name in ("U_S", "V_S", "U_A", "V_A"):
+        setattr(k, name, rng.normal(size=(D, rank)).astype(np.float32) * 1e-2)
+    k.M = rng.normal(size=k.M.shape).astype(np.float32) * 1e-7
+    return k
+
+
+def test_default_forward_is_logistic_of_dot(rand_hv) -> None:
+    rng = np.random.default_rng(1)
+    a, b = rand_hv(rng, D), rand_hv(rng, D)
+    z = float(a.astype(np.float32) @ b)
+    assert np.isclose(forward(a, b), 1.0 / (1.0 + np.exp(-z)))
+
+
+def test_low_rank_matches_dense_reference(rand_hv) -> None:
+    rng = np.random.default_rng(2)
+    low, dense = _random_kernel(False), _random_kernel(True)
+    for _ in range(3):
+        a, b = rand_hv(rng, D), rand_hv(rng, D)
+        assert np.isclose(low.logit(a, b), dense.logit(a, b), rtol=1e-4, atol=1e-3)
+
+
+def test_blocks_have_expected_symmetry() -> None:
+    k = _random_kernel(False, rank=2)
+    W_S, W_A = k.W_S(), k.W_A()
+    assert np.allclose(W_S, W_S.T)
+    assert np.allclose(W_A, -W_A.T)
+
+
+def test_forward_many_matches_pairwise_forward(rand_hv) -> None:
+    rng = np.random.default_rng(3)
+    src, dst = rand_hv(rng, D), rand_hv(rng, 5, D)
+    k = _random_kernel(False)
+    got = k.forward_many(src, dst)
+    assert got.dtype == np.float32
+    assert np.allclose(got, [k.forward(src, d) for d in dst], atol=1e-5)
+
+
+def test_forward_pairs_tiles_and_matches_dense(rand_hv) -> None:
+    rng = np.random.default_rng(4)
+    A, B = rand_hv(rng, 7, D), rand_hv(rng, 9, D)
+    low, dense = _random_kernel(False), _random_kernel(True)
+
+    tiny_budget = 4 * (2 * 3 * D + 9)            # forces 3×3 tiles
+    got = low.logits_pairs(A, B, mem_budget=tiny_budget)
+    want = dense.logits_pairs(A, B)
+    assert got.shape == (7, 9)
+    assert np.isclose(want[2, 5], dense.logit(A[2], B[5]), rtol=1e-4, atol=1e-3)
+    assert np.allclose(got, want, rtol=1e-4, atol=1e-3)
+
+
+def test_forward_many_peak_memory_within_budget(rand_hv) -> None:
+    E = rand_hv(np.random.default_rng(8), 4000, D)          # float32 copy would be 64 MB
+    k = _random_kernel(False)
+    budget = 4 * 2**20
+    want = k.forward_many(E[0], E)
+
+    tracemalloc.start()
+    try:
+        got = k.forward_many(E[0], E, mem_budget=budget)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert peak < budget
+    assert np.allclose(got, want, atol=1e-5)
+
+
+def test_module_forward_pairs_default_kernel(rand_hv) -> None:
+    rng = np.random.default_rng(5)
+    A, B = rand_hv(rng, 2, D), rand_hv(rng, 3, D)
+    got = forward_pairs(A, B)
+    assert np.allclose(got, [[forward(a, b) for b in B] for a in A])
+
+
+def test_slot_sum_many_matches_per_role_dots(rand_hv) -> None:
+    E = rand_hv(np.random.default_rng(6), 4, D)
+    want = np.array([[float(role_vec[r].astype(np.int32) @ e) for r in ROLES] for e in E])
+    assert np.array_equal(slot_sum_many(E), want)
+    assert np.array_equal(slot_sum(E[0]), want[0])
+
+
+def test_slot_features_sidecar_is_cached(tmp_path, rand_hv) -> None:
+    E = rand_hv(np.random.default_rng(7), 6, D).astype(np.float32)
+    vec_path = tmp_path / "vectors.npy"
+    np.save(vec_path, E)
+
+    S = slot_features(vec_path)
+    assert (tmp_path / "vectors.slots.npy").exists()
+    assert np.allclose(S, slot_sum_many(E))
+
+    k = _random_kernel(False)
+    assert np.allclose(k.forward_many(E[0], E, S_dst=S), k.forward_many(E[0], E))
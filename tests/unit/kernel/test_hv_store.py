@@ -0,0 +1,73 @@
+"""Unit tests for *kernel.hv_store* – append-only memory-mapped rows."""
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from hydraedge.kernel.hv_store import HVStore
+from hydraedge.kernel.packed import pack_bits
+
+
+def test_put_get_and_reopen(tmp_path, rand_hv) -> None:
+    vecs = rand_hv(np.random.default_rng(0), 5, 256)
+    keys = [f"k{i}" for i in range(5)]
+    store = HVStore(tmp_path / "fillers", dim=256)
+    assert list(store.put_many(keys, vecs)) == [0, 1, 2, 3, 4]
+
+    again = HVStore(tmp_path / "fillers")
+    assert len(again) == 5 and "k3" in again
+    assert isinstance(again.rows, np.memmap)
+    assert np.array_equal(again.get_many(["k4", "k0"]), vecs[[4, 0]])
+    assert np.array_equal(again.get("k2"), vecs[2])
+
+
+def test_first_write_wins_and_missing_keys(tmp_path, rand_hv) -> None:
+    rng = np.random.default_rng(1)
+    store = HVStore(tmp_path / "s", dim=64)
+    a, b = rand_hv(rng, 64), rand_hv(rng, 64)
+    store.put("x", a)
+    assert store.put("x", b) == 0
+    assert np.array_equal(store.get("x"), a)
+    assert list(store.rows_of(["x", "nope"])) == [0, -1]
+    with pytest.raises(KeyError):
+        store.get_many(["x", "nope"])
+
+
+def test_refresh_sees_other_writers(tmp_path, rand_hv) -> None:
+    rng = np.random.default_rng(2)
+    reader = HVStore(tmp_path / "shared", dim=128)
+    writer = HVStore(tmp_path / "shared")
+    writer.put_many(["a", "b"], rand_hv(rng, 2, 128))
+    assert len(reader) == 0
+    assert len(reader.refresh()) == 2
+
+
+def test_packed_rows(tmp_path, rand_hv) -> None:
+    vecs = rand_hv(np.random.default_rng(3), 3, 1000)
+    store = HVStore(tmp_path / "packed", dim=1000, dtype=np.uint64, row_len=16)
+    store.put_many(["a", "b", "c"], pack_bits(vecs))
+    again = HVStore(tmp_path / "packed")
+    assert again.dtype == np.uint64 and again.dim == 1000
+    assert np.array_equal(again.get("b"), pack_bits(vecs[1]))
+
+
+def test_overwrite_in_place(tmp_path) -> None:
+    store = HVStore(tmp_path / "acc", dim=8, dtype=np.int16)
+    store.put_many(["a", "b"], np.arange(16, dtype=np.int16).reshape(2, 8))
+    reader = HVStore(tmp_path / "acc")
+    rows = store.put_many(["b", "c"], np.full((2, 8), -3, dtype=np.int16), overwrite=True)
+    assert list(rows) == [1, 2]
+    assert (reader.get("b") == -3).all()                # same pages, no reopen
+    assert np.array_equal(reader.get("a"), np.arange(8))
+
+
+def test_keys_with_line_separators_round_trip(tmp_path, rand_hv) -> None:
+    vecs = rand_hv(np.random.default_rng(6), 4, 64)
+    keys = ["new\u2028york", "a\rb", "c\x1cd\x85", "plain"]
+    store = HVStore(tmp_path / "odd", dim=64)
+    assert list(store.put_many(keys, vecs)) == [0, 1, 2, 3]
+    again = HVStore(tmp_path / "odd")
+    assert again.keys == keys
+    assert np.array_equal(again.get_many(keys), vecs)
+    with pytest.raises(ValueError, match="newlines"):
+        store.put("x\ny", vecs[0])
@@ -0,0 +1,98 @@
+"""Unit tests for *kernel.item_memory* – codebook cleanup of noisy vectors."""
+from __future__ import annotations
+
+import tracemalloc
+
+import numpy as np
+import pytest
+
+from hydraedge.kernel import item_memory
+from hydraedge.kernel.bind_ops import bind_many, unbind_many
+from hydraedge.kernel.bundles import majority_vote
+from hydraedge.kernel.item_memory import ItemMemory
+
+
+@pytest.fixture()
+def codebook(tmp_path, rand_hv):
+    rng = np.random.default_rng(0)
+    fillers = {f"f{i}": v for i, v in enumerate(rand_hv(rng, 300, 2048))}
+    roles = {f"r{i}": v for i, v in enumerate(rand_hv(rng, 3, 2048))}
+    return ItemMemory.build(tmp_path / "im", fillers=fillers, roles=roles)
+
+
+def test_open_is_memory_mapped(codebook) -> None:
+    again = ItemMemory.open(codebook.path)
+    assert isinstance(again.vectors, np.memmap) and isinstance(again.words, np.memmap)
+    assert len(again) == 303 and "r2" in again
+    assert np.array_equal(again.get("f7"), codebook.get("f7"))
+
+
+def test_keys_with_line_separators_reopen(tmp_path, rand_hv) -> None:
+    vecs = rand_hv(np.random.default_rng(3), 3, 128)
+    fillers = {"new\u2028york": vecs[0], "a\rb\tc": vecs[1]}
+    built = ItemMemory.build(tmp_path / "im", fillers=fillers, roles={"Subject": vecs[2]})
+    again = ItemMemory.open(built.path)
+    assert again.keys == ["new\u2028york", "a\rb\tc", "Subject"]
+    assert again.kinds.tolist() == ["filler", "filler", "role"]
+    assert np.array_equal(again.get("a\rb\tc"), vecs[1])
+    assert again.cleanup_keys(vecs[0], kind="filler")[0][0][0] == "new\u2028york"
+
+
+@pytest.mark.parametrize("method", ["hamming", "matmul"])
+def test_cleanup_recovers_fillers_from_bundle(codebook, method: str) -> None:
+    roles = np.stack([codebook.get(f"r{i}") for i in range(3)])
+    fillers = np.stack([codebook.get(k) for k in ("f5", "f42", "f250")])
+    chv = majority_vote(list(bind_many(roles, fillers)))
+
+    noisy = unbind_many(np.broadcast_to(chv, roles.shape), roles)
+    rows, scores = codebook.cleanup(noisy, k=3, method=method,
+                                    n_threads=4, chunk_rows=37)
+    assert [codebook.keys[r] for r in rows[:, 0]] == ["f5", "f42", "f250"]
+    assert (np.diff(scores, axis=1) <= 0).all()
+
+
+def test_hamming_and_matmul_agree(codebook, rand_hv) -> None:
+    q = rand_hv(np.random.default_rng(1), 4, 2048)
+    h_rows, h_scores = codebook.cleanup(q, k=5, method="hamming", kind=None)
+    m_rows, m_scores = codebook.cleanup(q, k=5, method="matmul", kind=None)
+    assert np.allclose(h_scores, m_scores)
+
+
+def test_kind_filter(codebook) -> None:
+    q = codebook.get("r1")
+    assert codebook.cleanup_keys(q, k=1, kind="role")[0][0][0] == "r1"
+    assert codebook.cleanup_keys(q, k=1, kind="filler")[0][0][0].startswith("f")
+
+
+def test_query_blocks_bound_memory(codebook, monkeypatch, rand_hv) -> None:
+    q = rand_hv(np.random.default_rng(2), 500, 2048)
+    cos = (q.astype(np.float32) @ np.asarray(codebook.vectors, dtype=np.float32).T) / 2048
+
+    def check(rows, scores) -> None:            # equal scores may tie-break either way
+        assert np.allclose(np.take_along_axis(cos, rows, axis=1), scores)
+        assert np.allclose(scores, -np.sort(-cos, axis=1)[:, :4])
+
+    check(*codebook.cleanup(q, k=4, kind=None))
+    check(*codebook.cleanup(q, k=4, kind=None, query_rows=7, chunk_rows=50, n_threads=3))
+
+    budget = 2**20
+    monkeypatch.setattr(item_memory, "_CHUNK_BYTES", budget)
+    tracemalloc.start()
+    try:
+        rows, scores = codebook.cleanup(q, k=4, kind=None, n_threads=1)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    check(rows, scores)
+    assert peak < 2 * budget           # job temporaries + O(Q·k) results, not O(Q·C)
+
+
+def test_blocked_topk_matches_full_sort() -> None:
+    scores = np.random.default_rng(4).standard_normal((23, 90)).astype(np.float32)
+    allowed = np.arange(0, 90, 3)
+    rows, top = item_memory.blocked_topk(lambda q0, q1, lo, hi: scores[q0:q1, lo:hi], 23,
+                                         [(lo, min(lo + 7, 90)) for lo in range(0, 90, 7)], 5,
+                                         query_rows=4, allowed=allowed, n_threads=2)
+    want = allowed[np.argsort(-scores[:, allowed], axis=1, kind="stable")[:, :5]]
+    assert np.array_equal(rows, want)
+    assert np.array_equal(top, np.take_along_axis(scores, want, axis=1))
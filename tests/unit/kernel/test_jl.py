@@ -0,0 +1,51 @@
+"""Unit tests for *kernel.jl* – seeded, cached very-sparse projection."""
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from hydraedge.kernel.jl import JLProjector, distortion_report, project
+
+
+def test_no_dim_returns_copy(rand_hv) -> None:
+    v = rand_hv(np.random.default_rng(0), 64)
+    out = project(v)
+    assert out is not v and np.array_equal(out, v)
+
+
+def test_projection_is_seeded_and_memory_mapped(tmp_path, rand_hv) -> None:
+    E = rand_hv(np.random.default_rng(1), 10, 1024)
+    a = project(E, dim=128, seed=7, cache_dir=tmp_path)
+    assert a.shape == (10, 128) and a.dtype == np.float32
+
+    reloaded = JLProjector.load(1024, 128, seed=7, cache_dir=tmp_path)
+    assert isinstance(reloaded.matrix, np.memmap)
+    assert np.allclose(reloaded(E), a)
+    assert not np.allclose(project(E, dim=128, seed=8, cache_dir=tmp_path), a)
+
+
+def test_binarized_output(tmp_path, rand_hv) -> None:
+    E = rand_hv(np.random.default_rng(2), 4, 1024)
+    out = project(E, dim=256, binarize=True, cache_dir=tmp_path)
+    assert out.dtype == np.int8 and set(np.unique(out)) <= {-1, 1}
+
+
+def test_distortion_shrinks_with_dim(tmp_path, rand_hv) -> None:
+    E = rand_hv(np.random.default_rng(3), 200, 2048)
+    rep = distortion_report(E, dims=(64, 1024), n_pairs=500, cache_dir=tmp_path)
+    assert [r["dim"] for r in rep] == [64, 1024]
+    assert rep[1]["mean_abs_err"] < rep[0]["mean_abs_err"]
+    assert rep[1]["mean_abs_err"] < 0.05
+
+
+def test_bad_target_dim(tmp_path) -> None:
+    with pytest.raises(ValueError):
+        project(np.ones((2, 16), dtype=np.int8), dim=32, cache_dir=tmp_path)
+
+
+def test_cache_dir_env_is_read_per_call(tmp_path, monkeypatch, rand_hv) -> None:
+    E = rand_hv(np.random.default_rng(5), 4, 256)
+    for sub in ("a", "b"):
+        monkeypatch.setenv("HYDRA_JL_CACHE", str(tmp_path / sub))
+        project(E, dim=32, seed=3)
+        assert [p.name for p in (tmp_path / sub).iterdir()] == ["jl_256x32_seed3.npy"]
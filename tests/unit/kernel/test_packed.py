@@ -0,0 +1,55 @@
+"""Unit tests for *kernel.packed* – parity with the int8 reference ops."""
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from hydraedge.kernel import bind_ops, bundles, packed
+from hydraedge.kernel.packed import PackedHV
+
+
+@pytest.mark.parametrize("d", [100, 1000, 4096])
+def test_roundtrip_is_lossless(d: int, rand_hv) -> None:
+    vecs = rand_hv(np.random.default_rng(0), 7, d)
+    hv = PackedHV.from_int8(vecs)
+    assert hv.words.dtype == np.uint64
+    assert hv.nbytes == 7 * 8 * ((d + 63) // 64)
+    assert np.array_equal(hv.to_int8(), vecs)
+
+
+@pytest.mark.parametrize("d", [100, 1000, 4096])
+def test_bind_unbind_match_int8(d: int, rand_hv) -> None:
+    rng = np.random.default_rng(1)
+    roles, fillers = rand_hv(rng, 9, d), rand_hv(rng, 9, d)
+
+    bound = packed.bind(PackedHV.from_int8(roles), PackedHV.from_int8(fillers))
+    assert np.array_equal(bound.to_int8(), bind_ops.bind_many(roles, fillers))
+
+    back = packed.unbind(bound, PackedHV.from_int8(roles))
+    want = bind_ops.unbind_many(bind_ops.bind_many(roles, fillers), roles)
+    assert np.array_equal(back.to_int8(), want)
+
+
+def test_single_role_broadcasts(rand_hv) -> None:
+    rng = np.random.default_rng(2)
+    role, fillers = rand_hv(rng, 4096), rand_hv(rng, 5, 4096)
+    bound = packed.bind(PackedHV.from_int8(role), PackedHV.from_int8(fillers))
+    assert np.array_equal(bound.to_int8(), bind_ops.bind_many(role, fillers))
+
+
+@pytest.mark.parametrize("n", [1, 4, 5])
+def test_majority_vote_matches_int8(n: int, rand_hv) -> None:
+    vecs = rand_hv(np.random.default_rng(3), n, 1000)
+    got = packed.majority_vote(PackedHV.from_int8(vecs)).to_int8()
+    assert np.array_equal(got, bundles.majority_vote(list(vecs)))
+
+
+def test_hamming_and_cosine(rand_hv) -> None:
+    rng = np.random.default_rng(4)
+    a, b = rand_hv(rng, 3, 4096), rand_hv(rng, 3, 4096)
+    pa, pb = PackedHV.from_int8(a), PackedHV.from_int8(b)
+
+    assert np.array_equal(packed.hamming(pa, pb), (a != b).sum(axis=1))
+    cos = (a.astype(np.float32) * b).sum(axis=1) / 4096
+    assert np.allclose(packed.cosine(pa, pb), cos)
+    assert packed.cosine(pa[0], pa[0]) == 1.0
@@ -0,0 +1,105 @@
+"""Unit tests for *kernel.parallel* – chunked, threaded batch operations."""
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from hydraedge.kernel import bind_ops, bundles, jl, parallel
+
+
+@pytest.mark.parametrize("n_threads", [1, 4])
+def test_bind_unbind_match_reference(n_threads: int, rand_hv) -> None:
+    rng = np.random.default_rng(0)
+    role, roles, F = rand_hv(rng, 512), rand_hv(rng, 37, 512), rand_hv(rng, 37, 512)
+
+    out = np.empty_like(F)
+    got = parallel.bind_many(role, F, out=out, n_threads=n_threads, chunk_rows=5)
+    assert got is out
+    assert np.array_equal(got, bind_ops.bind_many(role, F))
+    assert np.array_equal(parallel.bind_many(roles, F, n_threads=n_threads, chunk_rows=5),
+                          bind_ops.bind_many(roles, F))
+    assert np.array_equal(parallel.unbind_many(got, role, n_threads=n_threads, chunk_rows=5), F)
+
+    plan = bind_ops.BindPlan(role)
+    assert np.array_equal(parallel.plan_bind(plan, F, n_threads=n_threads, chunk_rows=5), got)
+
+
+def test_gate_and_vote_match_reference(rand_hv) -> None:
+    rng = np.random.default_rng(1)
+    B, F = rand_hv(rng, 40, 256), rand_hv(rng, 40, 256)
+    gammas = rng.random(40)
+    assert np.array_equal(parallel.gamma_gate_many(B, F, gammas, n_threads=3, chunk_rows=7),
+                          bundles.gamma_gate_many(B, F, gammas))
+    assert np.array_equal(parallel.majority_vote(B, n_threads=3, chunk_rows=7),
+                          bundles.majority_vote(list(B)))
+
+
+def test_float_ops_identical_across_thread_counts(tmp_path, rand_hv) -> None:
+    from hydraedge.kernel.checks import HybridKernel
+
+    rng = np.random.default_rng(2)
+    E = rand_hv(rng, 50, 256)
+    one = parallel.project(E, 64, cache_dir=tmp_path, n_threads=1, chunk_rows=8)
+    many = parallel.project(E, 64, cache_dir=tmp_path, n_threads=4, chunk_rows=8)
+    assert np.array_equal(one, many)
+    np.testing.assert_allclose(one, jl.project(E, dim=64, cache_dir=tmp_path), rtol=1e-5)
+
+    k = HybridKernel(256, role_matrix=rand_hv(rng, 3, 256))
+    k.U_S[:] = rng.normal(size=k.U_S.shape) * 0.01
+    one = parallel.forward_pairs(k, E, E[:20], n_threads=1, chunk_rows=6)
+    many = parallel.forward_pairs(k, E, E[:20], n_threads=4, chunk_rows=6)
+    assert np.array_equal(one, many)
+    np.testing.assert_allclose(one, k.forward_pairs(E, E[:20]), rtol=1e-5)
+
+    factored: list[tuple[str, int]] = []
+    factors = k.factors
+
+    def counting(rows, side, **kw):
+        factored.append((side, len(rows)))
+        return factors(rows, side, **kw)
+
+    k.factors = counting
+    parallel.forward_pairs(k, E, E[:20], n_threads=4, chunk_rows=6)
+    assert [n for side, n in factored if side == "b"] == [20]         # E_b once, up front
+    assert sum(n for side, n in factored if side == "a") == len(E)    # each E_a row once
+
+
+def test_thread_configuration(monkeypatch) -> None:
+    monkeypatch.setenv("HYDRA_KERNEL_THREADS", "3")
+    assert parallel.get_num_threads() == 3
+    with parallel.num_threads(2):
+        assert parallel.get_num_threads() == 2
+    assert parallel.get_num_threads() == 3
+    with pytest.raises(ValueError):
+        parallel.set_num_threads(0)
+    assert parallel.chunk_bounds(5, 2) == [(0, 2), (2, 4), (4, 5)]
+
+
+def test_pools_follow_thread_configuration(monkeypatch, rand_hv) -> None:
+    from hydraedge.index import HammingIndex
+    from hydraedge.kernel.item_memory import ItemMemory
+
+    pools: list[int] = []
+
+    class Spy(parallel.ThreadPoolExecutor):
+        def __init__(self, max_workers=None, **kw):
+            pools.append(max_workers)
+            super().__init__(max_workers=max_workers, **kw)
+
+    monkeypatch.setattr(parallel, "ThreadPoolExecutor", Spy)
+    assert list(parallel.ordered_map(lambda x: x * x, range(20), n_threads=3)) == \
+        [x * x for x in range(20)]
+    assert pools == [3]
+
+    vecs = rand_hv(np.random.default_rng(9), 64, 256)
+    index = HammingIndex(256)
+    index.add(vecs)
+    memory = ItemMemory.from_items((f"f{i}", "filler", v) for i, v in enumerate(vecs))
+    monkeypatch.setenv("HYDRA_KERNEL_THREADS", "1")
+    index.search(vecs[:3], k=2)
+    memory.cleanup(vecs[:3], k=2, chunk_rows=8)
+    assert pools == [3]                                 # ran inline
+    with parallel.num_threads(2):
+        index.search(vecs[:3], k=2)
+        memory.cleanup(vecs[:3], k=2, chunk_rows=8)
+    assert pools[1:] and set(pools[1:]) == {2}